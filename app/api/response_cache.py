@@ -0,0 +1,170 @@
+"""
+HTTP caching for JSON responses that only change with the corpus
+(GET /jobs, POST /recommend-by-skills).
+
+A response body is serialized once per (corpus version, store generation,
+request parameters) and kept in an LRU bounded by RESPONSE_CACHE_MAX_MB,
+together with its gzip and brotli encodings once a client has asked for
+them. Every body gets a strong ETag derived from its bytes (suffixed per
+encoding), so a repeat request carrying If-None-Match is answered with
+304 and no body, and a repeat without it is served pre-serialized and
+pre-compressed. Bodies below RESPONSE_COMPRESS_MIN_BYTES go out as is.
+
+Brotli is used when the `brotli` package is installed and the client
+accepts `br`; gzip otherwise.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from app.core.config import settings
+from app.core.metrics import RESPONSE_CACHE
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+IDENTITY, GZIP, BROTLI = "identity", "gzip", "br"
+
+
+class _Entry:
+    __slots__ = ("tag", "bodies")
+
+    def __init__(self, body: bytes):
+        self.tag = hashlib.sha1(body).hexdigest()[:24]
+        self.bodies: Dict[str, bytes] = {IDENTITY: body}
+
+    @property
+    def size(self) -> int:
+        return sum(len(body) for body in self.bodies.values())
+
+    def etag(self, encoding: str) -> str:
+        return f'"{self.tag}"' if encoding == IDENTITY else f'"{self.tag}-{encoding}"'
+
+
+class ResponseCache:
+    """LRU of serialized response bodies and their encodings, bounded in bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[_Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable, entry: _Entry) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            self._evict()
+
+    def encoded(self, key: Hashable, entry: _Entry, encoding: str) -> bytes:
+        """`entry`'s body in `encoding`, compressed on first use and kept."""
+        body = entry.bodies.get(encoding)
+        if body is not None:
+            return body
+        raw = entry.bodies[IDENTITY]
+        body = brotli.compress(raw, quality=5) if encoding == BROTLI else gzip.compress(raw, compresslevel=6, mtime=0)
+        with self._lock:
+            if encoding not in entry.bodies:
+                entry.bodies[encoding] = body
+                if self._entries.get(key) is entry:
+                    self._bytes += len(body)
+                    self._evict()
+        return body
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+
+
+cache = ResponseCache(int(settings.RESPONSE_CACHE_MAX_MB * 1024 * 1024))
+
+
+def _accepted(header: str) -> List[str]:
+    accepted = []
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.append(name.strip().lower())
+    return accepted
+
+
+def negotiate_encoding(accept_encoding: str, size: int) -> str:
+    """Pick br, gzip or identity for a body of `size` bytes."""
+    if size < settings.RESPONSE_COMPRESS_MIN_BYTES:
+        return IDENTITY
+    accepted = _accepted(accept_encoding or "")
+    if brotli is not None and BROTLI in accepted:
+        return BROTLI
+    if GZIP in accepted or "*" in accepted:
+        return GZIP
+    return IDENTITY
+
+
+def _not_modified(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def _serialize(payload: Any) -> bytes:
+    # Same output as FastAPI's JSONResponse
+    return json.dumps(payload, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def cached_json(request: Request, key: Hashable, build: Callable[[], Any]) -> Response:
+    """
+    JSON response for `key`, built with `build()` only on a cache miss.
+    `key` must cover everything the body depends on (corpus version,
+    store generation, parameters); `build` raises to skip caching.
+    """
+    entry = cache.get(key)
+    if entry is None:
+        entry = _Entry(_serialize(build()))
+        cache.put(key, entry)
+        RESPONSE_CACHE.inc(result="miss")
+    else:
+        RESPONSE_CACHE.inc(result="hit")
+
+    encoding = negotiate_encoding(request.headers.get("accept-encoding", ""), len(entry.bodies[IDENTITY]))
+    headers = {"ETag": entry.etag(encoding), "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+    if _not_modified(request.headers.get("if-none-match"), headers["ETag"]):
+        RESPONSE_CACHE.inc(result="not_modified")
+        return Response(status_code=304, headers=headers)
+    if encoding != IDENTITY:
+        headers["Content-Encoding"] = encoding
+    return Response(cache.encoded(key, entry, encoding), media_type="application/json", headers=headers)
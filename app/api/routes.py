@@ -1,18 +1,27 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Query
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from typing import Optional
 import logging
+from app.api.response_cache import cached_json
+from app.services import warmup
 from app.services.file_service import save_pdf
-from app.services.recommender import recommend_jobs_from_pdf, get_job_recommendations
-from app.db.supabase_db import get_cached_jobs
+
+# The recommender and job store (numpy, corpus) are imported on first use in
+# the handlers, keeping them off the API's import path
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Largest /jobs page; bounds the work and size of one cached response
+JOBS_PAGE_LIMIT = 100
+
 
 # Pydantic models for request/response
 class SkillsRequest(BaseModel):
     skills: list[str]
     top_n: int = 5
+    max_age_hours: Optional[float] = None  # JOB_MAX_AGE_HOURS when omitted, 0 for no limit
 
 
 class RecommendationResponse(BaseModel):
@@ -36,16 +45,39 @@ def health_check():
     return {
         "status": "ok",
         "service": "Job Recommendation API",
-        "version": "1.0.0"
+        "version": "1.0.0",
+        "warmup": warmup.state.status,
     }
 
 
+@router.get("/health/live", tags=["Health"])
+def liveness():
+    """Liveness probe: the process is up and serving, warm or not."""
+    return {"status": "alive"}
+
+
+@router.get("/health/ready", tags=["Health"])
+def readiness(response: Response):
+    """
+    Readiness probe: 200 once startup warm-up (corpus, indexes, extractor)
+    has finished, 503 with its progress until then.
+    """
+    snapshot = warmup.state.snapshot()
+    if not warmup.state.ready:
+        response.status_code = 503
+    return {"ready": warmup.state.ready, "warmup": snapshot}
+
+
 @router.post("/upload-resume", tags=["Resume"])
-async def upload_resume(file: UploadFile = File(..., description="PDF resume file")):
+async def upload_resume(
+    file: UploadFile = File(..., description="PDF resume file"),
+    max_age_hours: Optional[float] = Query(None, ge=0, description="Only jobs scraped this recently (default JOB_MAX_AGE_HOURS, 0 = no limit)"),
+):
     """
     Upload a resume PDF file and get job recommendations.
 
     - **file**: PDF file of the resume (required)
+    - **max_age_hours**: Only recommend jobs scraped this recently
 
     Returns extracted skills and top matching jobs with scores.
     """
@@ -55,15 +87,14 @@ async def upload_resume(file: UploadFile = File(..., description="PDF resume fil
 
         file_path, storage_url = await save_pdf(file)
 
-        print(f"\n{'='*60}")
-        print(f"🔄 Processing resume: {file.filename}")
-        print(f"📂 File path: {file_path}")
-        print(f"{'='*60}\n")
+        from app.services.recommender import recommend_jobs_from_pdf
 
-        result = await recommend_jobs_from_pdf(file_path, top_n=5)
+        logger.info("resume_upload file_name=%s file_path=%s", file.filename, file_path)
+
+        result = await recommend_jobs_from_pdf(file_path, top_n=5, max_age_hours=max_age_hours)
 
         if not result.get("success"):
-            print(f"❌ Processing failed: {result.get('error')}")
+            logger.info("resume_upload_failed file_path=%s error=%s", file_path, result.get("error"))
             raise HTTPException(status_code=400, detail=result.get("error", "Processing failed"))
 
         recommendations = result.get("recommendations", [])
@@ -124,17 +155,24 @@ async def analyze_resume(file: UploadFile = File(..., description="PDF resume fi
 
 
 @router.post("/get-recommendations", tags=["Recommendations"], response_model=RecommendationResponse)
-async def get_recommendations(file: UploadFile = File(..., description="PDF resume file"), top_n: int = 5):
+async def get_recommendations(
+    file: UploadFile = File(..., description="PDF resume file"),
+    top_n: int = 5,
+    max_age_hours: Optional[float] = Query(None, ge=0, description="Only jobs scraped this recently (default JOB_MAX_AGE_HOURS, 0 = no limit)"),
+):
     """
     Upload resume, extract skills, and get job recommendations.
-    Returns top matching jobs with match scores.
+    Returns top matching jobs, scraped within `max_age_hours`, with match scores.
     """
     try:
         if not file.filename.endswith('.pdf'):
             raise HTTPException(status_code=400, detail="Only PDF files are accepted")
 
         file_path, storage_url = await save_pdf(file)
-        result = await recommend_jobs_from_pdf(file_path, top_n=top_n)
+
+        from app.services.recommender import recommend_jobs_from_pdf
+
+        result = await recommend_jobs_from_pdf(file_path, top_n=top_n, max_age_hours=max_age_hours)
 
         if not result.get("success"):
             raise HTTPException(status_code=400, detail=result.get("error", "Unknown error"))
@@ -147,18 +185,37 @@ async def get_recommendations(file: UploadFile = File(..., description="PDF resu
 
 
 @router.post("/recommend-by-skills", tags=["Recommendations"])
-def recommend_by_skills(request: SkillsRequest):
+def recommend_by_skills(request: SkillsRequest, http_request: Request):
     """
     Get job recommendations based on provided skills.
     Useful for testing without uploading a resume.
+
+    The request is a read, so like GET /jobs it carries an ETag and
+    answers a matching If-None-Match with 304 until the corpus changes.
+    Skill lists that differ only in order, case or aliases (k8s, kubernetes)
+    share one cached response, which echoes them as `input_skills` in
+    canonical form.
     """
     try:
-        result = get_job_recommendations(request.skills, top_n=request.top_n)
-
-        if not result.get("success"):
-            raise HTTPException(status_code=400, detail=result.get("error", "Unknown error"))
-
-        return result
+        from app.db.job_store import freshness_cutoff, get_job_store
+        from app.services.matcher import normalize_skill
+        from app.services.recommender import get_job_recommendations
+        from app.services.shared_cache import recommendation_key
+        from app.services.skill_taxonomy import display_name
+
+        skills = [display_name(skill) for skill in sorted(normalize_skill(s) for s in request.skills)]
+
+        def build():
+            result = get_job_recommendations(skills, top_n=request.top_n, max_age_hours=request.max_age_hours)
+            if not result.get("success"):
+                raise HTTPException(status_code=400, detail=result.get("error", "Unknown error"))
+            return result
+
+        store = get_job_store()
+        since = freshness_cutoff(request.max_age_hours)
+        key = ("recommend", recommendation_key(store.version, skills, request.top_n, since,
+                                               getattr(store, "generation", 0)))
+        return cached_json(http_request, key, build)
     except HTTPException:
         raise
     except Exception as e:
@@ -166,23 +223,133 @@ def recommend_by_skills(request: SkillsRequest):
 
 
 @router.get("/jobs", tags=["Jobs"])
-def list_all_jobs(skip: int = 0, limit: int = 10):
+def list_all_jobs(
+    request: Request,
+    skip: int = 0,
+    limit: int = Query(10, description=f"Page size, clamped to {JOBS_PAGE_LIMIT}"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous response's next_cursor"),
+    location: Optional[str] = None,
+    work_type: Optional[str] = None,
+    experience_level: Optional[str] = None,
+    company: Optional[str] = None,
+    position: Optional[str] = None,
+    max_age_hours: Optional[float] = Query(None, ge=0, description="Only jobs scraped this recently (default JOB_MAX_AGE_HOURS, 0 = no limit)"),
+):
     """
-    Get all available jobs from Supabase cache. Supports pagination.
+    Get available jobs from the Supabase cache, newest first.
+
+    Pass `next_cursor` from a response as `cursor` to fetch the next page;
+    `skip` is still honoured when no cursor is given. Filters match
+    case-insensitively on location (full value or any comma-separated
+    part), work_type, experience_level, company and position.
+    Only jobs scraped within `max_age_hours` are listed.
+
+    Pages are served pre-serialized (and pre-compressed) per corpus
+    version with an ETag; send it back as If-None-Match to get a 304.
+    Larger limits are clamped to JOBS_PAGE_LIMIT rather than rejected, and
+    the response reports the limit applied.
     """
+    from app.db.job_store import InvalidCursorError, freshness_cutoff, get_job_store, normalize_value
+
+    limit = max(0, min(limit, JOBS_PAGE_LIMIT))
     try:
-        all_jobs = get_cached_jobs() or []
-        total_count = len(all_jobs)
-        paginated_jobs = all_jobs[skip: skip + limit]
+        store = get_job_store()
+        filters = {
+            "location": location,
+            "work_type": work_type,
+            "experience_level": experience_level,
+            "company": company,
+            "position": position,
+        }
+        since = freshness_cutoff(max_age_hours)
+
+        def build():
+            paginated_jobs, next_cursor = store.page(limit=limit, cursor=cursor, skip=skip, filters=filters, since=since)
+            return {
+                "success": True,
+                "total_jobs": store.count(filters, since=since),
+                "returned_jobs": len(paginated_jobs),
+                "skip": skip,
+                "limit": limit,
+                "next_cursor": next_cursor,
+                "corpus_version": store.version,
+                "jobs": paginated_jobs,
+            }
+
+        key = ("jobs", store.version, getattr(store, "generation", 0), since, limit, skip, cursor,
+               tuple(sorted((f, normalize_value(v)) for f, v in filters.items() if v)))
+        return cached_json(request, key, build)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to retrieve jobs: {str(e)}")
+
+
+@router.get("/jobs/export", tags=["Jobs"])
+def export_jobs(
+    since_version: Optional[str] = Query(None, description="corpus_version already synced; only changes since are sent"),
+    compress: bool = Query(False, description="gzip the stream (Content-Encoding: gzip)"),
+    location: Optional[str] = None,
+    work_type: Optional[str] = None,
+    experience_level: Optional[str] = None,
+    company: Optional[str] = None,
+    position: Optional[str] = None,
+    max_age_hours: float = Query(0, ge=0, description="Only jobs scraped this recently (0 = the whole corpus)"),
+):
+    """
+    Stream the job corpus as NDJSON, one job per line, newest first.
+
+    With `since_version`, only jobs added or updated after that version
+    are sent, followed by `{"url": ..., "deleted": true}` lines for removed
+    jobs; the `X-Export-Mode` header is `incremental`, or `full` when the
+    version is too old to diff against. Pass the `X-Corpus-Version` header
+    as `since_version` on the next sync.
+    """
+    try:
+        from app.db.job_store import freshness_cutoff, get_job_store
+        from app.services.export import export_records, ndjson_chunks
+
+        store = get_job_store()
+        filters = {
+            "location": location,
+            "work_type": work_type,
+            "experience_level": experience_level,
+            "company": company,
+            "position": position,
+        }
+        filters = {f: v for f, v in filters.items() if v}
+        mode, records = export_records(store, filters, freshness_cutoff(max_age_hours), since_version)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
+
+    headers = {"X-Corpus-Version": store.version, "X-Export-Mode": mode}
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(ndjson_chunks(records, mode, compress), media_type="application/x-ndjson", headers=headers)
+
+
+@router.get("/jobs/search", tags=["Jobs"])
+def search_jobs(
+    q: str = Query(..., min_length=1, description="Free-text query over title, company and description"),
+    limit: int = Query(10, ge=1, le=100),
+    max_age_hours: Optional[float] = Query(None, ge=0, description="Only jobs scraped this recently (default JOB_MAX_AGE_HOURS, 0 = no limit)"),
+):
+    """
+    Full-text job search ranked with BM25, over jobs scraped within `max_age_hours`.
+    """
+    try:
+        from app.db.job_store import freshness_cutoff, get_job_store
+
+        store = get_job_store()
+        results = store.search(q, limit=limit, since=freshness_cutoff(max_age_hours))
         return {
             "success": True,
-            "total_jobs": total_count,
-            "returned_jobs": len(paginated_jobs),
-            "skip": skip,
-            "limit": limit,
-            "jobs": paginated_jobs,
+            "query": q,
+            "returned_jobs": len(results),
+            "corpus_version": store.version,
+            "jobs": results,
         }
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve jobs: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
 # Removed public scraping endpoint; scraping now runs via cron/scheduler every 24 hours.
@@ -1,8 +1,21 @@
 import os
 import logging
 from celery import Celery
-from celery.signals import after_setup_logger, after_setup_task_logger
+from kombu import Queue
+from celery.worker.control import control_command
+from celery.signals import (
+    after_setup_logger,
+    after_setup_task_logger,
+    before_task_publish,
+    task_postrun,
+    task_prerun,
+    worker_init,
+)
 from app.core.config import settings
+from app.core.metrics import start_metrics_server
+from app.core import profiling, tracing
+
+logger = logging.getLogger(__name__)
 
 # Celery application configured via environment or defaults
 celery_app = Celery(
@@ -11,6 +24,14 @@ celery_app = Celery(
     backend=settings.CELERY_RESULT_BACKEND,
 )
 
+# Dedicated queues so long scrapes never delay index builds or archiving;
+# the default queue still takes anything unrouted
+DEFAULT_QUEUE = "celery"
+SCRAPE_QUEUE = "scrape"
+INDEX_QUEUE = "index"
+ARCHIVE_QUEUE = "archive"
+ALL_QUEUES = (DEFAULT_QUEUE, SCRAPE_QUEUE, INDEX_QUEUE, ARCHIVE_QUEUE)
+
 celery_app.conf.update(
     task_serializer="json",
     result_serializer="json",
@@ -19,12 +40,39 @@ celery_app.conf.update(
     enable_utc=True,
     worker_log_format="[%(asctime)s: %(levelname)s/%(processName)s] %(message)s",
     worker_task_log_format="[%(asctime)s: %(levelname)s/%(processName)s] [%(task_name)s(%(task_id)s)] %(message)s",
+    task_default_queue=DEFAULT_QUEUE,
+    # A worker started without -Q consumes all of these
+    task_queues=[Queue(name) for name in ALL_QUEUES],
+    task_routes={
+        "app.services.tasks.initial_linkedin_scrape": {"queue": SCRAPE_QUEUE},
+        "app.services.tasks.frontier_scrape": {"queue": SCRAPE_QUEUE},
+        "app.services.tasks.publish_job_index": {"queue": INDEX_QUEUE},
+        "app.services.tasks.archive_job_caches": {"queue": ARCHIVE_QUEUE},
+    },
+    # Every task is idempotent (scrapes dedupe, index builds and archiving
+    # converge), so ack after running: a worker killed mid-task hands the
+    # task to another worker instead of losing it. One message per process
+    # at a time, since a prefetched scrape could wait hours behind another.
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=settings.CELERY_PREFETCH_MULTIPLIER,
+    broker_transport_options={"visibility_timeout": settings.CELERY_VISIBILITY_TIMEOUT},
 )
 
 # Autodiscover tasks in services package
 celery_app.autodiscover_tasks(["app.services"])
 
 
+def enqueue_initial_scrape() -> None:
+    """Send the startup scrape to the workers; logs (never raises) if the broker is down."""
+    try:
+        # By name: the API never imports the task modules (scraper, storage SDK)
+        celery_app.send_task("app.services.tasks.initial_linkedin_scrape")
+        logger.info("Enqueued initial_linkedin_scrape Celery task")
+    except Exception:
+        logger.exception("Failed to enqueue initial_linkedin_scrape")
+
+
 @after_setup_logger.connect
 def setup_loggers(logger, *args, **kwargs):
     """Configure Celery logger to show INFO level messages."""
@@ -51,3 +99,78 @@ def setup_task_logger(logger, *args, **kwargs):
         handler.setFormatter(formatter)
         logger.addHandler(handler)
     logger.setLevel(logging.INFO)
+
+
+@worker_init.connect
+def start_worker_metrics(**kwargs):
+    """Expose scraper metrics from the worker process when WORKER_METRICS_PORT is set."""
+    if settings.WORKER_METRICS_PORT:
+        start_metrics_server(settings.WORKER_METRICS_PORT)
+
+
+# Task spans (and optional profile sessions) by task id, opened in
+# task_prerun and closed in task_postrun
+_task_spans = {}
+_task_profiles = {}
+
+
+@before_task_publish.connect
+def inject_trace_context(headers=None, **kwargs):
+    """Propagate the publisher's trace context in the task message headers."""
+    if headers is not None:
+        tracing.inject(headers)
+
+
+@task_prerun.connect
+def start_task_span(task_id=None, task=None, **kwargs):
+    """Open a consumer span for the task, continuing the publisher's trace."""
+    request = task.request
+    carrier = {tracing.TRACEPARENT_HEADER: getattr(request, tracing.TRACEPARENT_HEADER, None)
+               or (request.headers or {}).get(tracing.TRACEPARENT_HEADER)}
+    span = tracing.start_span(
+        f"celery.task {task.name}",
+        attributes={"celery.task_id": task_id, "celery.task_name": task.name},
+        parent=tracing.extract(carrier),
+        kind="CONSUMER",
+    )
+    _task_spans[task_id] = (span, tracing.activate(span))
+
+    mode = getattr(request, "profile", None) or (request.headers or {}).get("profile")
+    if mode in profiling.PROFILE_MODES:
+        session = profiling.ProfileSession(f"task-{task.name}-{task_id}", mode).start()
+        thread_profile = profiling.begin_thread_profile() if mode == "cprofile" else None
+        _task_profiles[task_id] = (session, profiling.activate_session(session), thread_profile)
+
+
+@task_postrun.connect
+def end_task_span(task_id=None, state=None, **kwargs):
+    profile_entry = _task_profiles.pop(task_id, None)
+    if profile_entry is not None:
+        session, context_token, thread_profile = profile_entry
+        if thread_profile is not None:
+            profiling.end_thread_profile(session, thread_profile)
+        profiling.deactivate_session(context_token)
+        session.finish()
+
+    entry = _task_spans.pop(task_id, None)
+    if entry is None:
+        return
+    span, token = entry
+    span.set_attribute("celery.state", state)
+    if state == "FAILURE":
+        span.record_exception(RuntimeError("task failed"))
+    tracing.deactivate(token)
+    span.end()
+
+
+@control_command(
+    args=[("seconds", float)],
+    signature="[seconds=30]",
+)
+def profile_worker(state, seconds=30.0):
+    """
+    Sample a running worker for a time window:
+    `celery -A app.celery_app control profile_worker seconds=60`
+    """
+    seconds = min(float(seconds), settings.PROFILE_MAX_WINDOW_SECONDS)
+    return {"ok": profiling.start_profile_window(seconds, name="worker")}
@@ -36,6 +36,63 @@ class Settings(BaseModel):
     # Scraper settings
     SCRAPER_TIMEOUT: int = 30
     ENABLE_JOB_SCRAPING: bool = True
+    SCRAPER_BASE_URL: str = os.getenv("SCRAPER_BASE_URL", "https://www.linkedin.com").rstrip("/")
+    SCRAPER_RECORD_DIR: Optional[str] = os.getenv("SCRAPER_RECORD_DIR")  # save fetched HTML as replay fixtures
+    SCRAPER_HTML_PARSER: str = os.getenv("SCRAPER_HTML_PARSER", "auto")  # auto | selectolax | lxml | bs4
+    # none | work_type | experience | grid; work_type tags work types, detail pages give the experience level
+    SCRAPER_FACETS: str = os.getenv("SCRAPER_FACETS", "work_type")
+    SCRAPER_MAX_PAGES: int = int(os.getenv("SCRAPER_MAX_PAGES", "10"))  # search pages per facet
+    SCRAPER_HTTP_CACHE_PATH: str = os.getenv("SCRAPER_HTTP_CACHE_PATH", ".cache/scraper_http.sqlite")
+    SCRAPER_HTTP_CACHE_MAX_MB: int = int(os.getenv("SCRAPER_HTTP_CACHE_MAX_MB", "256"))  # 0 disables the cache
+    SCRAPER_THROTTLE_SCALE: float = float(os.getenv("SCRAPER_THROTTLE_SCALE", "1.0"))  # multiplies politeness sleeps
+
+    # Shared scrape frontier settings (Redis; defaults to the Celery broker)
+    SCRAPER_FRONTIER_WORKERS: int = int(os.getenv("SCRAPER_FRONTIER_WORKERS", "0"))  # 0 = per-task scraping
+    SCRAPER_FRONTIER_REDIS_URL: Optional[str] = os.getenv("SCRAPER_FRONTIER_REDIS_URL")
+    SCRAPER_FRONTIER_NAMESPACE: str = os.getenv("SCRAPER_FRONTIER_NAMESPACE", "scrape_frontier")
+    SCRAPER_FRONTIER_SEEN_TTL_HOURS: float = float(os.getenv("SCRAPER_FRONTIER_SEEN_TTL_HOURS", "168"))
+    SCRAPER_FRONTIER_LEASE_SECONDS: int = int(os.getenv("SCRAPER_FRONTIER_LEASE_SECONDS", "600"))
+    SCRAPER_HOST_RATE_PER_MIN: float = float(os.getenv("SCRAPER_HOST_RATE_PER_MIN", "2"))  # all workers combined; 0 = unlimited
+    SCRAPER_HOST_BURST: float = float(os.getenv("SCRAPER_HOST_BURST", "2"))
+
+    # Job store settings
+    JOB_STORE_REFRESH_SECONDS: int = int(os.getenv("JOB_STORE_REFRESH_SECONDS", "60"))
+    # Apply changed cache files to the loaded store instead of rebuilding it on version changes
+    JOB_STORE_INCREMENTAL: bool = os.getenv("JOB_STORE_INCREMENTAL", "True").lower() == "true"
+    JOB_STORE_COMPACT_SECONDS: int = int(os.getenv("JOB_STORE_COMPACT_SECONDS", "900"))  # 0 = never compact
+    # Default freshness window for listings, search and matching; cache files expire 24h after
+    # their scrape (cache_expires_at), so 48h still covers one missed daily scrape. 0 = no window
+    JOB_MAX_AGE_HOURS: float = float(os.getenv("JOB_MAX_AGE_HOURS", "48"))
+
+    # Serialized /jobs and /recommend-by-skills responses (with ETags and compressed variants)
+    RESPONSE_CACHE_MAX_MB: float = float(os.getenv("RESPONSE_CACHE_MAX_MB", "64"))
+    RESPONSE_COMPRESS_MIN_BYTES: int = int(os.getenv("RESPONSE_COMPRESS_MIN_BYTES", "1024"))
+    # uvicorn workers started by start_api.py; with more than one, its master process
+    # enqueues the startup scrape instead of every worker's startup hook
+    API_WORKERS: int = int(os.getenv("API_WORKERS", "1"))
+    # Map one published index file in every worker instead of loading the corpus per process
+    JOB_INDEX_SHARED: bool = os.getenv("JOB_INDEX_SHARED", "False").lower() == "true"
+    JOB_INDEX_PATH: str = os.getenv("JOB_INDEX_PATH", ".cache/job_index.bin")
+    JOB_INDEX_CHECK_SECONDS: float = float(os.getenv("JOB_INDEX_CHECK_SECONDS", "2"))
+
+    # Redis cache shared by API replicas (corpus, version, recommendations; defaults to the Celery broker)
+    SHARED_CACHE_ENABLED: bool = os.getenv("SHARED_CACHE_ENABLED", "False").lower() == "true"
+    SHARED_CACHE_REDIS_URL: Optional[str] = os.getenv("SHARED_CACHE_REDIS_URL")
+    SHARED_CACHE_NAMESPACE: str = os.getenv("SHARED_CACHE_NAMESPACE", "job_cache")
+    SHARED_CACHE_VERSION_TTL: int = int(os.getenv("SHARED_CACHE_VERSION_TTL", "300"))  # bucket listed once per TTL cluster-wide
+    SHARED_CACHE_CORPUS_TTL: int = int(os.getenv("SHARED_CACHE_CORPUS_TTL", "86400"))
+    SHARED_CACHE_RECO_TTL: int = int(os.getenv("SHARED_CACHE_RECO_TTL", "3600"))
+    SHARED_CACHE_MAX_VALUE_MB: int = int(os.getenv("SHARED_CACHE_MAX_VALUE_MB", "256"))
+    SHARED_CACHE_RETRY_SECONDS: int = int(os.getenv("SHARED_CACHE_RETRY_SECONDS", "30"))
+
+    # Startup warm-up (readiness waits for it)
+    WARMUP_ENABLED: bool = os.getenv("WARMUP_ENABLED", "True").lower() == "true"
+    WARMUP_SYNTHETIC_REQUESTS: int = int(os.getenv("WARMUP_SYNTHETIC_REQUESTS", "3"))
+    WARMUP_RETRY_SECONDS: int = int(os.getenv("WARMUP_RETRY_SECONDS", "30"))
+
+    # Deduplication settings
+    DEDUP_NEAR_DUPLICATES: bool = os.getenv("DEDUP_NEAR_DUPLICATES", "True").lower() == "true"
+    DEDUP_SIMILARITY_THRESHOLD: float = float(os.getenv("DEDUP_SIMILARITY_THRESHOLD", "0.85"))
 
     # Supabase settings
     SUPABASE_URL: Optional[str] = os.getenv("SUPABASE_URL")
@@ -51,6 +108,20 @@ class Settings(BaseModel):
     # Celery settings
     CELERY_BROKER_URL: str = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
     CELERY_RESULT_BACKEND: str = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/0")
+    CELERY_PREFETCH_MULTIPLIER: int = int(os.getenv("CELERY_PREFETCH_MULTIPLIER", "1"))  # tasks run for minutes to hours
+    # Unacked (acks_late) messages are redelivered after this; must exceed the longest task (frontier_scrape: 4h)
+    CELERY_VISIBILITY_TIMEOUT: int = int(os.getenv("CELERY_VISIBILITY_TIMEOUT", str(5 * 3600)))
+
+    # Observability settings
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    TRACING_EXPORTER: str = os.getenv("TRACING_EXPORTER", "none").lower()  # none | stdout | file
+    TRACING_FILE: str = os.getenv("TRACING_FILE", "traces.jsonl")
+    TRACING_SERVICE_NAME: str = os.getenv("TRACING_SERVICE_NAME", "job-scrapper")
+    PROFILING_TOKEN: Optional[str] = os.getenv("PROFILING_TOKEN")  # unset disables on-demand profiling
+    PROFILE_DIR: str = os.getenv("PROFILE_DIR", "profiles")
+    PROFILE_SAMPLE_INTERVAL: float = float(os.getenv("PROFILE_SAMPLE_INTERVAL", "0.005"))
+    PROFILE_MAX_WINDOW_SECONDS: int = int(os.getenv("PROFILE_MAX_WINDOW_SECONDS", "300"))
+    WORKER_METRICS_PORT: Optional[int] = int(os.getenv("WORKER_METRICS_PORT")) if os.getenv("WORKER_METRICS_PORT") else None
 
     class Config:
         arbitrary_types_allowed = True
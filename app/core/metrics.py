@@ -0,0 +1,243 @@
+"""
+Minimal Prometheus metrics - counters, gauges and histograms rendered in the
+text exposition format. Kept dependency-free so every process (API, Celery
+worker, scripts) can import it cheaply.
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextlib import ContextDecorator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self._lock = threading.Lock()
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        with self._lock:
+            lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str):
+        super().__init__(name, documentation)
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(_label_key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        return [f"{self.name}{_format_labels(k)} {v}" for k, v in self._values.items()]
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str):
+        super().__init__(name, documentation)
+        self._values: Dict[LabelKey, float] = {}
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[_label_key(labels)] = float(value)
+
+    def value(self, **labels) -> float:
+        return self._values.get(_label_key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        return [f"{self.name}{_format_labels(k)} {v}" for k, v in self._values.items()]
+
+
+class _Timer(ContextDecorator):
+    def __init__(self, histogram: "Histogram", labels: Dict[str, object]):
+        self._histogram = histogram
+        self._labels = labels
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._histogram.observe(time.perf_counter() - self._started, **self._labels)
+        return False
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation)
+        self.buckets = tuple(sorted(buckets))
+        # label key -> (per-bucket counts, sum, count)
+        self._values: Dict[LabelKey, list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = _label_key(labels)
+        idx = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            if idx < len(self.buckets):
+                entry[0][idx] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def time(self, **labels) -> _Timer:
+        """Time a block or function: `with HIST.time(stage="x"):` or `@HIST.time(stage="x")`."""
+        return _Timer(self, labels)
+
+    def _samples(self) -> List[str]:
+        lines = []
+        for key, (counts, total, count) in self._values.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{_format_labels(key, ('le', repr(bound)))} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(key, ('le', '+Inf'))} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {count}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(m.render() for m in self._metrics.values()) + "\n"
+
+
+REGISTRY = Registry()
+
+# --- Application metrics ---
+
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    "job_api_stage_duration_seconds",
+    "Duration of pipeline stages (upload, storage_download, pdf_parse, skill_extraction, corpus_load, match_scoring)",
+))
+HTTP_REQUEST_SECONDS = REGISTRY.register(Histogram(
+    "job_api_http_request_duration_seconds",
+    "HTTP request duration by method, route and status",
+))
+CORPUS_SIZE = REGISTRY.register(Gauge("job_api_corpus_jobs", "Jobs in the loaded job store"))
+CORPUS_DEDUP_RATIO = REGISTRY.register(Gauge(
+    "job_api_corpus_dedup_ratio", "Fraction of cached jobs dropped as duplicates at the last corpus load",
+))
+WARMUP_READY = REGISTRY.register(Gauge("job_api_warmup_ready", "1 once startup warm-up finished and the replica is ready"))
+CORPUS_FILE_LOADS = REGISTRY.register(Counter(
+    "job_api_corpus_cache_files_total", "Job cache files per corpus load by result (downloaded, unchanged)",
+))
+JOB_STORE_LOOKUPS = REGISTRY.register(Counter(
+    "job_api_job_store_lookups_total", "Job store lookups by result (hit = served from memory, miss = reloaded)",
+))
+JOB_STORE_HIT_RATIO = REGISTRY.register(Gauge(
+    "job_api_job_store_cache_hit_ratio", "Share of job store lookups served without reloading the corpus",
+))
+SHARED_CACHE = REGISTRY.register(Counter(
+    "job_api_shared_cache_total",
+    "Shared Redis cache operations by kind (version, corpus, reco, invalidate) and result",
+))
+RESPONSE_CACHE = REGISTRY.register(Counter(
+    "job_api_response_cache_total", "Cached JSON responses by result (hit, miss, not_modified)",
+))
+JOBS_EXPORTED = REGISTRY.register(Counter(
+    "job_api_exported_records_total", "Records streamed by /jobs/export by mode (full, incremental)",
+))
+SCRAPER_REQUESTS = REGISTRY.register(Counter(
+    "scraper_http_requests_total", "Scraper HTTP requests by kind (search, detail) and status code",
+))
+SCRAPER_THROTTLE_SECONDS = REGISTRY.register(Counter(
+    "scraper_throttle_seconds_total", "Seconds the scraper slept for politeness throttling",
+))
+SCRAPER_THROTTLED = REGISTRY.register(Counter(
+    "scraper_rate_limited_total", "Responses with HTTP 429 received by the scraper",
+))
+SCRAPER_HTTP_CACHE = REGISTRY.register(Counter(
+    "scraper_http_cache_total", "Scraper GETs by cache result (fresh = no request, revalidated = 304, miss)",
+))
+SCRAPER_HTTP_CACHE_BYTES_SAVED = REGISTRY.register(Counter(
+    "scraper_http_cache_bytes_saved_total", "Response body bytes served from the scraper HTTP cache",
+))
+SCRAPER_FRONTIER = REGISTRY.register(Counter(
+    "scraper_frontier_items_total", "Shared scrape frontier items by event (enqueued, already_seen, processed, failed, released)",
+))
+
+
+def record_job_store_lookup(hit: bool) -> None:
+    JOB_STORE_LOOKUPS.inc(result="hit" if hit else "miss")
+    hits = JOB_STORE_LOOKUPS.value(result="hit")
+    total = hits + JOB_STORE_LOOKUPS.value(result="miss")
+    JOB_STORE_HIT_RATIO.set(hits / total if total else 0.0)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = REGISTRY.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE_LATEST)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(port: int, addr: str = "0.0.0.0") -> Optional[ThreadingHTTPServer]:
+    """Serve REGISTRY on a background thread (for processes without an HTTP app, e.g. Celery workers)."""
+    try:
+        server = ThreadingHTTPServer((addr, port), _MetricsHandler)
+    except OSError as e:
+        logger.error(f"Could not start metrics server on port {port}: {e}")
+        return None
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    logger.info(f"Serving metrics on :{port}/metrics")
+    return server
@@ -0,0 +1,221 @@
+"""
+On-demand profiling for live API and worker processes.
+
+Two capture modes:
+- "sample": a background thread snapshots every thread's stack with
+  sys._current_frames() at a fixed interval and writes collapsed stacks
+  (`frame;frame;frame count`, the flamegraph.pl / speedscope input format).
+- "cprofile": functions decorated with @profiled run under cProfile while a
+  profile session is active in their context, and the merged stats are
+  written as a .pstats file (`python -m pstats`, snakeviz).
+
+Sessions are started per request (admin header/query flag), per Celery
+task (message header) or for a time window on a running process.
+"""
+
+import cProfile
+import functools
+import inspect
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextvars import ContextVar
+from typing import List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ("sample", "cprofile")
+
+_active_session: ContextVar[Optional["ProfileSession"]] = ContextVar("profile_session", default=None)
+_thread_state = threading.local()
+
+
+def profiling_authorized(token: Optional[str]) -> bool:
+    """Profiling is only available when PROFILING_TOKEN is set and matches."""
+    return bool(settings.PROFILING_TOKEN) and token == settings.PROFILING_TOKEN
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+class SamplingProfiler:
+    """Collects collapsed stacks of all threads (except its own) every `interval` seconds."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                labels = []
+                while frame is not None:
+                    labels.append(_frame_label(frame))
+                    frame = frame.f_back
+                self.stacks[";".join(reversed(labels))] += 1
+            self.samples += 1
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def write_collapsed(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as fh:
+            for stack, count in self.stacks.most_common():
+                fh.write(f"{stack} {count}\n")
+
+
+class ProfileSession:
+    """One profile capture, written to PROFILE_DIR when finished."""
+
+    def __init__(self, name: str, mode: str = "sample"):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode '{mode}', expected one of {PROFILE_MODES}")
+        self.name = name
+        self.mode = mode
+        self.started_at = time.time()
+        self._profiles: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+        self._sampler = SamplingProfiler(settings.PROFILE_SAMPLE_INTERVAL) if mode == "sample" else None
+
+    @property
+    def path(self) -> str:
+        ext = "collapsed" if self.mode == "sample" else "pstats"
+        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in self.name)
+        return os.path.join(settings.PROFILE_DIR, f"{safe_name}-{int(self.started_at)}-{id(self):x}.{ext}")
+
+    def start(self) -> "ProfileSession":
+        if self._sampler:
+            self._sampler.start()
+        return self
+
+    def add_profile(self, profile: cProfile.Profile) -> None:
+        with self._lock:
+            self._profiles.append(profile)
+
+    def finish(self) -> Optional[str]:
+        """Stop capturing and write the artifact. Returns its path, or None if nothing was captured."""
+        os.makedirs(settings.PROFILE_DIR, exist_ok=True)
+        path = self.path
+        if self._sampler:
+            self._sampler.stop()
+            if not self._sampler.stacks:
+                return None
+            self._sampler.write_collapsed(path)
+        else:
+            with self._lock:
+                profiles = list(self._profiles)
+            if not profiles:
+                return None
+            stats = pstats.Stats(profiles[0])
+            for profile in profiles[1:]:
+                stats.add(profile)
+            stats.dump_stats(path)
+        logger.info(f"Wrote {self.mode} profile for {self.name} to {path}")
+        return path
+
+
+def activate_session(session: ProfileSession):
+    """Make `session` the active profile session for this context; returns a reset token."""
+    return _active_session.set(session)
+
+
+def deactivate_session(token) -> None:
+    _active_session.reset(token)
+
+
+def begin_thread_profile() -> cProfile.Profile:
+    """Start cProfile on the calling thread."""
+    profile = cProfile.Profile()
+    _thread_state.profiling = True
+    profile.enable()
+    return profile
+
+
+def end_thread_profile(session: ProfileSession, profile: cProfile.Profile) -> None:
+    """Stop a profile started by begin_thread_profile and hand it to `session`."""
+    profile.disable()
+    _thread_state.profiling = False
+    session.add_profile(profile)
+
+
+def profiled(func):
+    """
+    Run `func` under cProfile when a "cprofile" session is active in the
+    current context. A no-op (one contextvar lookup) otherwise. Nested
+    @profiled calls in the same thread are covered by the outer profile.
+    For coroutines the profile spans the awaits, so it also sees other
+    tasks interleaved on the event loop during that time.
+    """
+
+    def _should_profile():
+        session = _active_session.get()
+        if session is None or session.mode != "cprofile" or getattr(_thread_state, "profiling", False):
+            return None
+        return session
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            session = _should_profile()
+            if session is None:
+                return await func(*args, **kwargs)
+            profile = begin_thread_profile()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                end_thread_profile(session, profile)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        session = _should_profile()
+        if session is None:
+            return func(*args, **kwargs)
+        profile = begin_thread_profile()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            end_thread_profile(session, profile)
+    return wrapper
+
+
+def start_profile_window(seconds: float, name: str = "window") -> str:
+    """
+    Sample the whole process for `seconds` on a background thread.
+    Returns the artifact path the profile will be written to.
+    """
+    session = ProfileSession(f"{name}-{os.getpid()}", mode="sample").start()
+    path = session.path
+
+    def _finish():
+        time.sleep(seconds)
+        session.finish()
+
+    threading.Thread(target=_finish, name="profile-window", daemon=True).start()
+    logger.info(f"Sampling process {os.getpid()} for {seconds:.0f}s -> {path}")
+    return path
+
+
+def new_session_name(prefix: str) -> str:
+    return f"{prefix}-{uuid.uuid4().hex[:8]}"
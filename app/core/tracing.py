@@ -0,0 +1,222 @@
+"""
+Lightweight request tracing with an OpenTelemetry-compatible data model.
+
+Spans carry W3C trace/span ids and are exported as one JSON object per
+line (shaped like the OTel SDK's console exporter) to stdout or a local
+file, so traces can be inspected or shipped without any outside service.
+Context propagates through contextvars in-process and through the W3C
+`traceparent` header across HTTP and Celery task boundaries.
+"""
+
+import functools
+import inspect
+import json
+import logging
+import os
+import secrets
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Mapping, NamedTuple, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+TRACEPARENT_HEADER = "traceparent"
+
+
+class SpanContext(NamedTuple):
+    trace_id: str
+    span_id: str
+
+
+class Span:
+    """A timed operation. Ended spans are handed to the exporter."""
+
+    def __init__(self, name: str, parent: Optional[SpanContext], kind: str, attributes: Optional[Dict] = None):
+        self.name = name
+        self.kind = kind
+        self.parent_id = parent.span_id if parent else None
+        self.context = SpanContext(parent.trace_id if parent else secrets.token_hex(16), secrets.token_hex(8))
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.status_code = "UNSET"
+        self.status_description = ""
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: Optional[int] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def update_name(self, name: str) -> None:
+        self.name = name
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.status_code = "ERROR"
+        self.status_description = f"{type(exc).__name__}: {exc}"
+        self.attributes["exception.type"] = type(exc).__name__
+
+    def end(self) -> None:
+        if self.end_time_ns is not None:
+            return
+        self.end_time_ns = time.time_ns()
+        if self.status_code == "UNSET":
+            self.status_code = "OK"
+        _exporter.export(self)
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "context": {"trace_id": self.context.trace_id, "span_id": self.context.span_id},
+            "kind": f"SPAN_KIND_{self.kind}",
+            "parent_id": self.parent_id,
+            "start_time_unix_nano": self.start_time_ns,
+            "end_time_unix_nano": self.end_time_ns,
+            "duration_ms": round((self.end_time_ns - self.start_time_ns) / 1e6, 3),
+            "status": {"status_code": self.status_code, "description": self.status_description},
+            "attributes": self.attributes,
+            "resource": {"service.name": settings.TRACING_SERVICE_NAME, "process.pid": os.getpid()},
+        }
+
+
+class _NoopSpan:
+    """Returned when tracing is disabled so call sites need no checks."""
+
+    context = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def update_name(self, name: str) -> None:
+        pass
+
+    def record_exception(self, exc: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class JsonLinesExporter:
+    """Writes finished spans as JSON lines to stdout or an append-only file."""
+
+    def __init__(self, target: str, path: str):
+        self.target = target
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        try:
+            with self._lock:
+                if self.target == "file":
+                    with open(self.path, "a", encoding="utf-8") as fh:
+                        fh.write(line + "\n")
+                else:
+                    sys.stdout.write(line + "\n")
+                    sys.stdout.flush()
+        except Exception as e:
+            logger.debug(f"Span export failed: {e}")
+
+
+_exporter = JsonLinesExporter(settings.TRACING_EXPORTER, settings.TRACING_FILE)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def tracing_enabled() -> bool:
+    return settings.TRACING_EXPORTER in ("stdout", "file")
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def start_span(
+    name: str,
+    attributes: Optional[Dict] = None,
+    parent: Optional[SpanContext] = None,
+    kind: str = "INTERNAL",
+):
+    """
+    Create a span without activating it. The parent defaults to the
+    current span. Call `end()` on the result (or use `trace_span`).
+    """
+    if not tracing_enabled():
+        return NOOP_SPAN
+    if parent is None:
+        active = _current_span.get()
+        parent = active.context if active else None
+    return Span(name, parent, kind, attributes)
+
+
+def activate(span) -> Optional[Token]:
+    """Make `span` current; returns a token for `deactivate`."""
+    return _current_span.set(span) if isinstance(span, Span) else None
+
+
+def deactivate(token: Optional[Token]) -> None:
+    if token is not None:
+        _current_span.reset(token)
+
+
+@contextmanager
+def trace_span(name: str, attributes: Optional[Dict] = None, parent: Optional[SpanContext] = None, kind: str = "INTERNAL"):
+    """Run a block inside a new current span, recording exceptions."""
+    span = start_span(name, attributes, parent, kind)
+    token = activate(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.record_exception(e)
+        raise
+    finally:
+        deactivate(token)
+        span.end()
+
+
+def traced(name: Optional[str] = None):
+    """Decorator wrapping a sync or async function in a span."""
+
+    def decorator(func):
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with trace_span(span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with trace_span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def inject(carrier: Dict[str, str]) -> Dict[str, str]:
+    """Write the current span as a W3C traceparent into `carrier`."""
+    span = _current_span.get()
+    if span is not None:
+        carrier[TRACEPARENT_HEADER] = f"00-{span.context.trace_id}-{span.context.span_id}-01"
+    return carrier
+
+
+def extract(carrier: Optional[Mapping[str, str]]) -> Optional[SpanContext]:
+    """Read a W3C traceparent from `carrier`, or None if absent/invalid."""
+    if not carrier:
+        return None
+    value = carrier.get(TRACEPARENT_HEADER)
+    if not value:
+        return None
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    return SpanContext(parts[1], parts[2])
@@ -0,0 +1,676 @@
+"""
+In-memory job store - versioned, stably ordered view of the cached corpus
+with secondary indexes for filtering and cursor pagination.
+"""
+
+import base64
+import json
+import logging
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.metrics import CORPUS_DEDUP_RATIO, CORPUS_SIZE, STAGE_SECONDS, record_job_store_lookup
+from app.db import supabase_db
+from app.db.supabase_db import get_cached_jobs, get_corpus_version, register_ingest_listener
+from app.services.dedup import canonical_job_url
+from app.services import shared_cache
+from app.services.search_index import SearchIndex
+from app.services.skill_taxonomy import normalize_skill_text, skill_id, vocabulary_size
+
+logger = logging.getLogger(__name__)
+
+# Fields that get a secondary index (request filter name -> job field)
+INDEXED_FIELDS = ("location", "work_type", "experience_level", "company", "position")
+
+SortKey = Tuple[int, str]
+
+# Corpus versions whose changes a store remembers for changes_since
+CHANGELOG_VERSIONS = 32
+
+# Placeholder the scraper writes when a description yields no skills
+NO_SKILLS_PLACEHOLDER = "no skills found"
+
+
+def job_skill_list(job: Dict) -> List[str]:
+    """A job's skills as a list (the scraper stores them comma-separated)."""
+    skills = job.get("skills", [])
+    if isinstance(skills, str):
+        skills = [s.strip() for s in skills.split(",")]
+    return [s for s in skills if s and normalize_skill_text(s) != NO_SKILLS_PLACEHOLDER]
+
+
+def skill_bitset_words() -> int:
+    """Number of uint64 words needed for one row of the skill bitset."""
+    return (vocabulary_size() + 63) // 64
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def normalize_value(value) -> str:
+    """Normalize a field value for index lookups."""
+    return " ".join(str(value or "").lower().split())
+
+
+def _index_values(field: str, value) -> List[str]:
+    """
+    Index terms for a field value. Locations are also indexed per
+    comma-separated part so "San Francisco" matches
+    "San Francisco, California, United States".
+    """
+    norm = normalize_value(value)
+    if not norm:
+        return []
+    if field != "location":
+        return [norm]
+    parts = [p.strip() for p in norm.split(",") if p.strip()]
+    return list(dict.fromkeys([norm] + parts))
+
+
+def job_sort_key(job: Dict) -> SortKey:
+    """
+    Stable ordering key: newest scrape first, ties broken by canonical URL.
+    Depends only on the job itself, so it is identical across corpus
+    versions and API replicas.
+    """
+    try:
+        ts = int(datetime.strptime(job.get("date", ""), "%Y-%m-%d %H:%M:%S").timestamp())
+    except (TypeError, ValueError):
+        ts = 0
+    return (-ts, canonical_job_url(job.get("url", "")) or job.get("title", ""))
+
+
+def freshness_cutoff(max_age_hours: Optional[float] = None) -> Optional[int]:
+    """
+    Oldest scrape timestamp inside a freshness window of `max_age_hours`
+    (JOB_MAX_AGE_HOURS when None; 0 or less means no window). Floored to
+    the hour, so counts and cached results stay reusable within the hour.
+    """
+    if max_age_hours is None:
+        max_age_hours = settings.JOB_MAX_AGE_HOURS
+    if max_age_hours <= 0:
+        return None
+    cutoff = int(time.time() - max_age_hours * 3600)
+    return cutoff - cutoff % 3600
+
+
+def _fresh_bound(since: int) -> Tuple[int]:
+    """Keys sorting before this bound were scraped at or after `since`."""
+    return (1 - since,)
+
+
+def encode_cursor(key: SortKey, version: str) -> str:
+    payload = json.dumps({"k": list(key), "v": version}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> SortKey:
+    """Decode an opaque cursor into the sort key of the last returned job."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        ts, url = payload["k"]
+        return (int(ts), str(url))
+    except Exception as e:
+        raise InvalidCursorError(f"Invalid cursor: {e}")
+
+
+class JobStore:
+    """
+    In-memory snapshot of the corpus for one version.
+
+    Jobs are kept sorted by `job_sort_key`. Each indexed field maps a
+    normalized value to the sorted list of keys of matching jobs, so a
+    page is a bisect plus a slice and never touches the whole corpus.
+    Cursors carry the key of the last job, not an offset, so they stay
+    valid when the corpus version changes underneath a client.
+    A BM25 `SearchIndex` over the same jobs backs full-text search.
+
+    For matching, every job also owns a row ("slot") of `skill_bits`, a
+    uint64 bitset over canonical skill ids. Skills outside the taxonomy
+    are kept per slot in `unknown_skills` for the matcher's fuzzy pass.
+
+    Because keys lead with the negated scrape time, every scrape day is a
+    contiguous partition of the sorted lists and a freshness window
+    (`since`) is a prefix found by binary search: expired partitions are
+    skipped wholesale instead of filtered job by job. Slots and search
+    documents of the initial build are in the same order, so the matcher
+    scores only the fresh prefix of `skill_bits`.
+
+    `apply_delta` folds added, updated and removed jobs in place in time
+    proportional to the delta. Removed jobs are tombstoned: their keys stay
+    in the sorted lists (skipped by reads), their skill row is zeroed and
+    their search document excluded. `compacted` rebuilds without them.
+    The keys each delta touched are kept per corpus version for the last
+    CHANGELOG_VERSIONS versions, so `changes_since` can answer incremental
+    syncs without a full export.
+    """
+
+    def __init__(self, jobs: List[Dict], version: str):
+        self.version = version
+        # Bumped by every in-place change, so compaction can tell whether
+        # the store moved on while it was rebuilding
+        self.generation = 0
+        # Oldest version changes_since can start from, then per later
+        # version the (upserted keys, removed url -> job url) producing it;
+        # changes not yet tied to a version collect in _pending
+        self.base_version = version
+        self._changelog: List[Tuple[str, set, Dict[str, str]]] = []
+        self._pending: Tuple[set, Dict[str, str]] = (set(), {})
+        keyed = sorted(
+            ((job_sort_key(job), job) for job in jobs if isinstance(job, dict)),
+            key=lambda kj: kj[0],
+        )
+        self.keys: List[SortKey] = []
+        self.jobs: Dict[SortKey, Dict] = {}
+        self._key_of_url: Dict[str, SortKey] = {}
+        for key, job in keyed:
+            if key in self.jobs:
+                continue
+            self.keys.append(key)
+            self.jobs[key] = job
+            self._key_of_url[key[1]] = key
+
+        self.indexes: Dict[str, Dict[str, List[SortKey]]] = {field: {} for field in INDEXED_FIELDS}
+        self.search_index = SearchIndex()
+        self.slot_keys: List[SortKey] = []
+        self.skill_bits = np.zeros((max(len(self.keys), 16), skill_bitset_words()), dtype=np.uint64)
+        self.unknown_skills: Dict[int, List[str]] = {}
+        self._slot_of_key: Dict[SortKey, int] = {}
+        self._doc_of_key: Dict[SortKey, int] = {}
+        self._dead: set = set()
+        self._dead_docs: set = set()
+        # key[0] (negated scrape time) per slot and per search document
+        self._slot_sort_ts = array("q")
+        self._doc_sort_ts = array("q")
+        for key in self.keys:
+            job = self.jobs[key]
+            for field in INDEXED_FIELDS:
+                for term in _index_values(field, job.get(field)):
+                    self.indexes[field].setdefault(term, []).append(key)
+            self._doc_of_key[key] = self._add_doc(key, job)
+            self._add_skill_row(key, job)
+        # Slots below this are in sort order; apply_delta appends after it
+        self._sorted_slots = len(self.slot_keys)
+
+        self._count_cache: Dict[Tuple, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.keys) - len(self._dead)
+
+    @property
+    def garbage(self) -> int:
+        """Tombstoned jobs and superseded search documents awaiting compaction."""
+        return len(self._dead) + len(self._dead_docs)
+
+    def _add_skill_row(self, key: SortKey, job: Dict) -> None:
+        slot = len(self.slot_keys)
+        if slot >= self.skill_bits.shape[0]:
+            # Grow into a new array so snapshots held by readers stay valid
+            grown = np.zeros((self.skill_bits.shape[0] * 2, self.skill_bits.shape[1]), dtype=np.uint64)
+            grown[:slot] = self.skill_bits[:slot]
+            self.skill_bits = grown
+        self.slot_keys.append(key)
+        self._slot_sort_ts.append(key[0])
+        self._slot_of_key[key] = slot
+        self._set_skill_row(slot, job)
+
+    def _add_doc(self, key: SortKey, job: Dict) -> int:
+        self._doc_sort_ts.append(key[0])
+        return self.search_index.add(key, job)
+
+    def _set_skill_row(self, slot: int, job: Dict) -> None:
+        self.skill_bits[slot] = 0
+        self.unknown_skills.pop(slot, None)
+        unknown = []
+        for skill in job_skill_list(job):
+            sid = skill_id(skill)
+            if sid is None:
+                unknown.append(normalize_skill_text(skill))
+            else:
+                self.skill_bits[slot, sid >> 6] |= np.uint64(1 << (sid & 63))
+        if unknown:
+            self.unknown_skills[slot] = unknown
+
+    def skill_matrix(self) -> Tuple[np.ndarray, List[SortKey], Dict[int, List[str]]]:
+        """Consistent snapshot of (skill_bits rows, slot keys, unknown skills) for scoring."""
+        with self._lock:
+            n = len(self.slot_keys)
+            return self.skill_bits[:n], self.slot_keys[:n], dict(self.unknown_skills)
+
+    def scoring_rows(self, since: Optional[int] = None) -> Tuple[int, Optional[np.ndarray]]:
+        """
+        skill_bits rows inside a freshness window: score rows [:stop]
+        except those listed in `stale`. Only slots appended by deltas since
+        the last build are checked one by one.
+        """
+        with self._lock:
+            n = len(self.slot_keys)
+            if since is None:
+                return n, None
+            sort_ts = np.frombuffer(self._slot_sort_ts, dtype=np.int64)
+            stop = int(np.searchsorted(sort_ts[:self._sorted_slots], -since, side="right"))
+            if n == self._sorted_slots:
+                return stop, None
+            tail = np.flatnonzero(sort_ts[self._sorted_slots:n] > -since) + self._sorted_slots
+            return n, np.concatenate([np.arange(stop, self._sorted_slots), tail])
+
+    def job_at_slot(self, slot: int) -> Dict:
+        """The job owning a skill_bits row."""
+        return self.jobs[self.slot_keys[slot]]
+
+    def _insert(self, key: SortKey, job: Dict) -> None:
+        if key in self._dead:
+            # Same key came back: reuse its tombstoned slot and index entries
+            self._dead.discard(key)
+            self._replace(key, job)
+            return
+        self.jobs[key] = job
+        self._key_of_url[key[1]] = key
+        insort(self.keys, key)
+        for field in INDEXED_FIELDS:
+            for term in _index_values(field, job.get(field)):
+                insort(self.indexes[field].setdefault(term, []), key)
+        self._doc_of_key[key] = self._add_doc(key, job)
+        self._add_skill_row(key, job)
+
+    def _replace(self, key: SortKey, job: Dict) -> None:
+        """Swap in new content for a key in place (same sort position)."""
+        old = self.jobs[key]
+        for field in INDEXED_FIELDS:
+            old_terms = set(_index_values(field, old.get(field)))
+            new_terms = set(_index_values(field, job.get(field)))
+            for term in old_terms - new_terms:
+                postings = self.indexes[field][term]
+                del postings[bisect_left(postings, key)]
+            for term in new_terms - old_terms:
+                insort(self.indexes[field].setdefault(term, []), key)
+        self._dead_docs.add(self._doc_of_key[key])
+        self._doc_of_key[key] = self._add_doc(key, job)
+        self._set_skill_row(self._slot_of_key[key], job)
+        self.jobs[key] = job
+        self._key_of_url[key[1]] = key
+
+    def _tombstone(self, key: SortKey) -> None:
+        self._pending[1][key[1]] = self.jobs[key].get("url") or key[1]
+        self._dead.add(key)
+        self._dead_docs.add(self._doc_of_key[key])
+        slot = self._slot_of_key[key]
+        self.skill_bits[slot] = 0
+        self.unknown_skills.pop(slot, None)
+        if self._key_of_url.get(key[1]) == key:
+            del self._key_of_url[key[1]]
+
+    def apply_delta(self, upserts: List[Dict], removed_urls: List[str] = (),
+                    version: Optional[str] = None) -> Dict[str, int]:
+        """
+        Apply added, updated and removed jobs in place. Jobs are matched by
+        canonical URL (`removed_urls` may be raw or canonical); a job whose
+        sort key changed is removed and inserted again, an unchanged one is
+        left alone. With `version`, the store moves to that corpus version
+        and the changes so far are logged under it.
+
+        Returns:
+            Counts of added, updated and removed jobs
+        """
+        counts = {"added": 0, "updated": 0, "removed": 0}
+        with self._lock:
+            for url in removed_urls:
+                key = self._key_of_url.get(url) or self._key_of_url.get(canonical_job_url(url))
+                if key is not None:
+                    self._tombstone(key)
+                    counts["removed"] += 1
+            for job in upserts:
+                if not isinstance(job, dict):
+                    continue
+                key = job_sort_key(job)
+                current = self._key_of_url.get(key[1])
+                if current is None:
+                    self._insert(key, job)
+                    counts["added"] += 1
+                elif current != key:
+                    self._tombstone(current)
+                    self._insert(key, job)
+                    counts["updated"] += 1
+                elif self.jobs[key] != job:
+                    self._replace(key, job)
+                    counts["updated"] += 1
+                else:
+                    continue
+                self._pending[0].add(key)
+            if any(counts.values()):
+                self._count_cache.clear()
+                self.generation += 1
+            if version is not None and version != self.version:
+                self._changelog.append((version,) + self._pending)
+                self._pending = (set(), {})
+                if len(self._changelog) > CHANGELOG_VERSIONS:
+                    self.base_version = self._changelog.pop(0)[0]
+                self.version = version
+                self.generation += 1
+        return counts
+
+    def add_jobs(self, jobs: List[Dict]) -> int:
+        """
+        Insert newly ingested jobs without rebuilding the store.
+        Jobs whose key is already present are ignored.
+
+        Returns:
+            Number of jobs added
+        """
+        new = [job for job in jobs if isinstance(job, dict) and job_sort_key(job)[1] not in self._key_of_url]
+        return self.apply_delta(new)["added"] if new else 0
+
+    def compacted(self) -> "JobStore":
+        """A fresh store over the live jobs, without tombstones or superseded documents."""
+        with self._lock:
+            live = [self.jobs[key] for key in self.keys if key not in self._dead]
+            generation = self.generation
+            changelog = (self.base_version, list(self._changelog), (set(self._pending[0]), dict(self._pending[1])))
+        store = JobStore(live, self.version)
+        store.generation = generation
+        store.base_version, store._changelog, store._pending = changelog
+        return store
+
+    def changes_since(
+        self,
+        version: str,
+        filters: Optional[Dict[str, str]] = None,
+        since: Optional[int] = None,
+    ) -> Optional[Tuple[List[Dict], List[str]]]:
+        """
+        Jobs added or updated after corpus `version` and the URLs of jobs
+        removed since, for incremental sync.
+
+        Returns:
+            Tuple of (jobs in sort order matching the filters and window,
+            removed job URLs), or None when `version` is older than the
+            changelog (or unknown) and the caller needs a full export
+        """
+        filters = {f: v for f, v in (filters or {}).items() if v}
+        with self._lock:
+            versions = [self.base_version] + [entry[0] for entry in self._changelog]
+            if version not in versions:
+                return None
+            start = len(versions) - 1 - versions[::-1].index(version)
+            upserted: set = set(self._pending[0])
+            removed: Dict[str, str] = dict(self._pending[1])
+            for _, keys, urls in self._changelog[start:]:
+                upserted |= keys
+                removed.update(urls)
+            bound = _fresh_bound(since) if since is not None else None
+            jobs = [
+                self.jobs[key] for key in sorted(upserted)
+                if key not in self._dead and (bound is None or key < bound) and self._matches(key, filters)
+            ]
+            gone = sorted(url for canonical, url in removed.items() if canonical not in self._key_of_url)
+        return jobs, gone
+
+    def search(self, query: str, limit: int = 10, since: Optional[int] = None) -> List[Dict]:
+        """Full-text search over title, company and description, best match first."""
+        with self._lock:
+            exclude = np.fromiter(self._dead_docs, dtype=np.int64, count=len(self._dead_docs)) if self._dead_docs else None
+            if since is not None:
+                stale = np.flatnonzero(np.frombuffer(self._doc_sort_ts, dtype=np.int64) > -since)
+                exclude = stale if exclude is None else np.concatenate([exclude, stale])
+            hits = self.search_index.search(query, limit=limit, exclude=exclude)
+        results = []
+        for key, score in hits:
+            job = self.jobs[key].copy()
+            job["search_score"] = round(score, 4)
+            results.append(job)
+        return results
+
+    def _postings(self, filters: Dict[str, str]) -> List[List[SortKey]]:
+        return [self.indexes[field].get(normalize_value(value), []) for field, value in filters.items()]
+
+    def _matches(self, key: SortKey, filters: Dict[str, str]) -> bool:
+        job = self.jobs[key]
+        return all(
+            normalize_value(value) in _index_values(field, job.get(field))
+            for field, value in filters.items()
+        )
+
+    def count(self, filters: Optional[Dict[str, str]] = None, since: Optional[int] = None) -> int:
+        """Number of jobs matching all filters (and scraped at or after `since`)."""
+        filters = {f: v for f, v in (filters or {}).items() if v}
+        postings = self._postings(filters) if filters else [self.keys]
+        if len(postings) == 1:
+            posting = postings[0]
+            stop = bisect_left(posting, _fresh_bound(since)) if since is not None else len(posting)
+            bound = posting[stop - 1] if stop else None
+            # Tombstoned keys stay in the postings they matched
+            dead = sum(1 for key in self._dead if bound is not None and key <= bound and self._matches(key, filters))
+            return stop - dead
+        cache_key = (tuple(sorted((f, normalize_value(v)) for f, v in filters.items())), since)
+        if cache_key not in self._count_cache:
+            smallest = min(postings, key=len)
+            stop = bisect_left(smallest, _fresh_bound(since)) if since is not None else len(smallest)
+            if len(self._count_cache) >= 4096:
+                self._count_cache.clear()
+            self._count_cache[cache_key] = sum(
+                1 for key in smallest[:stop] if key not in self._dead and self._matches(key, filters)
+            )
+        return self._count_cache[cache_key]
+
+    def page(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        filters: Optional[Dict[str, str]] = None,
+        since: Optional[int] = None,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Return one page of jobs and the cursor for the next page.
+
+        Args:
+            limit: Page size
+            cursor: Opaque cursor returned by a previous call (takes precedence over skip)
+            skip: Offset for callers that still page by position
+            filters: Field -> value equality filters on INDEXED_FIELDS
+            since: Only jobs scraped at or after this Unix time (see freshness_cutoff)
+
+        Returns:
+            Tuple of (jobs, next_cursor); next_cursor is None on the last page
+        """
+        filters = {f: v for f, v in (filters or {}).items() if v}
+        postings = self._postings(filters) if filters else [self.keys]
+        driver = min(postings, key=len)
+        others_needed = len(postings) > 1
+        dead = self._dead
+
+        start = bisect_right(driver, decode_cursor(cursor)) if cursor else 0
+        stop = bisect_left(driver, _fresh_bound(since)) if since is not None else len(driver)
+        page_keys: List[SortKey] = []
+        to_skip = 0 if cursor else max(skip, 0)
+        if not others_needed and not dead:
+            start += to_skip
+            page_keys = driver[start:min(start + limit + 1, stop)]
+        else:
+            for key in driver[start:stop]:
+                if key in dead or (others_needed and not self._matches(key, filters)):
+                    continue
+                if to_skip:
+                    to_skip -= 1
+                    continue
+                page_keys.append(key)
+                if len(page_keys) > limit:
+                    break
+
+        has_more = len(page_keys) > limit
+        page_keys = page_keys[:limit]
+        next_cursor = encode_cursor(page_keys[-1], self.version) if has_more and page_keys else None
+        return [self.jobs[key] for key in page_keys], next_cursor
+
+
+_store: Optional[JobStore] = None
+_store_checked_at = 0.0
+_store_lock = threading.Lock()
+# supabase_db.corpus_baseline the store was built from (None when its jobs
+# came from the shared cache, so there is no local baseline to continue)
+_store_baseline: Optional[int] = None
+
+
+def current_corpus_version() -> str:
+    """Corpus version through the shared Redis cache (one bucket listing per TTL cluster-wide)."""
+    return shared_cache.corpus_version(get_corpus_version)
+
+
+def load_corpus(version: str) -> List[Dict]:
+    """Jobs for `version`, downloaded from Supabase only if no replica has cached them."""
+    return shared_cache.corpus(version, lambda: get_cached_jobs() or [])
+
+
+def mark_stale(event: Optional[Dict] = None) -> None:
+    """Make the next get_job_store call re-check the corpus version (invalidation hook)."""
+    global _store_checked_at
+    _store_checked_at = 0.0
+
+
+def get_job_store(force_refresh: bool = False) -> JobStore:
+    """
+    Return the current JobStore, rebuilding it when the corpus version
+    changes. The version is re-checked at most every
+    JOB_STORE_REFRESH_SECONDS (or right after a shared cache invalidation),
+    so steady-state calls cost nothing.
+
+    With JOB_INDEX_SHARED the published index file is mapped instead (see
+    app.db.shared_index); the in-process store is only a fallback until
+    the first index has been published.
+    """
+    global _store_checked_at
+
+    if settings.JOB_INDEX_SHARED:
+        from app.db.shared_index import get_mapped_store
+
+        mapped = get_mapped_store(force_refresh)
+        if mapped is not None:
+            record_job_store_lookup(hit=not force_refresh)
+            return mapped
+        if _store is None:
+            logger.warning(f"No shared job index at {settings.JOB_INDEX_PATH} yet, loading the corpus in-process")
+
+    now = time.monotonic()
+    if _store is not None and not force_refresh and now - _store_checked_at < settings.JOB_STORE_REFRESH_SECONDS:
+        record_job_store_lookup(hit=True)
+        return _store
+
+    with _store_lock:
+        if _store is not None and not force_refresh and now - _store_checked_at < settings.JOB_STORE_REFRESH_SECONDS:
+            record_job_store_lookup(hit=True)
+            return _store
+        version = current_corpus_version()
+        reload = _store is None or force_refresh or version != _store.version
+        record_job_store_lookup(hit=not reload)
+        if reload and not force_refresh and _store is not None and _apply_corpus_delta(version):
+            reload = False
+        if reload:
+            _reload_store(version)
+        _store_checked_at = time.monotonic()
+        return _store
+
+
+def _reload_store(version: str) -> None:
+    global _store, _store_baseline
+    started = time.perf_counter()
+    baseline = supabase_db.corpus_baseline
+    with STAGE_SECONDS.time(stage="corpus_load"):
+        _store = JobStore(load_corpus(version), version)
+    _store_baseline = supabase_db.corpus_baseline if supabase_db.corpus_baseline != baseline else None
+    CORPUS_SIZE.set(len(_store))
+    if supabase_db.last_dedup_stats is not None:
+        CORPUS_DEDUP_RATIO.set(supabase_db.last_dedup_stats.dedup_ratio)
+    logger.info(
+        f"Loaded job store version {version}: {len(_store)} jobs "
+        f"in {time.perf_counter() - started:.2f}s"
+    )
+
+
+def _apply_corpus_delta(version: str) -> bool:
+    """
+    Bring the store to `version` by applying only the changed cache files.
+    False when the store has no baseline to continue from or the delta
+    cannot be computed, and the caller should reload.
+    """
+    global _store_baseline
+    if not settings.JOB_STORE_INCREMENTAL or _store_baseline is None:
+        return False
+    started = time.perf_counter()
+    with STAGE_SECONDS.time(stage="corpus_delta"):
+        delta = supabase_db.get_corpus_delta(_store_baseline)
+        if delta is None:
+            return False
+        counts = _store.apply_delta(delta.upserts, delta.removed, version=version)
+    _store_baseline = delta.baseline
+    CORPUS_SIZE.set(len(_store))
+    logger.info(
+        f"Updated job store to version {version} from {delta.files_changed} changed files: "
+        f"{counts['added']} added, {counts['updated']} updated, {counts['removed']} removed "
+        f"in {time.perf_counter() - started:.2f}s"
+    )
+    return True
+
+
+def compact_job_store(min_garbage: int = 1) -> bool:
+    """
+    Rebuild the loaded store without tombstones and superseded search
+    documents. The rebuild runs outside the store lock and is only swapped
+    in if no delta landed meanwhile (otherwise it is retried next time).
+
+    Returns:
+        True if a compacted store was swapped in
+    """
+    global _store
+    store = _store
+    if store is None or store.garbage < min_garbage:
+        return False
+    started = time.perf_counter()
+    with STAGE_SECONDS.time(stage="job_store_compact"):
+        compacted = store.compacted()
+    with _store_lock, store._lock:
+        if _store is not store or store.generation != compacted.generation:
+            logger.info("Job store changed during compaction, retrying later")
+            return False
+        _store = compacted
+    logger.info(
+        f"Compacted job store {store.version}: dropped {store.garbage} dead entries "
+        f"in {time.perf_counter() - started:.2f}s"
+    )
+    return True
+
+
+def _compactor_loop(interval: float) -> None:
+    while True:
+        time.sleep(interval)
+        try:
+            compact_job_store()
+        except Exception as e:
+            logger.error(f"Job store compaction failed: {e}")
+
+
+def start_compactor() -> None:
+    """Compact the store every JOB_STORE_COMPACT_SECONDS from a daemon thread (0 disables)."""
+    interval = settings.JOB_STORE_COMPACT_SECONDS
+    if interval > 0:
+        threading.Thread(target=_compactor_loop, args=(interval,), name="job-store-compactor", daemon=True).start()
+
+
+def _on_jobs_ingested(jobs: List[Dict]) -> None:
+    """Fold jobs saved by this process into the loaded store, if any."""
+    if _store is not None:
+        counts = _store.apply_delta(jobs)
+        CORPUS_SIZE.set(len(_store))
+        logger.debug(f"Ingested {counts['added']} new and {counts['updated']} updated jobs into job store {_store.version}")
+
+
+register_ingest_listener(_on_jobs_ingested)
@@ -0,0 +1,400 @@
+"""
+Shared job index - the JobStore flattened into one file that every API
+worker process maps read-only, so N uvicorn workers hold one copy of the
+corpus instead of N.
+
+The file is built once per corpus version (by the start_api.py master, or
+`python -m app.db.shared_index` from the scrape pipeline) and published
+with an atomic rename. Workers notice the new inode on their next check and
+remap; requests already running keep reading the old mapping, which stays
+valid until its last reference is dropped.
+
+Layout: an 8-byte magic, a little-endian uint64 header length, a JSON
+header, then 64-byte aligned arrays. Rows are jobs in `job_sort_key`
+order; the row number doubles as skill bitset slot and BM25 doc id.
+
+- jobs:     JSON per job (job_data) addressed by job_offsets
+- sort key: sort_ts (int64) plus canonical URLs (url_data / url_offsets)
+- filters:  filter_rows (int32 row ids) sliced by the filter_terms spans
+- skills:   skill_bits (uint64, rows x words), unknown_skills JSON
+- search:   flattened BM25 postings (see FlatSearchIndex)
+"""
+
+import argparse
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from bisect import bisect_right
+from functools import reduce
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.metrics import CORPUS_SIZE, STAGE_SECONDS
+from app.db.job_store import (
+    INDEXED_FIELDS,
+    JobStore,
+    SortKey,
+    decode_cursor,
+    encode_cursor,
+    normalize_value,
+)
+from app.services.search_index import FlatSearchIndex
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"JOBIDX01"
+ALIGN = 64
+_PREFIX = struct.Struct("<8sQ")
+
+
+def _json_bytes(value) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _blob(parts: List[bytes]) -> Tuple[np.ndarray, np.ndarray]:
+    """Concatenate byte strings into (uint8 data, uint64 offsets with a trailing end)."""
+    offsets = np.zeros(len(parts) + 1, dtype=np.uint64)
+    if parts:
+        offsets[1:] = np.cumsum([len(p) for p in parts], dtype=np.uint64)
+    return np.frombuffer(b"".join(parts), dtype=np.uint8), offsets
+
+
+def _flatten(store: JobStore) -> Tuple[Dict, Dict[str, np.ndarray]]:
+    """Header metadata and named arrays for a freshly built store."""
+    if store.garbage or store.slot_keys != store.keys:
+        # Jobs added after construction sit in slots out of sort order
+        store = store.compacted()
+    n = len(store)
+
+    arrays: Dict[str, np.ndarray] = {}
+    arrays["job_data"], arrays["job_offsets"] = _blob([_json_bytes(store.jobs[key]) for key in store.keys])
+    arrays["sort_ts"] = np.array([key[0] for key in store.keys], dtype=np.int64)
+    arrays["url_data"], arrays["url_offsets"] = _blob([key[1].encode("utf-8") for key in store.keys])
+    arrays["skill_bits"] = np.ascontiguousarray(store.skill_bits[:n])
+
+    row_of = {key: row for row, key in enumerate(store.keys)}
+    filter_terms: Dict[str, Dict[str, Tuple[int, int]]] = {}
+    rows: List[int] = []
+    for field in INDEXED_FIELDS:
+        spans = filter_terms[field] = {}
+        for term, keys in store.indexes[field].items():
+            spans[term] = (len(rows), len(rows) + len(keys))
+            rows.extend(row_of[key] for key in keys)
+    arrays["filter_rows"] = np.array(rows, dtype=np.int32)
+    arrays["filter_terms"] = np.frombuffer(_json_bytes(filter_terms), dtype=np.uint8)
+    arrays["unknown_skills"] = np.frombuffer(_json_bytes(store.unknown_skills), dtype=np.uint8)
+
+    spans, ids, tfs, doc_len, total_len = store.search_index.flatten()
+    arrays["search_ids"], arrays["search_tfs"], arrays["search_doc_len"] = ids, tfs, doc_len
+    arrays["search_terms"] = np.frombuffer(_json_bytes(spans), dtype=np.uint8)
+
+    header = {"version": store.version, "jobs": n, "search_total_len": total_len, "built_at": time.time()}
+    return header, arrays
+
+
+def write_index(store: JobStore, path: str) -> int:
+    """
+    Write `store` to `path` atomically: a temp file in the same directory
+    is fsynced and renamed over `path`, so readers see either the old file
+    or the complete new one.
+
+    Returns:
+        Size of the file in bytes
+    """
+    header, arrays = _flatten(store)
+    # Offsets depend on the header length, which depends on the offsets;
+    # reserve room for the largest plausible offset digits up front
+    layout = {name: [arr.dtype.str, list(arr.shape), 0] for name, arr in arrays.items()}
+    header["arrays"] = layout
+    body_start = _PREFIX.size + len(_json_bytes(header)) + 32 * len(layout)
+    offset = -(-body_start // ALIGN) * ALIGN
+    for name, arr in arrays.items():
+        layout[name][2] = offset
+        offset = -(-(offset + arr.nbytes) // ALIGN) * ALIGN
+    header_bytes = _json_bytes(header)
+    assert _PREFIX.size + len(header_bytes) <= body_start, "job index header outgrew its reserved space"
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_PREFIX.pack(MAGIC, len(header_bytes)))
+            f.write(header_bytes)
+            for name, arr in arrays.items():
+                f.seek(layout[name][2])
+                f.write(arr.tobytes())
+            f.truncate(offset)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return offset
+
+
+def read_header(path: str) -> Optional[Dict]:
+    """The header of the index at `path`, or None if it is missing or unreadable."""
+    try:
+        with open(path, "rb") as f:
+            magic, length = _PREFIX.unpack(f.read(_PREFIX.size))
+            if magic != MAGIC:
+                return None
+            return json.loads(f.read(length))
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+def _file_identity(st: os.stat_result) -> Tuple[int, int, int, int]:
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class MappedJobStore:
+    """
+    Read-only JobStore backed by a memory-mapped index file.
+
+    Exposes the same `page`, `count`, `search`, `skill_matrix` and
+    `scoring_rows` API.
+    Arrays are zero-copy views into the mapping; jobs are decoded from
+    JSON only when returned. Multi-filter queries intersect row id
+    postings instead of inspecting each candidate job.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self.identity = _file_identity(os.fstat(f.fileno()))
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, length = _PREFIX.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a job index")
+        header = json.loads(self._mm[_PREFIX.size:_PREFIX.size + length])
+        self.path = path
+        self.version: str = header["version"]
+        self._n: int = header["jobs"]
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._offsets: Dict[str, int] = {}
+        for name, (dtype, shape, offset) in header["arrays"].items():
+            count = int(np.prod(shape)) if shape else 0
+            self._arrays[name] = np.frombuffer(self._mm, dtype=dtype, count=count, offset=offset).reshape(shape)
+            self._offsets[name] = offset
+
+        a = self._arrays
+        self._job_offsets, self._url_offsets, self._sort_ts = a["job_offsets"], a["url_offsets"], a["sort_ts"]
+        self._filter_rows = a["filter_rows"]
+        self._filter_terms: Dict[str, Dict[str, List[int]]] = json.loads(a["filter_terms"].tobytes())
+        self._unknown_skills = {int(slot): skills for slot, skills in json.loads(a["unknown_skills"].tobytes()).items()}
+        self.search_index = FlatSearchIndex(
+            json.loads(a["search_terms"].tobytes()), a["search_ids"], a["search_tfs"],
+            a["search_doc_len"], header["search_total_len"],
+        )
+        self._count_cache: Dict[Tuple, int] = {}
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._mm)
+
+    def _bytes(self, name: str, offsets: np.ndarray, row: int) -> bytes:
+        base = self._offsets[name]
+        return self._mm[base + int(offsets[row]):base + int(offsets[row + 1])]
+
+    def job_at_slot(self, slot: int) -> Dict:
+        """Decode the job in one row (rows and skill slots coincide)."""
+        return json.loads(self._bytes("job_data", self._job_offsets, slot))
+
+    def _key(self, row) -> SortKey:
+        return (int(self._sort_ts[row]), self._bytes("url_data", self._url_offsets, row).decode("utf-8"))
+
+    def skill_matrix(self) -> Tuple[np.ndarray, range, Dict[int, List[str]]]:
+        """(skill_bits rows, slots, unknown skills) for scoring; slots are row numbers."""
+        return self._arrays["skill_bits"], range(self._n), self._unknown_skills
+
+    def _fresh_rows(self, since: Optional[int]) -> int:
+        """Rows are in sort order, so a freshness window is the prefix [:stop]."""
+        if since is None:
+            return self._n
+        return int(np.searchsorted(self._sort_ts, -since, side="right"))
+
+    def scoring_rows(self, since: Optional[int] = None) -> Tuple[int, Optional[np.ndarray]]:
+        """skill_bits rows inside a freshness window (see JobStore.scoring_rows)."""
+        return self._fresh_rows(since), None
+
+    def changes_since(self, version: str, filters: Optional[Dict[str, str]] = None,
+                      since: Optional[int] = None) -> Optional[Tuple[List[Dict], List[str]]]:
+        """No changelog in the file: nothing changed if `version` is this one, else None (full export)."""
+        return ([], []) if version == self.version else None
+
+    def add_jobs(self, jobs: List[Dict]) -> int:
+        """The mapping is read-only; new jobs arrive with the next published index."""
+        return 0
+
+    def search(self, query: str, limit: int = 10, since: Optional[int] = None) -> List[Dict]:
+        """Full-text search over title, company and description, best match first."""
+        stop = self._fresh_rows(since)
+        # Search documents are numbered by row
+        exclude = np.arange(stop, self._n) if stop < self._n else None
+        results = []
+        for row, score in self.search_index.search(query, limit=limit, exclude=exclude):
+            job = self.job_at_slot(row)
+            job["search_score"] = round(score, 4)
+            results.append(job)
+        return results
+
+    def _rows(self, filters: Dict[str, str], since: Optional[int] = None):
+        """Sorted row ids matching all filters (a range for no filters), cut to the freshness window."""
+        stop = self._fresh_rows(since)
+        if not filters:
+            return range(stop)
+        postings = []
+        for field, value in filters.items():
+            span = self._filter_terms[field].get(normalize_value(value))
+            posting = self._filter_rows[span[0]:span[1]] if span else self._filter_rows[:0]
+            postings.append(posting[:np.searchsorted(posting, stop)])
+        postings.sort(key=len)
+        return reduce(lambda a, b: np.intersect1d(a, b, assume_unique=True), postings)
+
+    def count(self, filters: Optional[Dict[str, str]] = None, since: Optional[int] = None) -> int:
+        """Number of jobs matching all filters (and scraped at or after `since`)."""
+        filters = {f: v for f, v in (filters or {}).items() if v}
+        if len(filters) <= 1:
+            return len(self._rows(filters, since))
+        cache_key = (tuple(sorted((f, normalize_value(v)) for f, v in filters.items())), since)
+        if cache_key not in self._count_cache:
+            if len(self._count_cache) >= 4096:
+                self._count_cache.clear()
+            self._count_cache[cache_key] = len(self._rows(filters, since))
+        return self._count_cache[cache_key]
+
+    def page(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        filters: Optional[Dict[str, str]] = None,
+        since: Optional[int] = None,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """Return one page of jobs and the cursor for the next page (see JobStore.page)."""
+        filters = {f: v for f, v in (filters or {}).items() if v}
+        rows = self._rows(filters, since)
+        start = bisect_right(rows, decode_cursor(cursor), key=self._key) if cursor else max(skip, 0)
+        page_rows = rows[start:start + limit + 1]
+
+        has_more = len(page_rows) > limit
+        page_rows = page_rows[:limit]
+        next_cursor = encode_cursor(self._key(page_rows[-1]), self.version) if has_more and len(page_rows) else None
+        return [self.job_at_slot(row) for row in page_rows], next_cursor
+
+
+def publish_job_index(path: Optional[str] = None, force: bool = False) -> bool:
+    """
+    Build and publish the index for the current corpus version unless the
+    file at `path` already holds it. An "empty" version (the cache bucket
+    could not be listed) never replaces an existing index.
+
+    Returns:
+        True if a new index was written
+    """
+    from app.db.job_store import current_corpus_version, load_corpus
+
+    path = path or settings.JOB_INDEX_PATH
+    version = current_corpus_version()
+    header = read_header(path)
+    if header is not None and not force and (header["version"] == version or version == "empty"):
+        return False
+
+    started = time.perf_counter()
+    with STAGE_SECONDS.time(stage="job_index_publish"):
+        store = JobStore(load_corpus(version), version)
+        size = write_index(store, path)
+    logger.info(
+        f"Published job index version {version} to {path}: {len(store)} jobs, "
+        f"{size / 1e6:.1f} MB in {time.perf_counter() - started:.2f}s"
+    )
+    return True
+
+
+_publish_now = threading.Event()
+
+
+def _publisher_loop(interval: float, path: Optional[str]) -> None:
+    while True:
+        _publish_now.wait(interval)
+        _publish_now.clear()
+        try:
+            publish_job_index(path)
+        except Exception as e:
+            logger.error(f"Job index publish failed: {e}")
+
+
+def start_index_publisher(interval: Optional[float] = None, path: Optional[str] = None) -> None:
+    """
+    Republish the index on corpus version changes from a daemon thread,
+    checked every `interval` seconds and on shared cache invalidations.
+    """
+    from app.services.shared_cache import start_invalidation_listener
+
+    interval = interval or settings.JOB_STORE_REFRESH_SECONDS
+    threading.Thread(target=_publisher_loop, args=(interval, path), name="job-index-publisher", daemon=True).start()
+    start_invalidation_listener(lambda event: _publish_now.set())
+
+
+_mapped: Optional[MappedJobStore] = None
+_mapped_checked_at = 0.0
+_mapped_lock = threading.Lock()
+
+
+def get_mapped_store(force_refresh: bool = False) -> Optional[MappedJobStore]:
+    """
+    Return the mapped store for JOB_INDEX_PATH, remapping when a new file
+    has been published. The file is stat'ed at most every
+    JOB_INDEX_CHECK_SECONDS. None if no index has been published yet.
+    """
+    global _mapped, _mapped_checked_at
+
+    now = time.monotonic()
+    if _mapped is not None and not force_refresh and now - _mapped_checked_at < settings.JOB_INDEX_CHECK_SECONDS:
+        return _mapped
+
+    with _mapped_lock:
+        if _mapped is not None and not force_refresh and now - _mapped_checked_at < settings.JOB_INDEX_CHECK_SECONDS:
+            return _mapped
+        _mapped_checked_at = time.monotonic()
+        try:
+            identity = _file_identity(os.stat(settings.JOB_INDEX_PATH))
+        except FileNotFoundError:
+            return _mapped
+        if _mapped is None or identity != _mapped.identity:
+            try:
+                mapped = MappedJobStore(settings.JOB_INDEX_PATH)
+            except (OSError, ValueError) as e:
+                logger.error(f"Could not map job index {settings.JOB_INDEX_PATH}: {e}")
+                return _mapped
+            previous = _mapped.version if _mapped is not None else None
+            _mapped = mapped
+            CORPUS_SIZE.set(len(mapped))
+            logger.info(f"Mapped job index version {mapped.version} ({len(mapped)} jobs), previous {previous}")
+        return _mapped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and publish the shared job index.")
+    parser.add_argument("--path", default=settings.JOB_INDEX_PATH)
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the version is unchanged")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    published = publish_job_index(args.path, force=args.force)
+    logger.info(f"{'Published' if published else 'Up to date'}: {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,18 @@
 Supabase Jobs Database - Stores and retrieves jobs from Supabase storage
 """
 
+import hashlib
 import json
 import logging
 import os
+import uuid
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict
+from dataclasses import dataclass, field
+from typing import Callable, List, Dict, Optional, Tuple
+
+from app.core.metrics import CORPUS_FILE_LOADS
+from app.core.tracing import traced
+from app.services.dedup import DedupStats, JobDeduplicator, canonical_job_url, dedupe_jobs
 
 logger = logging.getLogger(__name__)
 
@@ -14,14 +21,98 @@ logger = logging.getLogger(__name__)
 JOBS_BUCKET = os.getenv("SUPABASE_JOBS_BUCKET", "job-data")
 CACHE_DURATION_HOURS = 24
 ARCHIVE_AGE_DAYS = 7
+# Small object rewritten on every change to jobs/cache, so readers can tell
+# whether anything changed with one tiny download instead of a listing
+MANIFEST_PATH = "jobs/manifest.json"
 
 logger.info(f"Using jobs bucket: {JOBS_BUCKET}")
 
+# Stats of the most recent corpus-load dedup pass (None until the first load)
+last_dedup_stats: Optional[DedupStats] = None
+
+# Callbacks notified with the jobs of every successful save_jobs call
+_ingest_listeners: List[Callable[[List[Dict]], None]] = []
+
+# Jobs per cache file from the last aggregate load, keyed by file name with
+# the file's updated_at; unchanged files are not downloaded again
+_file_cache: Dict[str, Tuple[str, List[Dict]]] = {}
+
+# State of the last aggregate load that get_corpus_delta continues from:
+# the deduplicator that produced it and the file each live URL came from.
+# corpus_baseline is bumped by every aggregate load and every delta, so a
+# delta is only applied on top of the exact corpus it was computed against.
+corpus_baseline = 0
+_dedup: Optional[JobDeduplicator] = None
+_url_owner: Dict[str, str] = {}
+
+
+@dataclass
+class CorpusDelta:
+    """Changes to the aggregate corpus since `baseline - 1`."""
+    baseline: int
+    upserts: List[Dict] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    files_changed: int = 0
+
+
+def register_ingest_listener(listener: Callable[[List[Dict]], None]) -> None:
+    """Register a callback that receives jobs after save_jobs stores them."""
+    _ingest_listeners.append(listener)
+
+
+def _notify_ingest(jobs: List[Dict]) -> None:
+    for listener in _ingest_listeners:
+        try:
+            listener(jobs)
+        except Exception as e:
+            logger.error(f"Ingest listener failed: {e}")
+
+
+def _bump_manifest(client, reason: str) -> Optional[str]:
+    """
+    Write a new random version to the manifest. Concurrent writers may
+    overwrite each other, which is fine: any write changes the version.
+    """
+    version = uuid.uuid4().hex[:16]
+    manifest = {"version": version, "updated_at": datetime.now(timezone.utc).isoformat(), "reason": reason}
+    try:
+        client.storage.from_(JOBS_BUCKET).upload(
+            MANIFEST_PATH,
+            json.dumps(manifest).encode("utf-8"),
+            {"contentType": "application/json", "upsert": "true", "cacheControl": "0"},
+        )
+        return version
+    except Exception as e:
+        logger.error(f"Could not update {MANIFEST_PATH}: {e}")
+        return None
+
+
+def read_manifest() -> Optional[Dict]:
+    """The corpus manifest, or None if storage is unavailable or no writer created it yet."""
+    client = _get_supabase_client()
+    if not client:
+        return None
+    try:
+        content = client.storage.from_(JOBS_BUCKET).download(MANIFEST_PATH)
+        manifest = json.loads(content.decode("utf-8")) if isinstance(content, (bytes, bytearray)) else json.loads(content)
+        return manifest if isinstance(manifest, dict) and manifest.get("version") else None
+    except Exception:
+        return None
+
+
+def _notify_corpus_changed(client, reason: str) -> None:
+    """Bump the manifest and tell API replicas (through the shared cache) that the cache files changed."""
+    from app.services.shared_cache import invalidate_corpus
+
+    _bump_manifest(client, reason)
+    invalidate_corpus(reason)
+
 
 def _get_supabase_client():
     """Get Supabase client from the shared storage service"""
     try:
-        from app.services.supabase_storage import supabase_storage
+        from app.services.supabase_storage import get_supabase_storage
+        supabase_storage = get_supabase_storage()
         if supabase_storage and supabase_storage.client:
             return supabase_storage.client
     except Exception:
@@ -61,6 +152,8 @@ def save_jobs(jobs: List[Dict], position: str, location: str) -> bool:
     cache_key = f"jobs_{position.lower().replace(' ', '_')}_{location.lower().replace(' ', '_')}"
     file_path = f"jobs/cache/{cache_key}.json"
 
+    jobs, _ = dedupe_jobs(jobs, label=f"ingest {cache_key}")
+
     data = {
         "position": position,
         "location": location,
@@ -88,6 +181,8 @@ def save_jobs(jobs: List[Dict], position: str, location: str) -> bool:
         # Treat None or empty dict as success (client libraries differ)
         if not response or (isinstance(response, dict) and not response.get("error")):
             logger.info(f"✓ Saved {len(jobs)} jobs to Supabase at {file_path}")
+            _notify_ingest(jobs)
+            _notify_corpus_changed(client, f"save_jobs {cache_key}")
             return True
 
         if hasattr(response, "error") and response.error:
@@ -95,6 +190,8 @@ def save_jobs(jobs: List[Dict], position: str, location: str) -> bool:
             return False
 
         logger.info(f"✓ Saved {len(jobs)} jobs to Supabase at {file_path}")
+        _notify_ingest(jobs)
+        _notify_corpus_changed(client, f"save_jobs {cache_key}")
         return True
 
     except Exception as e:
@@ -104,12 +201,77 @@ def save_jobs(jobs: List[Dict], position: str, location: str) -> bool:
         return False
 
 
+def merge_jobs(jobs: List[Dict], position: str, location: str) -> bool:
+    """
+    Add newly scraped jobs to the (position, location) cache file instead of
+    replacing it: new jobs go first and win over older copies of the same
+    posting, and the jobs already cached are kept behind them. Cached jobs
+    scraped more than ARCHIVE_AGE_DAYS ago are dropped, since the merge
+    renews the file's scraped_at and archive_old_caches would never retire
+    them. Nothing is written when `jobs` is empty.
+    """
+    if not jobs:
+        return True
+
+    client = _get_supabase_client()
+    if not client:
+        logger.error("Supabase not initialized")
+        return False
+
+    cache_key = f"jobs_{position.lower().replace(' ', '_')}_{location.lower().replace(' ', '_')}"
+    try:
+        existing = _download_jobs(client, f"{cache_key}.json")
+    except Exception as e:
+        # A missing file is a first scrape; an unreadable one must not be overwritten
+        try:
+            entries = client.storage.from_(JOBS_BUCKET).list("jobs/cache") or []
+        except Exception as list_error:
+            logger.error(f"Cannot merge into {cache_key}.json: {list_error}")
+            return False
+        if any(_entry_name(entry) == f"{cache_key}.json" for entry in entries):
+            logger.error(f"Cannot read {cache_key}.json to merge into, not saving: {e}")
+            return False
+        existing = []
+
+    kept = [job for job in existing if not _job_expired(job)]
+    logger.info(
+        f"Merging {len(jobs)} new jobs into {len(kept)} cached for {cache_key} "
+        f"({len(existing) - len(kept)} older than {ARCHIVE_AGE_DAYS} days dropped)"
+    )
+    return save_jobs(list(jobs) + kept, position, location)
+
+
+def _job_expired(job: Dict) -> bool:
+    """True if a job's own scrape `date` is more than ARCHIVE_AGE_DAYS old (unknown dates are kept)."""
+    try:
+        scraped = datetime.strptime(job.get("date", ""), "%Y-%m-%d %H:%M:%S")
+    except (AttributeError, TypeError, ValueError):
+        return False
+    return datetime.now() - scraped > timedelta(days=ARCHIVE_AGE_DAYS)
+
+
+def _entry_name(entry) -> Optional[str]:
+    return entry.get("name") if isinstance(entry, dict) else getattr(entry, "name", None)
+
+
+def _entry_updated_at(entry) -> str:
+    """Last-modified timestamp of a storage list entry ('' if unknown)."""
+    if isinstance(entry, dict):
+        return entry.get("updated_at") or entry.get("created_at") or ""
+    return getattr(entry, "updated_at", None) or getattr(entry, "created_at", None) or ""
+
+
+@traced("supabase_db.get_cached_jobs")
 def get_cached_jobs(position: str = "", location: str = "") -> List[Dict]:
     """
     Retrieve cached jobs from Supabase if available.
     If position/location are given, tries to read the specific cache file.
     Otherwise, lists cache folder and aggregates jobs.
+
+    The same posting is usually cached under several (position, location)
+    keys, so the aggregate is deduplicated with the newest file winning.
     """
+    global last_dedup_stats
     client = _get_supabase_client()
     if not client:
         return []
@@ -124,30 +286,187 @@ def get_cached_jobs(position: str = "", location: str = "") -> List[Dict]:
             try:
                 content = client.storage.from_(JOBS_BUCKET).download(file_path)
                 data = json.loads(content.decode("utf-8")) if isinstance(content, (bytes, bytearray)) else json.loads(content)
-                jobs_out.extend(data.get("jobs", []))
+                jobs_out, _ = dedupe_jobs(data.get("jobs", []), label=cache_key)
                 return jobs_out
             except Exception:
                 # Fall through to listing all cache files
                 pass
 
-        # List all cached files and aggregate
-        entries = client.storage.from_(JOBS_BUCKET).list("jobs/cache")
-        for entry in entries or []:
-            name = entry.get("name") if isinstance(entry, dict) else getattr(entry, "name", None)
+        # List all cached files and aggregate, downloading only files that
+        # changed since the previous load
+        global _file_cache
+        entries = client.storage.from_(JOBS_BUCKET).list("jobs/cache") or []
+        entries = sorted(entries, key=_entry_updated_at, reverse=True)
+        files: Dict[str, Tuple[str, List[Dict]]] = {}
+        downloaded = 0
+        for entry in entries:
+            name = _entry_name(entry)
             if not name or not name.endswith(".json"):
                 continue
+            updated_at = _entry_updated_at(entry)
+            cached = _file_cache.get(name)
+            if cached is not None and updated_at and cached[0] == updated_at:
+                files[name] = cached
+                jobs_out.extend(cached[1])
+                continue
             try:
                 content = client.storage.from_(JOBS_BUCKET).download(f"jobs/cache/{name}")
                 data = json.loads(content.decode("utf-8")) if isinstance(content, (bytes, bytearray)) else json.loads(content)
-                jobs_out.extend(data.get("jobs", []))
+                files[name] = (updated_at, data.get("jobs", []))
+                jobs_out.extend(files[name][1])
+                downloaded += 1
             except Exception:
                 continue
+        _file_cache = files
+        CORPUS_FILE_LOADS.inc(downloaded, result="downloaded")
+        CORPUS_FILE_LOADS.inc(len(files) - downloaded, result="unchanged")
+        logger.info(f"Loaded {len(files)} cache files ({downloaded} downloaded, {len(files) - downloaded} unchanged)")
+        global corpus_baseline, _dedup, _url_owner
+        dedup = JobDeduplicator()
+        jobs_out, last_dedup_stats = dedupe_jobs(jobs_out, label="corpus", dedup=dedup)
+        file_of = {id(job): name for name, (_, jobs) in files.items() for job in jobs}
+        _url_owner = {}
+        for job in jobs_out:
+            key = canonical_job_url(job.get("url", ""))
+            if key:
+                _url_owner[key] = file_of[id(job)]
+        _dedup = dedup
+        corpus_baseline += 1
         return jobs_out
     except Exception as e:
         logger.error(f"Error reading cached jobs: {e}")
         return []
 
 
+def _download_jobs(client, name: str) -> List[Dict]:
+    content = client.storage.from_(JOBS_BUCKET).download(f"jobs/cache/{name}")
+    data = json.loads(content.decode("utf-8")) if isinstance(content, (bytes, bytearray)) else json.loads(content)
+    return data.get("jobs", [])
+
+
+@traced("supabase_db.get_corpus_delta")
+def get_corpus_delta(baseline: int) -> Optional[CorpusDelta]:
+    """
+    Jobs added, updated and removed since the aggregate load (or delta)
+    that left `corpus_baseline` at `baseline`, downloading only the cache
+    files that changed.
+
+    A changed file is newer than every other file, so its copy of a URL
+    wins; URLs only a changed or removed file used to supply fall back to
+    the newest remaining copy, or are removed. URL-less jobs and
+    near-duplicate ordering are only settled exactly by a full load.
+
+    Returns:
+        The delta, or None when it cannot be computed (baseline mismatch,
+        storage error, or more than half of the files changed) and the
+        caller should reload the whole corpus
+    """
+    global _file_cache, corpus_baseline
+    client = _get_supabase_client()
+    if not client or _dedup is None or baseline != corpus_baseline:
+        return None
+    try:
+        entries = client.storage.from_(JOBS_BUCKET).list("jobs/cache") or []
+    except Exception as e:
+        logger.error(f"Error listing cache files: {e}")
+        return None
+    listed = {}
+    for entry in entries:
+        name = _entry_name(entry)
+        if name and name.endswith(".json"):
+            listed[name] = _entry_updated_at(entry)
+    changed = sorted(
+        (name for name, updated_at in listed.items()
+         if name not in _file_cache or not updated_at or _file_cache[name][0] != updated_at),
+        key=lambda name: listed[name], reverse=True,
+    )
+    gone = set(_file_cache) - set(listed)
+    if not changed and not gone:
+        return CorpusDelta(baseline=corpus_baseline)
+    if len(changed) + len(gone) > max(len(listed), 1) / 2:
+        logger.info(f"{len(changed)} changed and {len(gone)} removed of {len(listed)} cache files, full reload")
+        return None
+
+    files = dict(_file_cache)
+    try:
+        for name in changed:
+            files[name] = (listed[name], _download_jobs(client, name))
+    except Exception as e:
+        logger.error(f"Error downloading changed cache files: {e}")
+        return None
+    for name in gone:
+        files.pop(name, None)
+    CORPUS_FILE_LOADS.inc(len(changed), result="downloaded")
+
+    # URLs whose live copy came from a file that changed or disappeared
+    stale = set(changed) | gone
+    orphans = {url for url, owner in _url_owner.items() if owner in stale}
+    for url in orphans:
+        _dedup.discard(url)
+        del _url_owner[url]
+
+    upserts: Dict[str, Dict] = {}
+    for name in changed:
+        for job in files[name][1]:
+            if not isinstance(job, dict):
+                continue
+            url = canonical_job_url(job.get("url", ""))
+            if not url or _url_owner.get(url) in changed:
+                continue
+            if url in _url_owner or _dedup.add(job):
+                _url_owner[url] = name
+                upserts[url] = job
+
+    # Orphans no changed file took over: newest remaining copy, if any
+    missing = orphans - set(upserts)
+    if missing:
+        for name in sorted(set(files) - set(changed), key=lambda n: files[n][0], reverse=True):
+            for job in files[name][1]:
+                url = canonical_job_url(job.get("url", "")) if isinstance(job, dict) else ""
+                if url in missing and _dedup.add(job):
+                    _url_owner[url] = name
+                    upserts[url] = job
+                    missing.discard(url)
+            if not missing:
+                break
+
+    _file_cache = files
+    corpus_baseline += 1
+    delta = CorpusDelta(baseline=corpus_baseline, upserts=list(upserts.values()),
+                        removed=sorted(missing), files_changed=len(changed) + len(gone))
+    logger.info(
+        f"Corpus delta from {delta.files_changed} cache files: "
+        f"{len(delta.upserts)} upserts, {len(delta.removed)} removed"
+    )
+    return delta
+
+
+def get_corpus_version() -> str:
+    """
+    Cheap version tag for the aggregated corpus: the manifest's version
+    (one tiny download), or, before any writer has created the manifest,
+    a hash of the cache file names and their last-modified timestamps
+    (one list() call). Returns "empty" if storage is unavailable.
+    """
+    client = _get_supabase_client()
+    if not client:
+        return "empty"
+    manifest = read_manifest()
+    if manifest is not None:
+        return f"m-{manifest['version']}"
+    try:
+        entries = client.storage.from_(JOBS_BUCKET).list("jobs/cache") or []
+    except Exception as e:
+        logger.error(f"Error listing cache files: {e}")
+        return "empty"
+    digest = hashlib.sha1()
+    for entry in sorted(entries, key=lambda e: _entry_name(e) or ""):
+        name = _entry_name(entry)
+        if name and name.endswith(".json"):
+            digest.update(f"{name}:{_entry_updated_at(entry)};".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
 def archive_old_caches() -> int:
     """Move cache files older than ARCHIVE_AGE_DAYS to jobs/archived.
     Returns number of archived files.
@@ -165,7 +484,7 @@ def archive_old_caches() -> int:
 
         now = datetime.now(timezone.utc)
         for entry in entries:
-            name = entry.get("name") if isinstance(entry, dict) else getattr(entry, "name", None)
+            name = _entry_name(entry)
             if not name or not name.endswith(".json"):
                 continue
             # Download and inspect scraped_at
@@ -206,6 +525,8 @@ def archive_old_caches() -> int:
                 continue
 
         logger.info(f"✓ Archiving complete: {archived_count} files moved to jobs/archived")
+        if archived_count:
+            _notify_corpus_changed(client, f"archived {archived_count} cache files")
         return archived_count
     except Exception as e:
         logger.error(f"Error archiving caches: {e}")
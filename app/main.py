@@ -1,10 +1,24 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Header, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from pathlib import Path
 import logging
+import threading
+import time
 from app.api.routes import router
 from app.core.config import settings
+from app.core.metrics import CONTENT_TYPE_LATEST, HTTP_REQUEST_SECONDS, REGISTRY
+from app.core.profiling import (
+    PROFILE_MODES,
+    ProfileSession,
+    activate_session,
+    deactivate_session,
+    new_session_name,
+    profiling_authorized,
+    start_profile_window,
+)
+from app.core.tracing import activate, deactivate, extract, start_span
+from app.services import warmup
 
 logger = logging.getLogger(__name__)
 
@@ -32,21 +46,128 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Corpus-Version", "X-Export-Mode"],
 )
 
+@app.middleware("http")
+async def observe_request(request: Request, call_next):
+    """
+    Wrap each request in a server span (continuing an incoming traceparent)
+    and observe its latency per route template, not raw path, to bound
+    label cardinality.
+    """
+    started = time.perf_counter()
+    status = 500
+    span = start_span(
+        f"HTTP {request.method}",
+        attributes={"http.method": request.method, "http.target": request.url.path},
+        parent=extract(request.headers),
+        kind="SERVER",
+    )
+    token = activate(span)
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    except Exception as e:
+        span.record_exception(e)
+        raise
+    finally:
+        route = getattr(request.scope.get("route"), "path", "unmatched")
+        deactivate(token)
+        span.update_name(f"{request.method} {route}")
+        span.set_attribute("http.route", route)
+        span.set_attribute("http.status_code", status)
+        span.end()
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - started,
+            method=request.method,
+            route=route,
+            status=status,
+        )
+
+@app.middleware("http")
+async def profile_request(request: Request, call_next):
+    """
+    Profile a single request when asked to with `X-Profile: sample|cprofile`
+    (or `?profile=`) plus a matching `X-Profile-Token` (or `?profile_token=`).
+    The artifact path is returned in the X-Profile-Artifact header.
+    """
+    mode = request.headers.get("x-profile") or request.query_params.get("profile")
+    if not mode:
+        return await call_next(request)
+    token = request.headers.get("x-profile-token") or request.query_params.get("profile_token")
+    if mode not in PROFILE_MODES or not profiling_authorized(token):
+        return await call_next(request)
+
+    session = ProfileSession(new_session_name(f"{request.method}-{request.url.path}"), mode).start()
+    context_token = activate_session(session)
+    try:
+        response = await call_next(request)
+    finally:
+        deactivate_session(context_token)
+        artifact = session.finish()
+    if artifact:
+        response.headers["X-Profile-Artifact"] = artifact
+    return response
+
 # Include API routes
 app.include_router(router)
 
+def _enqueue_initial_scrape():
+    from app.celery_app import enqueue_initial_scrape
+
+    enqueue_initial_scrape()
+
+
 @app.on_event("startup")
 def start_background_tasks():
-    """Kick off background scraping via Celery without blocking startup."""
-    try:
-        from app.services.tasks import initial_linkedin_scrape
+    """
+    Kick off background scraping via Celery without blocking startup (or
+    failing on a down broker). With API_WORKERS > 1 every uvicorn worker
+    runs this hook, so the start_api.py master enqueues the scrape once instead.
+    """
+    if settings.API_WORKERS > 1:
+        return
+    threading.Thread(target=_enqueue_initial_scrape, name="enqueue-initial-scrape", daemon=True).start()
+
+@app.on_event("startup")
+def start_cache_invalidation_listener():
+    """Re-check the corpus as soon as a worker saves or archives jobs (SHARED_CACHE_ENABLED)."""
+    if settings.SHARED_CACHE_ENABLED:
+        from app.db.job_store import mark_stale
+        from app.services.shared_cache import start_invalidation_listener
+
+        start_invalidation_listener(mark_stale)
+
+@app.on_event("startup")
+def start_job_store_compactor():
+    """Periodically rebuild the job store without jobs removed by incremental updates."""
+    if not settings.JOB_INDEX_SHARED:
+        from app.db.job_store import start_compactor
+
+        start_compactor()
+
+@app.on_event("startup")
+def start_warmup():
+    """Preload corpus, indexes and extractor in the background; /health/ready turns 200 when done."""
+    warmup.start_warmup()
+
+@app.get("/metrics", tags=["Health"], include_in_schema=False)
+def metrics():
+    """Prometheus metrics in text exposition format."""
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE_LATEST)
 
-        initial_linkedin_scrape.delay()
-        logger.info("Enqueued initial_linkedin_scrape Celery task")
-    except Exception:
-        logger.exception("Failed to enqueue initial_linkedin_scrape")
+@app.post("/admin/profile", tags=["Admin"], include_in_schema=False)
+def profile_process(
+    seconds: float = Query(30, gt=0),
+    x_profile_token: str = Header(None),
+):
+    """Sample this API process for a time window and write a collapsed-stack profile."""
+    if not profiling_authorized(x_profile_token):
+        raise HTTPException(status_code=403, detail="Profiling not authorized")
+    seconds = min(seconds, settings.PROFILE_MAX_WINDOW_SECONDS)
+    return {"success": True, "seconds": seconds, "artifact": start_profile_window(seconds, name="api")}
 
 @app.get("/docs", tags=["Docs"], response_class=HTMLResponse)
 def custom_docs():
@@ -66,6 +187,7 @@ def root():
         "docs": "/docs",
         "endpoints": {
             "health": "/health",
+            "metrics": "/metrics",
             "ping": "/ping",
             "upload_resume": "/upload-resume",
             "analyze_resume": "/analyze-resume",
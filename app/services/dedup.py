@@ -0,0 +1,218 @@
+"""
+Job deduplication - exact (canonical URL) and near-duplicate (MinHash/LSH) detection
+"""
+
+import hashlib
+import logging
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# MinHash parameters: NUM_PERM = LSH_BANDS * LSH_ROWS.
+# 8 bands of 8 rows puts the LSH candidate threshold at ~0.77 Jaccard.
+NUM_PERM = 64
+LSH_BANDS = 8
+LSH_ROWS = 8
+SHINGLE_SIZE = 3
+MIN_DESCRIPTION_TOKENS = 20
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_rng = np.random.RandomState(1337)
+_PERM_A = _rng.randint(1, 1 << 31, size=NUM_PERM).astype(np.uint64)
+_PERM_B = _rng.randint(0, 1 << 31, size=NUM_PERM).astype(np.uint64)
+
+_LINKEDIN_JOB_ID = re.compile(r"/jobs/view/(?:[^/]*?-)?(\d+)/?$")
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+_PLACEHOLDER_DESCRIPTION = "no description available"
+
+
+@dataclass
+class DedupStats:
+    """Counters describing one deduplication pass."""
+
+    total: int = 0
+    unique: int = 0
+    url_duplicates: int = 0
+    near_duplicates: int = 0
+
+    @property
+    def duplicates(self) -> int:
+        return self.url_duplicates + self.near_duplicates
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Fraction of input jobs that were dropped as duplicates."""
+        return self.duplicates / self.total if self.total else 0.0
+
+    def as_dict(self) -> Dict:
+        return {
+            "total": self.total,
+            "unique": self.unique,
+            "url_duplicates": self.url_duplicates,
+            "near_duplicates": self.near_duplicates,
+            "dedup_ratio": round(self.dedup_ratio, 4),
+        }
+
+
+def canonical_job_url(url: str) -> str:
+    """
+    Canonical dedup key for a job URL.
+
+    LinkedIn exposes the same posting under many slugs/hosts
+    (www., in., tracking query strings), so LinkedIn URLs collapse
+    to their numeric job id. Other URLs drop query, fragment and
+    trailing slash and are lowercased.
+    """
+    if not url:
+        return ""
+    url = url.strip()
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    path = parts.path.rstrip("/")
+    if host.endswith("linkedin.com"):
+        match = _LINKEDIN_JOB_ID.search(path)
+        if match:
+            return f"linkedin:{match.group(1)}"
+    return f"{host}{path}".lower()
+
+
+def _shingles(job: Dict) -> Optional[List[str]]:
+    """Word shingles of title+company+description, or None if too little text."""
+    description = (job.get("description") or "").strip().lower()
+    if not description or description == _PLACEHOLDER_DESCRIPTION:
+        return None
+    desc_tokens = _TOKEN_RE.findall(description)
+    if len(desc_tokens) < MIN_DESCRIPTION_TOKENS:
+        return None
+    tokens = (
+        _TOKEN_RE.findall((job.get("title") or "").lower())
+        + _TOKEN_RE.findall((job.get("company") or "").lower())
+        + desc_tokens
+    )
+    return [" ".join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)]
+
+
+def minhash_signature(shingles: Iterable[str]) -> np.ndarray:
+    """MinHash signature (NUM_PERM uint64 values) of a shingle set."""
+    hashes = np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "little")
+            for s in set(shingles)
+        ),
+        dtype=np.uint64,
+    )
+    if hashes.size == 0:
+        return np.full(NUM_PERM, _MERSENNE_PRIME, dtype=np.uint64)
+    # (a * x + b) mod p for every permutation/shingle pair, then column-wise min
+    permuted = (np.outer(hashes, _PERM_A) + _PERM_B) % _MERSENNE_PRIME
+    return permuted.min(axis=0)
+
+
+class JobDeduplicator:
+    """
+    Streaming deduplicator. Feed jobs in priority order (the first
+    occurrence of a posting is kept) and call `add` for each one.
+    """
+
+    def __init__(self, near_duplicates: Optional[bool] = None, threshold: Optional[float] = None):
+        self.near_duplicates = settings.DEDUP_NEAR_DUPLICATES if near_duplicates is None else near_duplicates
+        self.threshold = settings.DEDUP_SIMILARITY_THRESHOLD if threshold is None else threshold
+        self.stats = DedupStats()
+        self._seen_keys: set = set()
+        self._signatures: List[np.ndarray] = []
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(LSH_BANDS)]
+        self._signature_of_key: Dict[str, int] = {}
+        self._discarded: set = set()
+
+    def seen(self, url: str) -> bool:
+        """True if a job with this URL was already accepted."""
+        return canonical_job_url(url) in self._seen_keys
+
+    def discard(self, key: str) -> None:
+        """
+        Forget an accepted job by its canonical URL (it left the corpus), so
+        the URL and its near-duplicates can be accepted again.
+        """
+        self._seen_keys.discard(key)
+        idx = self._signature_of_key.pop(key, None)
+        if idx is not None:
+            self._discarded.add(idx)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[b * LSH_ROWS:(b + 1) * LSH_ROWS].tobytes() for b in range(LSH_BANDS)]
+
+    def _find_near_duplicate(self, signature: np.ndarray, band_keys: List[bytes]) -> bool:
+        candidates = set()
+        for band, key in enumerate(band_keys):
+            candidates.update(self._buckets[band].get(key, ()))
+        for idx in candidates - self._discarded:
+            if np.count_nonzero(self._signatures[idx] == signature) / NUM_PERM >= self.threshold:
+                return True
+        return False
+
+    def add(self, job: Dict) -> bool:
+        """Register a job. Returns True if it is unique, False if it is a duplicate."""
+        self.stats.total += 1
+
+        key = canonical_job_url(job.get("url", ""))
+        if key and key in self._seen_keys:
+            self.stats.url_duplicates += 1
+            return False
+
+        if self.near_duplicates:
+            shingles = _shingles(job)
+            if shingles:
+                signature = minhash_signature(shingles)
+                band_keys = self._band_keys(signature)
+                if self._find_near_duplicate(signature, band_keys):
+                    self.stats.near_duplicates += 1
+                    if key:
+                        self._seen_keys.add(key)
+                    return False
+                idx = len(self._signatures)
+                self._signatures.append(signature)
+                for band, band_key in enumerate(band_keys):
+                    self._buckets[band].setdefault(band_key, []).append(idx)
+                if key:
+                    self._signature_of_key[key] = idx
+
+        if key:
+            self._seen_keys.add(key)
+        self.stats.unique += 1
+        return True
+
+
+def dedupe_jobs(
+    jobs: Iterable[Dict],
+    near_duplicates: Optional[bool] = None,
+    label: str = "jobs",
+    dedup: Optional[JobDeduplicator] = None,
+) -> Tuple[List[Dict], DedupStats]:
+    """
+    Drop duplicate jobs, keeping the first occurrence.
+
+    Args:
+        jobs: Jobs in priority order
+        near_duplicates: Enable MinHash/LSH near-duplicate detection (defaults to settings)
+        label: Name used in the log line reporting the dedup ratio
+        dedup: Deduplicator to feed, for callers that keep it for later deltas
+
+    Returns:
+        Tuple of (unique_jobs, stats)
+    """
+    dedup = dedup or JobDeduplicator(near_duplicates=near_duplicates)
+    unique = [job for job in jobs if isinstance(job, dict) and dedup.add(job)]
+    stats = dedup.stats
+    if stats.duplicates:
+        logger.info(
+            f"Dedup {label}: {stats.total} -> {stats.unique} "
+            f"({stats.url_duplicates} url, {stats.near_duplicates} near, ratio {stats.dedup_ratio:.1%})"
+        )
+    return unique, stats
@@ -0,0 +1,250 @@
+"""
+HTML parsing backends for the LinkedIn scraper.
+
+The scraper needs only the `base-card` divs of a search page and the
+description div and job criteria (seniority level, employment type, ...)
+of a job page. Backends extract just those nodes and return plain data,
+so no parse tree outlives the call:
+
+- selectolax: C (lexbor) parser with CSS selection, fastest
+- lxml:       libxml2 parser with XPath
+- bs4:        BeautifulSoup + html.parser restricted by SoupStrainer
+              (pure Python fallback, always available)
+
+SCRAPER_HTML_PARSER picks one ("auto" = first installed in that order).
+"""
+
+import functools
+import logging
+import re
+from typing import Callable, Dict, List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from app.core.config import settings
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser  # selectolax < 0.3.13
+    except ImportError:
+        HTMLParser = None
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+logger = logging.getLogger(__name__)
+
+CARD_FIELDS = ("title", "company", "location", "url")
+DESCRIPTION_LIMIT = 2000
+
+
+def _clean_url(href: Optional[str]) -> Optional[str]:
+    return href.split("?")[0] if href else None
+
+
+def _text(value: Optional[str]) -> Optional[str]:
+    return value.strip() if value is not None else None
+
+
+# --- selectolax ---
+
+def _selectolax_cards(html: str) -> List[Dict]:
+    tree = HTMLParser(html)
+    cards = []
+    for node in tree.css("div.base-card"):
+        title = node.css_first("h3.base-search-card__title")
+        company = node.css_first("a.hidden-nested-link")
+        location = node.css_first("span.job-search-card__location")
+        link = node.css_first("a.base-card__full-link")
+        cards.append({
+            "title": _text(title.text()) if title else None,
+            "company": _text(company.text()) if company else None,
+            "location": _text(location.text()) if location else None,
+            "url": _clean_url(link.attributes.get("href")) if link else None,
+        })
+    return cards
+
+
+def _selectolax_description_of(tree) -> str:
+    node = tree.css_first("div.description__text") or tree.css_first("div.show-more-less-html__markup")
+    return node.text(separator="\n").strip()[:DESCRIPTION_LIMIT] if node else ""
+
+
+def _selectolax_description(html: str) -> str:
+    return _selectolax_description_of(HTMLParser(html))
+
+
+def _selectolax_page(html: str) -> Dict:
+    tree = HTMLParser(html)
+    criteria = {}
+    for item in tree.css("li.description__job-criteria-item"):
+        name = item.css_first("h3.description__job-criteria-subheader")
+        value = item.css_first("span.description__job-criteria-text")
+        if name and value:
+            criteria[_text(name.text()).lower()] = _text(value.text())
+    return {"description": _selectolax_description_of(tree), "criteria": criteria}
+
+
+# --- lxml ---
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+_LXML_CARD = f"//div[{_has_class('base-card')}]"
+_LXML_FIELDS = {
+    "title": f".//h3[{_has_class('base-search-card__title')}]",
+    "company": f".//a[{_has_class('hidden-nested-link')}]",
+    "location": f".//span[{_has_class('job-search-card__location')}]",
+}
+_LXML_LINK = f".//a[{_has_class('base-card__full-link')}]"
+_LXML_DESCRIPTIONS = (
+    f"//div[{_has_class('description__text')}]",
+    f"//div[{_has_class('show-more-less-html__markup')}]",
+)
+_LXML_CRITERIA = f"//li[{_has_class('description__job-criteria-item')}]"
+_LXML_CRITERION_NAME = f".//h3[{_has_class('description__job-criteria-subheader')}]"
+_LXML_CRITERION_VALUE = f".//span[{_has_class('description__job-criteria-text')}]"
+
+
+def _lxml_cards(html: str) -> List[Dict]:
+    if not html.strip():
+        return []
+    root = lxml.html.fromstring(html)
+    cards = []
+    for node in root.xpath(_LXML_CARD):
+        card = {}
+        for field, path in _LXML_FIELDS.items():
+            found = node.xpath(path)
+            card[field] = _text(found[0].text_content()) if found else None
+        link = node.xpath(_LXML_LINK)
+        card["url"] = _clean_url(link[0].get("href")) if link else None
+        cards.append(card)
+    return cards
+
+
+def _lxml_description_of(root) -> str:
+    for path in _LXML_DESCRIPTIONS:
+        found = root.xpath(path)
+        if found:
+            return "\n".join(found[0].itertext()).strip()[:DESCRIPTION_LIMIT]
+    return ""
+
+
+def _lxml_description(html: str) -> str:
+    if not html.strip():
+        return ""
+    return _lxml_description_of(lxml.html.fromstring(html))
+
+
+def _lxml_page(html: str) -> Dict:
+    if not html.strip():
+        return {"description": "", "criteria": {}}
+    root = lxml.html.fromstring(html)
+    criteria = {}
+    for item in root.xpath(_LXML_CRITERIA):
+        name, value = item.xpath(_LXML_CRITERION_NAME), item.xpath(_LXML_CRITERION_VALUE)
+        if name and value:
+            criteria[_text(name[0].text_content()).lower()] = _text(value[0].text_content())
+    return {"description": _lxml_description_of(root), "criteria": criteria}
+
+
+# --- BeautifulSoup fallback ---
+
+def _class_token(*names: str):
+    # Strainers see the raw class attribute ("base-card relative ..."), not the split tokens
+    return re.compile(r"(^|\s)(" + "|".join(map(re.escape, names)) + r")(\s|$)")
+
+
+_CARD_STRAINER = SoupStrainer("div", class_=_class_token("base-card"))
+_DESCRIPTION_STRAINER = SoupStrainer("div", class_=_class_token("description__text", "show-more-less-html__markup"))
+_PAGE_STRAINER = SoupStrainer(
+    ["div", "li"],
+    class_=_class_token("description__text", "show-more-less-html__markup", "description__job-criteria-item"),
+)
+
+
+def _bs4_cards(html: str) -> List[Dict]:
+    soup = BeautifulSoup(html, "html.parser", parse_only=_CARD_STRAINER)
+    cards = []
+    for node in soup.find_all("div", class_="base-card"):
+        title = node.find("h3", class_="base-search-card__title")
+        company = node.find("a", class_="hidden-nested-link")
+        location = node.find("span", class_="job-search-card__location")
+        link = node.find("a", class_="base-card__full-link")
+        cards.append({
+            "title": _text(title.text) if title else None,
+            "company": _text(company.text) if company else None,
+            "location": _text(location.text) if location else None,
+            "url": _clean_url(link.get("href")) if link else None,
+        })
+    return cards
+
+
+def _bs4_description_of(soup) -> str:
+    node = soup.select_one("div.description__text") or soup.select_one("div.show-more-less-html__markup")
+    return node.get_text("\n").strip()[:DESCRIPTION_LIMIT] if node else ""
+
+
+def _bs4_description(html: str) -> str:
+    return _bs4_description_of(BeautifulSoup(html, "html.parser", parse_only=_DESCRIPTION_STRAINER))
+
+
+def _bs4_page(html: str) -> Dict:
+    soup = BeautifulSoup(html, "html.parser", parse_only=_PAGE_STRAINER)
+    criteria = {}
+    for item in soup.find_all("li", class_="description__job-criteria-item"):
+        name = item.find("h3", class_="description__job-criteria-subheader")
+        value = item.find("span", class_="description__job-criteria-text")
+        if name and value:
+            criteria[_text(name.text).lower()] = _text(value.text)
+    return {"description": _bs4_description_of(soup), "criteria": criteria}
+
+
+BACKENDS: Dict[str, Dict[str, Callable[[str], object]]] = {}
+if HTMLParser is not None:
+    BACKENDS["selectolax"] = {"cards": _selectolax_cards, "description": _selectolax_description, "page": _selectolax_page}
+if lxml is not None:
+    BACKENDS["lxml"] = {"cards": _lxml_cards, "description": _lxml_description, "page": _lxml_page}
+BACKENDS["bs4"] = {"cards": _bs4_cards, "description": _bs4_description, "page": _bs4_page}
+
+
+def backend_name(name: Optional[str] = None) -> str:
+    """Resolve a backend name ("auto" or unavailable -> best installed one)."""
+    return _resolve((name or settings.SCRAPER_HTML_PARSER).lower())
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve(name: str) -> str:
+    if name in BACKENDS:
+        return name
+    if name != "auto":
+        logger.warning(f"HTML parser backend '{name}' not available, using {next(iter(BACKENDS))}")
+    return next(iter(BACKENDS))
+
+
+def parse_job_cards(html: str, backend: Optional[str] = None) -> List[Dict]:
+    """
+    Cards of a search results page as dicts with title, company, location
+    and url (query string stripped). Missing fields are None.
+    """
+    return BACKENDS[backend_name(backend)]["cards"](html)
+
+
+def parse_job_description(html: str, backend: Optional[str] = None) -> str:
+    """Description text of a job page, truncated to 2000 chars ("" if absent)."""
+    return BACKENDS[backend_name(backend)]["description"](html)
+
+
+def parse_job_page(html: str, backend: Optional[str] = None) -> Dict:
+    """
+    Description and job criteria of a job page in one parse: a dict with
+    "description" (as parse_job_description) and "criteria", mapping each
+    lowercased criterion name ("seniority level", "employment type", ...)
+    to its value.
+    """
+    return BACKENDS[backend_name(backend)]["page"](html)
@@ -0,0 +1,255 @@
+"""
+Persistent HTTP cache for the scraper's requests.Session.
+
+`CachingHTTPAdapter` stores successful GET responses in a SQLite file
+(shared safely by all worker processes on a host), bounded to a maximum
+size with least-recently-used eviction. On a repeat request it:
+
+- serves the stored body without any network call while the entry is
+  fresh (Cache-Control max-age / Expires, or the RFC 9111 heuristic of
+  10% of the time since Last-Modified),
+- otherwise revalidates with If-None-Match / If-Modified-Since and serves
+  the stored body on 304 Not Modified,
+- otherwise replaces the entry with the new response.
+
+Responses with no-store, or with neither validators nor a freshness
+lifetime, are not stored since they could never be reused.
+"""
+
+import email.utils
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from app.core.metrics import SCRAPER_HTTP_CACHE, SCRAPER_HTTP_CACHE_BYTES_SAVED
+
+logger = logging.getLogger(__name__)
+
+HEURISTIC_FRACTION = 0.1
+HEURISTIC_MAX_SECONDS = 24 * 3600
+# The byte total is tracked in memory; re-read from the file this often to
+# pick up entries written by other processes sharing it
+SIZE_RESYNC_SECONDS = 60.0
+# Response headers kept with an entry; hop-by-hop and size headers are dropped
+STORED_HEADERS = ("content-type", "etag", "last-modified", "cache-control", "expires", "date")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    fresh_until REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+"""
+
+
+def _parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    directives = {}
+    for part in (value or "").split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') or None
+    return directives
+
+
+def _http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness_lifetime(headers, now: float) -> float:
+    """Seconds a response stays fresh from `now`, per RFC 9111 section 4.2."""
+    directives = _parse_cache_control(headers.get("cache-control"))
+    if "no-cache" in directives:
+        return 0.0
+    for name in ("s-maxage", "max-age"):
+        if directives.get(name) is not None:
+            try:
+                return max(0.0, float(directives[name]))
+            except ValueError:
+                return 0.0
+    expires = _http_date(headers.get("expires"))
+    if expires is not None:
+        return max(0.0, expires - (_http_date(headers.get("date")) or now))
+    last_modified = _http_date(headers.get("last-modified"))
+    if last_modified is not None:
+        age = (_http_date(headers.get("date")) or now) - last_modified
+        return min(HEURISTIC_MAX_SECONDS, max(0.0, age * HEURISTIC_FRACTION))
+    return 0.0
+
+
+class HTTPCache:
+    """
+    SQLite-backed response store with a byte budget and LRU eviction.
+
+    The total size is a running counter adjusted on each put and eviction;
+    the file is only summed when the counter is over budget or stale.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._resync_size()
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def get(self, url: str) -> Optional[Dict]:
+        key = self.key(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT headers, body, fresh_until FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+        return {"headers": json.loads(row[0]), "body": row[1], "fresh_until": row[2]}
+
+    def is_fresh(self, url: str) -> bool:
+        """True if a GET for `url` would be answered without a network request."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fresh_until FROM entries WHERE key = ?", (self.key(url),)
+            ).fetchone()
+        return row is not None and row[0] > time.time()
+
+    def put(self, url: str, headers: Dict[str, str], body: bytes, fresh_until: float) -> None:
+        now = time.time()
+        key = self.key(url)
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, url, headers, body, size, stored_at, fresh_until, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, json.dumps(headers), body, len(body), now, fresh_until, now),
+            )
+            self._bytes += len(body) - (old[0] if old else 0)
+            if self._bytes > self.max_bytes or now - self._synced_at > SIZE_RESYNC_SECONDS:
+                self._resync_size()
+                self._evict()
+
+    def touch(self, url: str, headers: Dict[str, str], fresh_until: float) -> None:
+        """Merge headers from a 304 and extend freshness."""
+        key = self.key(url)
+        with self._lock:
+            row = self._conn.execute("SELECT headers FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return
+            merged = {**json.loads(row[0]), **headers}
+            self._conn.execute(
+                "UPDATE entries SET headers = ?, fresh_until = ?, last_access = ? WHERE key = ?",
+                (json.dumps(merged), fresh_until, time.time(), key),
+            )
+
+    def size(self) -> int:
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def _resync_size(self) -> None:
+        self._bytes = self.size()
+        self._synced_at = time.time()
+
+    def _evict(self) -> None:
+        total = self._bytes
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY last_access").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        self._bytes = total
+        logger.debug(f"HTTP cache evicted {evicted} entries, {total} bytes remain")
+
+
+def _stored_headers(headers) -> Dict[str, str]:
+    return {name: headers[name] for name in STORED_HEADERS if name in headers}
+
+
+class CachingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that answers GETs from an HTTPCache when it can."""
+
+    def __init__(self, cache: HTTPCache, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache = cache
+
+    def _cached_response(self, request: PreparedRequest, entry: Dict, status: str) -> Response:
+        response = Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.headers["X-Cache"] = status
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = entry["body"]
+        return response
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        if request.method != "GET":
+            return super().send(request, **kwargs)
+
+        entry = self.cache.get(request.url)
+        if entry is not None:
+            if entry["fresh_until"] > time.time():
+                SCRAPER_HTTP_CACHE.inc(result="fresh")
+                SCRAPER_HTTP_CACHE_BYTES_SAVED.inc(len(entry["body"]))
+                return self._cached_response(request, entry, "HIT")
+            if entry["headers"].get("etag"):
+                request.headers["If-None-Match"] = entry["headers"]["etag"]
+            if entry["headers"].get("last-modified"):
+                request.headers["If-Modified-Since"] = entry["headers"]["last-modified"]
+
+        response = super().send(request, **kwargs)
+        now = time.time()
+
+        if response.status_code == 304 and entry is not None:
+            headers = _stored_headers(response.headers)
+            merged = {**entry["headers"], **headers}
+            self.cache.touch(request.url, headers, now + freshness_lifetime(merged, now))
+            SCRAPER_HTTP_CACHE.inc(result="revalidated")
+            SCRAPER_HTTP_CACHE_BYTES_SAVED.inc(len(entry["body"]))
+            return self._cached_response(request, {**entry, "headers": merged}, "REVALIDATED")
+
+        SCRAPER_HTTP_CACHE.inc(result="miss")
+        if response.status_code == 200:
+            self._store(request.url, response, now)
+        return response
+
+    def _store(self, url: str, response: Response, now: float) -> None:
+        directives = _parse_cache_control(response.headers.get("cache-control"))
+        if "no-store" in directives:
+            return
+        headers = _stored_headers(response.headers)
+        lifetime = freshness_lifetime(headers, now)
+        if lifetime <= 0 and "etag" not in headers and "last-modified" not in headers:
+            return
+        # Reading .content here consumes the stream, as requests does for non-streamed calls
+        self.cache.put(url, headers, response.content, now + lifetime)
@@ -7,22 +7,29 @@ import random
 import time
 import logging
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional, Set, Tuple
+from urllib.parse import urlsplit
 import requests
-from bs4 import BeautifulSoup
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import json
 import os
 import re
 
+from app.core.config import settings
+from app.core.metrics import SCRAPER_REQUESTS, SCRAPER_THROTTLE_SECONDS, SCRAPER_THROTTLED
+from app.core.profiling import profiled
+from app.core.tracing import trace_span
+from app.services.dedup import JobDeduplicator, canonical_job_url
+from app.services.http_cache import CachingHTTPAdapter, HTTPCache
+from app.services.html_parsing import CARD_FIELDS, parse_job_cards, parse_job_page
+from app.services.scraper_fixtures import record_response
+from app.services.skill_taxonomy import canonicalize, display_name
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 JOBS_BUCKET = os.getenv("SUPABASE_JOBS_BUCKET", "job-data")
-try:
-    from app.services.supabase_storage import supabase_storage
-except Exception:
-    supabase_storage = None
+LINKEDIN_URL = "https://www.linkedin.com"
 
 # Fallback skills database for when Flair is unavailable
 SKILLS_DATABASE = {
@@ -97,90 +104,252 @@ def extract_skills_from_text(text: str, max_skills: int = 10) -> List[str]:
 
     for skill in SKILLS_DATABASE:
         if skill.lower() in text_lower:
-            found_skills.append(skill.upper() if len(skill) <= 3 else skill.title())
+            # Aliases (nodejs/node.js) collapse to one canonical skill
+            found_skills.append(display_name(canonicalize(skill) or skill))
 
     # Remove duplicates and return top N
     return list(dict.fromkeys(found_skills))[:max_skills]
 
 
+def _throttle(low: float, high: float) -> None:
+    """Politeness sleep for a random duration in [low, high] seconds (times SCRAPER_THROTTLE_SCALE)."""
+    delay = random.uniform(low, high) * settings.SCRAPER_THROTTLE_SCALE
+    SCRAPER_THROTTLE_SECONDS.inc(delay)
+    time.sleep(delay)
+
+
+def _route(url: str) -> str:
+    """Send LinkedIn URLs to SCRAPER_BASE_URL (e.g. a local replay server)."""
+    if settings.SCRAPER_BASE_URL == LINKEDIN_URL:
+        return url
+    parts = urlsplit(url)
+    return settings.SCRAPER_BASE_URL + parts.path + (f"?{parts.query}" if parts.query else "")
+
+
+def served_from_cache(session: requests.Session, url: str) -> bool:
+    """True if the session's HTTP cache holds a fresh copy of `url` (no network request needed)."""
+    adapter = session.get_adapter(url)
+    if not isinstance(adapter, CachingHTTPAdapter):
+        return False
+    return adapter.cache.is_fresh(requests.Request("GET", url).prepare().url)
+
+
+def _fetch(
+    session: requests.Session,
+    url: str,
+    kind: str,
+    delay: Optional[Tuple[float, float]] = None,
+    **kwargs
+) -> requests.Response:
+    """
+    GET through the scraper session, counting requests by kind and status.
+    The politeness `delay` range (see _throttle) is slept first unless the
+    HTTP cache answers without going to the network.
+    Successful pages are saved as fixtures when SCRAPER_RECORD_DIR is set.
+    """
+    original_url, url = url, _route(url)
+    if delay and not served_from_cache(session, url):
+        _throttle(*delay)
+    with trace_span("scraper.fetch", {"http.method": "GET", "http.url": url, "scraper.kind": kind}, kind="CLIENT") as span:
+        try:
+            response = session.get(url, **kwargs)
+        except Exception:
+            SCRAPER_REQUESTS.inc(kind=kind, status="error")
+            raise
+        span.set_attribute("http.status_code", response.status_code)
+    SCRAPER_REQUESTS.inc(kind=kind, status=response.status_code)
+    if response.status_code == 429:
+        SCRAPER_THROTTLED.inc(kind=kind)
+    elif response.status_code == 200 and settings.SCRAPER_RECORD_DIR:
+        record_response(settings.SCRAPER_RECORD_DIR, kind, original_url, response.text)
+    return response
+
+
+_http_cache = None
+
+
+def _get_http_cache():
+    """Process-wide on-disk HTTP cache, or None when disabled."""
+    global _http_cache
+    if _http_cache is None and settings.SCRAPER_HTTP_CACHE_MAX_MB > 0:
+        try:
+            _http_cache = HTTPCache(settings.SCRAPER_HTTP_CACHE_PATH, settings.SCRAPER_HTTP_CACHE_MAX_MB * 1024 * 1024)
+        except Exception as e:
+            logger.warning(f"HTTP cache unavailable at {settings.SCRAPER_HTTP_CACHE_PATH}: {e}")
+    return _http_cache
+
+
 def _get_session_with_retry() -> requests.Session:
-    """Create a requests session with retry strategy"""
+    """Create a requests session with retry strategy and the shared HTTP cache"""
     session = requests.Session()
     retries = Retry(
         total=3,
         backoff_factor=1,
         status_forcelist=[429, 500, 502, 503, 504]
     )
-    session.mount('https://', HTTPAdapter(max_retries=retries))
+    cache = _get_http_cache()
+    adapter = CachingHTTPAdapter(cache, max_retries=retries) if cache else HTTPAdapter(max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
     return session
 
 
+def build_job(
+    card: Dict,
+    position: str,
+    work_type: str,
+    exp_level: str,
+    detail_html: Optional[str] = None
+) -> Dict:
+    """
+    Job record from a parsed card and (if fetched) its detail page HTML.
+    Without an experience level facet, the level is the page's
+    "Seniority level" criterion.
+    """
+    description = "No description available"
+    skills = []
+    if detail_html:
+        page = parse_job_page(detail_html)
+        if page["description"]:
+            description = page["description"]
+            skills = extract_skills_from_text(description)
+        exp_level = exp_level or page["criteria"].get("seniority level", "")
+
+    return {
+        "position": position,
+        "date": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        "work_type": work_type,
+        "experience_level": exp_level,
+        "title": card["title"],
+        "company": card["company"],
+        "location": card["location"],
+        "url": card["url"],
+        "description": description,
+        "skills": ", ".join(skills) if skills else "No skills found",
+        "source": "LinkedIn"
+    }
+
+
+def fetch_job_detail(
+    session: requests.Session,
+    url: str,
+    delay: Optional[Tuple[float, float]] = None
+) -> Optional[str]:
+    """Detail page HTML, or None if it could not be fetched"""
+    try:
+        response = _fetch(
+            session,
+            url,
+            "detail",
+            delay,
+            headers={
+                'User-Agent': random.choice(USER_AGENTS),
+                'Accept-Language': 'en-US,en;q=0.9'
+            },
+            timeout=10
+        )
+        if response.status_code == 200:
+            return response.text
+    except Exception as e:
+        logger.warning(f"Failed to fetch description for {url}: {e}")
+    return None
+
+
 def _process_job_card(
-    job_element,
+    card: Dict,
     position: str,
     work_type: str,
     exp_level: str,
     session: requests.Session
 ) -> Dict:
-    """Process individual LinkedIn job card"""
+    """Process individual LinkedIn job card (as parsed by parse_job_cards)"""
     try:
-        title_elem = job_element.find('h3', class_='base-search-card__title')
-        company_elem = job_element.find('a', class_='hidden-nested-link')
-        loc_elem = job_element.find('span', class_='job-search-card__location')
-        link_elem = job_element.find('a', class_='base-card__full-link')
-
-        if not all([title_elem, company_elem, loc_elem, link_elem]):
+        if not all(card.get(field) for field in CARD_FIELDS):
             return None
 
-        title = title_elem.text.strip()
-        company = company_elem.text.strip()
-        location = loc_elem.text.strip()
-        url = link_elem['href'].split('?')[0]
+        # Fetch job description, slowing down between detail requests
+        detail_html = fetch_job_detail(session, card["url"], delay=DETAIL_DELAY)
+        return build_job(card, position, work_type, exp_level, detail_html)
 
-        # Fetch job description
-        description = "No description available"
-        skills = []
+    except Exception as e:
+        logger.error(f"Error processing job: {e}")
+        return None
 
-        try:
-            time.sleep(random.uniform(20, 50))
-            response = session.get(
-                url,
-                headers={
-                    'User-Agent': random.choice(USER_AGENTS),
-                    'Accept-Language': 'en-US,en;q=0.9'
-                },
-                timeout=10
-            )
-
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                desc_elem = soup.select_one('div.description__text') or \
-                           soup.select_one('div.show-more-less-html__markup')
-
-                if desc_elem:
-                    description = desc_elem.get_text('\n').strip()[:2000]
-                    skills = extract_skills_from_text(description)
 
-        except Exception as e:
-            logger.warning(f"Failed to fetch description for {url}: {e}")
-
-        return {
-            "position": position,
-            "date": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            "work_type": work_type,
-            "experience_level": exp_level,
-            "title": title,
-            "company": company,
-            "location": location,
-            "url": url,
-            "description": description,
-            "skills": ", ".join(skills) if skills else "No skills found",
-            "source": "LinkedIn"
-        }
+WORK_TYPE_FILTERS = {
+    "On-site": "f_WT=1",
+    "Hybrid": "f_WT=2",
+    "Remote": "f_WT=3"
+}
 
+EXP_LEVEL_FILTERS = {
+    "Internship": "f_E=1",
+    "Entry level": "f_E=2",
+    "Associate": "f_E=3",
+    "Mid-Senior level": "f_E=4"
+}
+
+
+WORK_TYPES = ["Remote", "Hybrid", "On-site"]
+EXP_LEVELS = ["Entry level", "Associate", "Mid-Senior level"]
+
+# Politeness sleeps (seconds) before network requests; cache hits skip them
+DETAIL_DELAY = (30.0, 70.5)
+SEARCH_PAGE_DELAY = (23.0, 47.0)
+
+# Guest endpoint behind the search page's infinite scroll; pages with start=
+GUEST_SEARCH_PATH = "/jobs-guest/jobs/api/seeMoreJobPostings/search"
+
+
+def search_facets(mode: str) -> List[Tuple[Optional[str], Optional[str]]]:
+    """
+    (work_type, exp_level) filter combinations to crawl for a facet mode:
+    "none" (one unfiltered crawl), "work_type", "experience" or "grid"
+    (every work type x experience level, the original 9-way sweep).
+
+    Jobs are tagged with the facet they were found under. Detail pages
+    carry the experience level but not the work type, so "none" and
+    "experience" leave work_type empty and /jobs?work_type= cannot
+    find those jobs; "work_type" (the default) tags both fields.
+    """
+    if mode == "work_type":
+        return [(w, None) for w in WORK_TYPES]
+    if mode == "experience":
+        return [(None, e) for e in EXP_LEVELS]
+    if mode == "grid":
+        return [(w, e) for w in WORK_TYPES for e in EXP_LEVELS]
+    return [(None, None)]
+
+
+def search_url(
+    position: str,
+    location: str,
+    work_type: Optional[str] = None,
+    exp_level: Optional[str] = None,
+    start: int = 0
+) -> str:
+    """Guest search results URL, newest first, for one facet and page offset."""
+    filters = "".join(
+        f"&{f}" for f in (WORK_TYPE_FILTERS.get(work_type), EXP_LEVEL_FILTERS.get(exp_level)) if f
+    )
+    return (
+        f"{LINKEDIN_URL}{GUEST_SEARCH_PATH}?"
+        f"keywords={position.replace(' ', '%20')}"
+        f"&location={location.replace(' ', '%20')}"
+        f"{filters}"
+        f"&sortBy=DD"
+        f"&start={start}"
+    )
+
+
+def known_job_urls(position: str, location: str) -> Set[str]:
+    """Canonical URLs of jobs already cached, so a crawl can stop where the last one ended."""
+    try:
+        from app.db.supabase_db import get_cached_jobs
+        return {canonical_job_url(job.get("url", "")) for job in get_cached_jobs(position, location)}
     except Exception as e:
-        logger.error(f"Error processing job: {e}")
-        return None
+        logger.warning(f"Could not load cached jobs for {position} in {location}: {e}")
+        return set()
 
 
 def _slug(text: str) -> str:
@@ -188,107 +357,127 @@ def _slug(text: str) -> str:
 
 
 def _cache_jobs_to_supabase(position: str, location: str, jobs: List[Dict]):
-    """Deprecated local cache uploader. Use app.db.supabase_db.save_jobs instead."""
+    """
+    Merge a crawl's new jobs into the (position, location) cache file. A
+    crawl stops at the first cached job, so `jobs` is only what is new and
+    must not replace the file; with nothing new the file is left alone.
+    """
+    if not jobs:
+        logger.info(f"No new jobs for {position} in {location}, cache left as is")
+        return
     try:
-        from app.db.supabase_db import save_jobs
-        save_jobs(jobs, position, location)
+        from app.db.supabase_db import merge_jobs
+        merge_jobs(jobs, position, location)
     except Exception as e:
         logger.error("Failed to store jobs via DB module: %s", e)
 
 
+@profiled
 def scrape_linkedin_jobs(
     position: str,
     location: str,
-    max_results: int = 50
+    max_results: int = 50,
+    facets: Optional[str] = None,
+    max_pages: Optional[int] = None,
+    known_urls: Optional[Set[str]] = None
 ) -> List[Dict]:
     """
     Scrape LinkedIn jobs for a specific position and location
 
+    Each facet's results are paged newest first with the guest start=
+    offset. Paging stops at an empty page, at a page with nothing new, or
+    once a page contains jobs already cached by an earlier run (everything
+    after it is older and was seen then too). The new jobs are merged into
+    the (position, location) cache file ahead of the ones already there.
+
     Args:
         position: Job title/position
         location: Job location
         max_results: Maximum jobs to scrape
+        facets: Facet mode (see search_facets); defaults to SCRAPER_FACETS
+        max_pages: Page limit per facet; defaults to SCRAPER_MAX_PAGES
+        known_urls: Canonical URLs already stored; loaded from the cache if None
 
     Returns:
-        List of job dictionaries with extracted skills
+        List of newly scraped job dictionaries with extracted skills
     """
 
     logger.info(f"🔗 Starting LinkedIn scrape: {position} in {location}")
 
     session = _get_session_with_retry()
     all_jobs = []
-
-    work_types = ["Remote", "Hybrid", "On-site"]
-    exp_levels = ["Entry level", "Associate", "Mid-Senior level"]
-
-    work_type_map = {
-        "On-site": "f_WT=1",
-        "Hybrid": "f_WT=2",
-        "Remote": "f_WT=3"
-    }
-
-    exp_level_map = {
-        "Internship": "f_E=1",
-        "Entry level": "f_E=2",
-        "Associate": "f_E=3",
-        "Mid-Senior level": "f_E=4"
-    }
-
-    for work_type in work_types:
-        for exp_level in exp_levels:
+    # Facets return overlapping cards; skip postings already scraped this run
+    dedup = JobDeduplicator()
+    known = known_urls if known_urls is not None else known_job_urls(position, location)
+    max_pages = max_pages or settings.SCRAPER_MAX_PAGES
+    pages_fetched = 0
+
+    for work_type, exp_level in search_facets(facets or settings.SCRAPER_FACETS):
+        start = 0
+        for _ in range(max_pages):
             if len(all_jobs) >= max_results:
-                logger.info(f"✓ Reached max results: {max_results}")
-                _cache_jobs_to_supabase(position, location, all_jobs)
-                return all_jobs
+                break
 
             try:
-                base_url = (
-                    f"https://www.linkedin.com/jobs/search/?"
-                    f"keywords={position.replace(' ', '%20')}"
-                    f"&location={location.replace(' ', '%20')}"
-                    f"&{work_type_map.get(work_type, '')}"
-                    f"&{exp_level_map.get(exp_level, '')}"
-                    f"&radius=0"
+                # Fetch one page of job cards, with an extra throttle between pages
+                response = _fetch(
+                    session,
+                    search_url(position, location, work_type, exp_level, start),
+                    "search",
+                    SEARCH_PAGE_DELAY if start else None,
+                    timeout=10
                 )
-
-                # Fetch jobs page
-                response = session.get(base_url, timeout=10)
-                soup = BeautifulSoup(response.text, 'html.parser')
-                job_cards = soup.find_all('div', class_='base-card')
+                pages_fetched += 1
+                if response.status_code != 200:
+                    logger.info(f"Search page returned {response.status_code} for {work_type}, {exp_level} at {start}")
+                    break
+                job_cards = parse_job_cards(response.text)
 
                 if not job_cards:
-                    logger.info(f"No jobs found for {work_type}, {exp_level}")
-                    continue
+                    logger.info(f"No more jobs for {work_type}, {exp_level} after {start}")
+                    break
 
+                new_cards = 0
+                reached_known = False
                 for job_card in job_cards:
                     if len(all_jobs) >= max_results:
                         break
 
-                    # Slow down between job card fetches
-                    time.sleep(random.uniform(10.0, 20.5))
+                    if job_card["url"] and canonical_job_url(job_card["url"]) in known:
+                        reached_known = True
+                        continue
+                    if job_card["url"] and dedup.seen(job_card["url"]):
+                        logger.debug("Skipping already scraped job card")
+                        continue
+                    new_cards += 1
 
                     job_data = _process_job_card(
                         job_card,
                         position,
-                        work_type,
-                        exp_level,
+                        work_type or "",
+                        exp_level or "",
                         session
                     )
 
-                    if job_data:
+                    if job_data and dedup.add(job_data):
                         all_jobs.append(job_data)
                         logger.info(f"✓ Scraped: {job_data['title']} at {job_data['company']}")
 
-                # Extra throttle per batch of job cards
-                time.sleep(random.uniform(20, 40))
-
-                time.sleep(random.uniform(3, 7))
+                if reached_known or not new_cards:
+                    logger.info(
+                        f"Stopping {work_type or 'any'}, {exp_level or 'any'} at start={start}: "
+                        f"{'reached previously cached jobs' if reached_known else 'no new jobs'}"
+                    )
+                    break
+                start += len(job_cards)
 
             except Exception as e:
-                logger.error(f"Error scraping {work_type}, {exp_level}: {e}")
-                continue
+                logger.error(f"Error scraping {work_type}, {exp_level} at start={start}: {e}")
+                break
 
-    logger.info(f"✓ Scraping complete. Total jobs: {len(all_jobs)}")
+    logger.info(
+        f"✓ Scraping complete. Total jobs: {len(all_jobs)} from {pages_fetched} search pages "
+        f"(dedup ratio {dedup.stats.dedup_ratio:.1%})"
+    )
     _cache_jobs_to_supabase(position, location, all_jobs)
     return all_jobs
-
@@ -1,17 +1,37 @@
+import logging
 from difflib import SequenceMatcher
-from app.db.supabase_db import get_cached_jobs
+from typing import Optional
+
+import numpy as np
+
+from app.core.metrics import STAGE_SECONDS
+from app.core.profiling import profiled
+from app.core.tracing import traced
+from app.db.job_store import JobStore, freshness_cutoff, get_job_store
+from app.services import shared_cache
+from app.services.skill_taxonomy import canonicalize, skill_id, vocabulary
+
+logger = logging.getLogger(__name__)
 
 
 def normalize_skill(skill: str) -> str:
-    """Normalize skill string for comparison."""
-    return skill.lower().strip()
+    """Normalize skill string for comparison (aliases map to their canonical name)."""
+    return canonicalize(skill) or skill.lower().strip()
 
 
 def calculate_skill_similarity(user_skill: str, job_skill: str) -> float:
     """
-    Calculate similarity between two skills using SequenceMatcher.
+    Calculate similarity between two skills.
+
+    Skills known to the taxonomy compare by canonical id (k8s == kubernetes,
+    css != scss). SequenceMatcher is only used when either side is unknown.
     Returns a score between 0 and 1.
     """
+    user_id = skill_id(user_skill)
+    job_id = skill_id(job_skill)
+    if user_id is not None and job_id is not None:
+        return 1.0 if user_id == job_id else 0.0
+
     user_norm = normalize_skill(user_skill)
     job_norm = normalize_skill(job_skill)
 
@@ -19,20 +39,130 @@ def calculate_skill_similarity(user_skill: str, job_skill: str) -> float:
     if user_norm == job_norm:
         return 1.0
 
-    # Partial match using SequenceMatcher
-    similarity = SequenceMatcher(None, user_norm, job_norm).ratio()
+    return _fuzzy_similarity(user_norm, job_norm)
+
 
-    # Return similarity if above threshold (60%)
+def _fuzzy_similarity(user_norm: str, job_norm: str) -> float:
+    """Partial match using SequenceMatcher, zero below the 60% threshold."""
+    similarity = SequenceMatcher(None, user_norm, job_norm).ratio()
     return similarity if similarity > 0.6 else 0.0
 
 
-def match_jobs(skills: list[str], top_n: int = 5) -> list[dict]:
+def _popcount(words: np.ndarray) -> np.ndarray:
+    """Per-element popcount of a uint64 array."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words)
+    bytes_view = words.view(np.uint8).reshape(words.shape + (8,))
+    return _POPCOUNT_TABLE[bytes_view].sum(axis=-1)
+
+
+_POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _skill_column(bits: np.ndarray, sid: int) -> np.ndarray:
+    """Boolean vector: which rows have skill id `sid` set."""
+    return ((bits[:, sid >> 6] >> np.uint64(sid & 63)) & np.uint64(1)).astype(bool)
+
+
+@STAGE_SECONDS.time(stage="match_scoring")
+def rank_jobs(store: JobStore, skills: list[str], top_n: int = 5, since: Optional[int] = None) -> list[dict]:
+    """
+    Score every job in `store` against `skills` and return the top_n.
+
+    Exact overlap is computed for all jobs at once: the query's canonical
+    skill ids form a bitmask that is ANDed with each job's bitset row and
+    popcounted. Fuzzy matching only runs for query skills outside the
+    taxonomy (against the vocabulary, then broadcast via bitset columns)
+    and for the few jobs that carry skills outside the taxonomy.
+
+    With `since`, only jobs scraped at or after it are scored: rows of
+    expired scrape days are cut off the matrix before any work is done.
+    """
+    # Rows first: the store only grows, so the window stays within the matrix
+    stop, stale = store.scoring_rows(since)
+    bits, _, unknown_skills = store.skill_matrix()
+    bits = bits[:stop]
+    unknown_skills = {slot: found for slot, found in unknown_skills.items() if slot < stop}
+    n_jobs = bits.shape[0]
+    if not skills or n_jobs == 0:
+        return []
+
+    user_ids = [skill_id(s) for s in skills]
+    user_norms = [normalize_skill(s) for s in skills]
+    known_ids = sorted({sid for sid in user_ids if sid is not None})
+
+    # Exact matches: popcount(job_bits & query_bits)
+    query = np.zeros(bits.shape[1], dtype=np.uint64)
+    for sid in known_ids:
+        query[sid >> 6] |= np.uint64(1 << (sid & 63))
+    exact = _popcount(bits & query).sum(axis=1).astype(np.float64)
+    # A repeated query skill counts once per occurrence, as in the per-skill loop
+    repeats = {sid: user_ids.count(sid) for sid in known_ids if user_ids.count(sid) > 1}
+    for sid, count in repeats.items():
+        exact += _skill_column(bits, sid) * (count - 1)
+
+    total = exact.copy()
+    matched = exact.copy()
+
+    # Query skills outside the taxonomy: fuzzy against the vocabulary once,
+    # then take the best hit per job through the bitset columns
+    for user_id, user_norm in zip(user_ids, user_norms):
+        if user_id is not None:
+            continue
+        candidates = sorted(
+            ((sim, sid) for sid, name in enumerate(vocabulary()) if (sim := _fuzzy_similarity(user_norm, name))),
+            reverse=True,
+        )
+        best = np.zeros(n_jobs, dtype=np.float64)
+        for sim, sid in candidates:
+            best = np.where((best == 0) & _skill_column(bits, sid), sim, best)
+        if unknown_skills:
+            for slot, job_unknown in unknown_skills.items():
+                extra = max((_fuzzy_similarity(user_norm, c) for c in job_unknown), default=0.0)
+                best[slot] = max(best[slot], extra)
+        total += best
+        matched += best > 0
+
+    # Known query skills missing from a job may still fuzzy-match its unknown skills
+    for slot, job_unknown in unknown_skills.items():
+        row = bits[slot]
+        for user_id, user_norm in zip(user_ids, user_norms):
+            if user_id is None or (int(row[user_id >> 6]) >> (user_id & 63)) & 1:
+                continue
+            best_similarity = max((_fuzzy_similarity(user_norm, c) for c in job_unknown), default=0.0)
+            if best_similarity > 0:
+                total[slot] += best_similarity
+                matched[slot] += 1
+
+    if stale is not None:
+        matched[stale] = 0
+    hits = np.flatnonzero(matched > 0)
+    if hits.size == 0:
+        return []
+    scores = total[hits] / len(skills) * 100
+    order = np.argsort(-scores, kind="stable")[:top_n]
+
+    results = []
+    for i in order:
+        slot = hits[i]
+        job_copy = store.job_at_slot(slot).copy()
+        job_copy["match_score"] = round(float(scores[i]), 2)
+        job_copy["matched_skills_count"] = int(matched[slot])
+        results.append(job_copy)
+    return results
+
+
+@traced("matcher.match_jobs")
+@profiled
+def match_jobs(skills: list[str], top_n: int = 5, max_age_hours: Optional[float] = None) -> list[dict]:
     """
     Match extracted skills with jobs from Supabase using enhanced scoring.
 
     Args:
         skills (list[str]): List of skills extracted from resume
         top_n (int): Maximum number of job recommendations
+        max_age_hours (float): Only match jobs scraped this recently
+            (JOB_MAX_AGE_HOURS when None, 0 for no limit)
 
     Returns:
         List of matching job dictionaries with match_score (0-100)
@@ -40,53 +170,19 @@ def match_jobs(skills: list[str], top_n: int = 5) -> list[dict]:
     if not skills:
         return []
 
-    # Get jobs from Supabase cache (all)
-    jobs_db = get_cached_jobs() or []
-    if not jobs_db:
-        print("Warning: No jobs available in Supabase. Please scrape jobs first using /api/scrape-jobs-v2")
+    # Get jobs from the in-memory store over the Supabase cache
+    store = get_job_store()
+    if not len(store):
+        logger.warning("No jobs available in Supabase; jobs are scraped by the Celery worker every 24 hours")
         return []
 
-    matched_jobs = []
-
-    # Score each job based on skill matches
-    for job in jobs_db:
-        # Skip if job is not a dict
-        if not isinstance(job, dict):
-            continue
-
-        job_skills = job.get("skills", [])
-
-        # Handle skills as string or list
-        if isinstance(job_skills, str):
-            job_skills = [s.strip() for s in job_skills.split(",")]
-
-        if not job_skills:
-            continue
-
-        # Calculate match score
-        total_similarity = 0.0
-        matched_skills_count = 0
-
-        for user_skill in skills:
-            best_similarity = 0.0
-            for job_skill in job_skills:
-                similarity = calculate_skill_similarity(user_skill, job_skill)
-                best_similarity = max(best_similarity, similarity)
-
-            if best_similarity > 0:
-                total_similarity += best_similarity
-                matched_skills_count += 1
-
-        # Calculate percentage match
-        if matched_skills_count > 0:
-            match_percentage = (total_similarity / len(skills)) * 100
-
-            job_copy = job.copy()
-            job_copy["match_score"] = round(match_percentage, 2)
-            job_copy["matched_skills_count"] = matched_skills_count
-            matched_jobs.append(job_copy)
-
-    # Sort by score descending
-    matched_jobs.sort(key=lambda x: x["match_score"], reverse=True)
-
-    return matched_jobs[:top_n]
+    # Identical queries from any replica share one result per corpus version;
+    # the generation moves when this process folds its own new jobs in
+    since = freshness_cutoff(max_age_hours)
+    generation = getattr(store, "generation", 0)
+    cached = shared_cache.get_recommendations(store.version, skills, top_n, since, generation)
+    if cached is not None:
+        return cached
+    results = rank_jobs(store, skills, top_n=top_n, since=since)
+    shared_cache.put_recommendations(store.version, skills, top_n, results, since, generation)
+    return results
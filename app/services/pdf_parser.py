@@ -3,7 +3,7 @@ from pathlib import Path
 from fastapi import UploadFile, HTTPException
 from io import BytesIO
 
-from PyPDF2 import PdfReader
+from app.core.metrics import STAGE_SECONDS
 
 
 async def save_resume(file: UploadFile) -> Tuple[str, str]:
@@ -19,8 +19,9 @@ async def save_resume(file: UploadFile) -> Tuple[str, str]:
         raise ValueError("Only PDF files are allowed")
 
     # Upload to Supabase Storage
-    from app.services.supabase_storage import supabase_storage
+    from app.services.supabase_storage import get_supabase_storage
 
+    supabase_storage = get_supabase_storage()
     if not supabase_storage:
         raise HTTPException(status_code=500, detail="Supabase storage not initialized")
 
@@ -29,6 +30,7 @@ async def save_resume(file: UploadFile) -> Tuple[str, str]:
     return file_path, public_url
 
 
+@STAGE_SECONDS.time(stage="pdf_parse")
 def _extract_text_from_bytes(file_content: bytes) -> str:
     """
     Extract text from PDF bytes (synchronous).
@@ -39,6 +41,9 @@ def _extract_text_from_bytes(file_content: bytes) -> str:
     Returns:
         Extracted text content
     """
+    # Deferred: PyPDF2 is only needed once a resume arrives, not at API start
+    from PyPDF2 import PdfReader
+
     text = ""
     try:
         pdf_file = BytesIO(file_content)
@@ -64,8 +69,9 @@ async def extract_text_from_pdf(file_path: str) -> str:
         The text content as a string.
     """
     try:
-        from app.services.supabase_storage import supabase_storage
+        from app.services.supabase_storage import get_supabase_storage
 
+        supabase_storage = get_supabase_storage()
         if not supabase_storage:
             raise RuntimeError("Supabase storage not initialized")
 
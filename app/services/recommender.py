@@ -1,26 +1,34 @@
+import logging
+from typing import Optional
+
+from app.core.profiling import profiled
 from app.services.pdf_parser import extract_text_from_pdf
 from app.services.skill_extractor import extract_skills
 from app.services.matcher import match_jobs
 
+logger = logging.getLogger(__name__)
+
 
-async def recommend_jobs_from_pdf(file_path: str, top_n: int = 5) -> dict:
+@profiled
+async def recommend_jobs_from_pdf(file_path: str, top_n: int = 5, max_age_hours: Optional[float] = None) -> dict:
     """
     Main function to generate job recommendations from a resume PDF.
 
     Args:
         file_path (str): Path to the uploaded PDF resume
         top_n (int): Number of job recommendations to return
+        max_age_hours (float): Freshness window (JOB_MAX_AGE_HOURS when None, 0 for no limit)
 
     Returns:
         Dictionary containing extracted skills and recommended jobs with match scores
     """
     try:
         # Step 1: Extract text from PDF
-        print(f"📄 Extracting text from: {file_path}")
+        logger.debug("resume_extract file_path=%s", file_path)
         resume_text = await extract_text_from_pdf(file_path)
 
         if not resume_text:
-            print("❌ No text extracted from PDF")
+            logger.info("resume_extract file_path=%s chars=0", file_path)
             return {
                 "success": False,
                 "error": "Could not extract text from PDF",
@@ -28,15 +36,14 @@ async def recommend_jobs_from_pdf(file_path: str, top_n: int = 5) -> dict:
                 "recommendations": []
             }
 
-        print(f"✓ Extracted {len(resume_text)} characters from PDF")
-        print(f"📝 First 200 chars: {resume_text[:200]}")
+        logger.debug("resume_extract file_path=%s chars=%d", file_path, len(resume_text))
 
         # Step 2: Extract skills from resume text
         skills = extract_skills(resume_text, top_n=15)
-        print(f"🔍 Extracted {len(skills)} skills: {skills}")
+        logger.debug("resume_skills count=%d skills=%s", len(skills), skills)
 
         if not skills:
-            print("❌ No skills extracted from resume text")
+            logger.info("resume_skills file_path=%s count=0", file_path)
             return {
                 "success": False,
                 "error": "Could not extract skills from resume. Please ensure your resume contains technical skills like Python, Java, SQL, etc.",
@@ -51,9 +58,11 @@ async def recommend_jobs_from_pdf(file_path: str, top_n: int = 5) -> dict:
         # Step 3: Match skills with jobs from Supabase cache
         # Jobs are scraped automatically every 24h via Celery background task
         # match_jobs() internally gets jobs from Supabase via get_cached_jobs()
-        print(f"🎯 Matching {len(skills)} skills with available jobs...")
-        recommended_jobs = match_jobs(skills, top_n=top_n)
-        print(f"✓ Found {len(recommended_jobs)} job recommendations")
+        recommended_jobs = match_jobs(skills, top_n=top_n, max_age_hours=max_age_hours)
+        logger.info(
+            "resume_recommendations file_path=%s skills=%d recommendations=%d",
+            file_path, len(skills), len(recommended_jobs),
+        )
 
         return {
             "success": True,
@@ -64,9 +73,7 @@ async def recommend_jobs_from_pdf(file_path: str, top_n: int = 5) -> dict:
         }
 
     except Exception as e:
-        print(f"❌ EXCEPTION in recommend_jobs_from_pdf: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("recommend_jobs_from_pdf failed file_path=%s", file_path)
         return {
             "success": False,
             "error": f"Processing error: {str(e)}",
@@ -76,13 +83,14 @@ async def recommend_jobs_from_pdf(file_path: str, top_n: int = 5) -> dict:
         }
 
 
-def get_job_recommendations(skills: list[str], top_n: int = 5) -> dict:
+def get_job_recommendations(skills: list[str], top_n: int = 5, max_age_hours: Optional[float] = None) -> dict:
     """
     Get job recommendations based on provided skills.
 
     Args:
         skills (list[str]): List of skills to match
         top_n (int): Number of recommendations to return
+        max_age_hours (float): Freshness window (JOB_MAX_AGE_HOURS when None, 0 for no limit)
 
     Returns:
         Dictionary with recommendations and metadata
@@ -95,7 +103,7 @@ def get_job_recommendations(skills: list[str], top_n: int = 5) -> dict:
                 "recommendations": []
             }
 
-        recommended_jobs = match_jobs(skills, top_n=top_n)
+        recommended_jobs = match_jobs(skills, top_n=top_n, max_age_hours=max_age_hours)
 
         return {
             "success": True,
@@ -0,0 +1,385 @@
+"""
+Redis-backed scrape frontier shared by all Celery workers.
+
+Instead of each scrape task building its own URL list, search and detail
+URLs go into one frontier in the broker's Redis, and any number of
+`frontier_scrape` tasks pull work from it cooperatively:
+
+- `{ns}:queue`     ZSET of pending work items, scored so search pages come
+                   before detail pages (the next page is on its way while
+                   other workers drain this page's jobs), FIFO within a kind
+- `{ns}:inflight`  ZSET of leased items scored by lease deadline; items of
+                   a worker that died go back to the front of the queue
+                   once the lease expires. Detail pages stay leased until
+                   their job is merged into its cache file
+- `{ns}:seen`      ZSET of item key -> expiry (the canonical job URL for
+                   detail pages, the URL otherwise); pushing a key that is
+                   still in it is a no-op, so overlapping crawls fetch a
+                   page once
+- `{ns}:bucket:<host>`  token bucket shared by every worker, so the whole
+                   fleet stays within one politeness budget per host
+
+Every multi-key step is a Lua script, so it is atomic across workers.
+"""
+
+import json
+import logging
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from app.core.config import settings
+from app.core.metrics import SCRAPER_FRONTIER, SCRAPER_THROTTLE_SECONDS
+from app.services.dedup import canonical_job_url
+from app.services.linkedin_scraper_simple import (
+    CARD_FIELDS,
+    _fetch,
+    _get_session_with_retry,
+    _route,
+    build_job,
+    fetch_job_detail,
+    known_job_urls,
+    parse_job_cards,
+    search_facets,
+    search_url,
+    served_from_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+PRIORITY = {"search": 0, "detail": 1}
+# Score = priority * PRIORITY_STRIDE + enqueue time; keeps kinds apart for ~300 years
+PRIORITY_STRIDE = 1e10
+SEARCH_SEEN_TTL = 3600
+
+# KEYS: queue, seen. ARGV: now, seen_ttl, then (url, score, item) triples.
+# Returns the number of items enqueued.
+_PUSH = """
+local now = tonumber(ARGV[1])
+local expires = now + tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now)
+local added = 0
+for i = 3, #ARGV, 3 do
+    if not redis.call('ZSCORE', KEYS[2], ARGV[i]) then
+        redis.call('ZADD', KEYS[2], expires, ARGV[i])
+        redis.call('ZADD', KEYS[1], tonumber(ARGV[i + 1]), ARGV[i + 2])
+        added = added + 1
+    end
+end
+return added
+"""
+
+# KEYS: queue, inflight. ARGV: now, lease seconds, count.
+# Requeues expired leases, then leases up to `count` items.
+_POP = """
+local now = tonumber(ARGV[1])
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', now)
+for _, item in ipairs(expired) do
+    redis.call('ZREM', KEYS[2], item)
+    redis.call('ZADD', KEYS[1], 'NX', now, item)
+end
+local popped = redis.call('ZPOPMIN', KEYS[1], tonumber(ARGV[3]))
+local items = {}
+for i = 1, #popped, 2 do
+    redis.call('ZADD', KEYS[2], now + tonumber(ARGV[2]), popped[i])
+    table.insert(items, popped[i])
+end
+return items
+"""
+
+# KEYS: queue, inflight. ARGV: now, then leased items.
+# Moves items still leased back to the front of the queue.
+_RELEASE = """
+local released = 0
+for i = 2, #ARGV do
+    if redis.call('ZREM', KEYS[2], ARGV[i]) == 1 then
+        redis.call('ZADD', KEYS[1], 'NX', tonumber(ARGV[1]), ARGV[i])
+        released = released + 1
+    end
+end
+return released
+"""
+
+# KEYS: bucket. ARGV: rate (tokens/s), burst.
+# Takes a token and returns "0", or returns the seconds until one is available.
+_ACQUIRE = """
+if redis.replicate_commands then redis.replicate_commands() end
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 60)
+return tostring(wait)
+"""
+
+
+def _redis_client():
+    import redis
+    return redis.Redis.from_url(settings.SCRAPER_FRONTIER_REDIS_URL or settings.CELERY_BROKER_URL)
+
+
+class ScrapeFrontier:
+    """Priority queue, seen-set and per-host rate limit in one Redis namespace."""
+
+    def __init__(self, client=None, namespace: Optional[str] = None):
+        self.redis = client if client is not None else _redis_client()
+        self.namespace = namespace or settings.SCRAPER_FRONTIER_NAMESPACE
+        self._push = self.redis.register_script(_PUSH)
+        self._pop = self.redis.register_script(_POP)
+        self._release = self.redis.register_script(_RELEASE)
+        self._acquire = self.redis.register_script(_ACQUIRE)
+
+    def _key(self, name: str) -> str:
+        return f"{self.namespace}:{name}"
+
+    @staticmethod
+    def _encode(item: Dict) -> str:
+        # Stable encoding: the same item always maps to the same ZSET member
+        return json.dumps(item, sort_keys=True, separators=(",", ":"))
+
+    def push(self, items: Iterable[Dict], seen_ttl: Optional[float] = None) -> int:
+        """
+        Enqueue items ({"kind", "url", ...}) whose key (their "key", else
+        their URL) has not been seen within its TTL. Returns how many were new.
+        """
+        items = list(items)
+        if not items:
+            return 0
+        ttl = seen_ttl if seen_ttl is not None else settings.SCRAPER_FRONTIER_SEEN_TTL_HOURS * 3600
+        now = time.time()
+        args = [now, ttl]
+        for item in items:
+            score = PRIORITY.get(item["kind"], len(PRIORITY)) * PRIORITY_STRIDE + now
+            args.extend([item.get("key") or item["url"], score, self._encode(item)])
+        added = int(self._push(keys=[self._key("queue"), self._key("seen")], args=args))
+        SCRAPER_FRONTIER.inc(added, event="enqueued")
+        if len(items) - added:
+            SCRAPER_FRONTIER.inc(len(items) - added, event="already_seen")
+        return added
+
+    def pop(self, count: int = 1, lease_seconds: Optional[float] = None) -> List[Tuple[str, Dict]]:
+        """Lease up to `count` items; returns (token, item) pairs to `ack` when done."""
+        lease = lease_seconds if lease_seconds is not None else settings.SCRAPER_FRONTIER_LEASE_SECONDS
+        raw = self._pop(keys=[self._key("queue"), self._key("inflight")], args=[time.time(), lease, count])
+        leased = []
+        for member in raw:
+            token = member.decode("utf-8") if isinstance(member, bytes) else member
+            leased.append((token, json.loads(token)))
+        return leased
+
+    def ack(self, token: str) -> None:
+        self.redis.zrem(self._key("inflight"), token)
+
+    def extend(self, tokens: Iterable[str], lease_seconds: Optional[float] = None) -> None:
+        """Renew the leases of items still being worked on."""
+        lease = lease_seconds if lease_seconds is not None else settings.SCRAPER_FRONTIER_LEASE_SECONDS
+        deadline = time.time() + lease
+        leases = {token: deadline for token in tokens}
+        if leases:
+            self.redis.zadd(self._key("inflight"), leases, xx=True)
+
+    def release(self, tokens: Iterable[str]) -> int:
+        """Requeue leased items whose work was lost; returns how many were still leased."""
+        tokens = list(tokens)
+        if not tokens:
+            return 0
+        released = int(self._release(keys=[self._key("queue"), self._key("inflight")], args=[time.time(), *tokens]))
+        SCRAPER_FRONTIER.inc(released, event="released")
+        return released
+
+    def acquire(self, host: str, rate: float, burst: float) -> float:
+        """Try to take a request token for `host`; 0.0 on success, else seconds to wait."""
+        return float(self._acquire(keys=[self._key(f"bucket:{host}")], args=[rate, burst]))
+
+    def wait_for_token(self, host: str, rate: Optional[float] = None, burst: Optional[float] = None) -> float:
+        """Block until the shared bucket for `host` grants a request. Returns seconds waited."""
+        rate = rate if rate is not None else settings.SCRAPER_HOST_RATE_PER_MIN / 60
+        burst = burst if burst is not None else settings.SCRAPER_HOST_BURST
+        if rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            wait = self.acquire(host, rate, burst)
+            if wait <= 0:
+                break
+            SCRAPER_THROTTLE_SECONDS.inc(wait)
+            time.sleep(wait)
+            waited += wait
+        return waited
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": self.redis.zcard(self._key("queue")),
+            "inflight": self.redis.zcard(self._key("inflight")),
+            "seen": self.redis.zcard(self._key("seen")),
+        }
+
+    def clear(self) -> None:
+        keys = list(self.redis.scan_iter(match=f"{self.namespace}:*"))
+        if keys:
+            self.redis.delete(*keys)
+
+
+def search_item(position: str, location: str, work_type: Optional[str], exp_level: Optional[str],
+                start: int = 0, page: int = 1) -> Dict:
+    return {
+        "kind": "search",
+        "url": search_url(position, location, work_type, exp_level, start),
+        "position": position,
+        "location": location,
+        "work_type": work_type or "",
+        "exp_level": exp_level or "",
+        "start": start,
+        "page": page,
+    }
+
+
+def seed_frontier(frontier: ScrapeFrontier, combos: Iterable[Tuple[str, str]], facets: Optional[str] = None) -> int:
+    """Enqueue the first search page of every facet of every (position, location)."""
+    items = [
+        search_item(position, location, work_type, exp_level)
+        for position, location in combos
+        for work_type, exp_level in search_facets(facets or settings.SCRAPER_FACETS)
+    ]
+    return frontier.push(items, seen_ttl=SEARCH_SEEN_TTL)
+
+
+class FrontierWorker:
+    """
+    Drains the frontier: search pages enqueue their detail pages (and the
+    next page while it still yields new jobs), detail pages become jobs.
+    Jobs are returned grouped by (position, location) for merge_jobs; their
+    detail pages stay leased (renewed while the worker runs) until `saved`
+    acks them or `release` requeues them, so a failed merge or a dead
+    worker does not lose pages that are already in the seen-set.
+    """
+
+    def __init__(self, frontier: ScrapeFrontier, max_pages: Optional[int] = None):
+        self.frontier = frontier
+        self.session = _get_session_with_retry()
+        self.max_pages = max_pages or settings.SCRAPER_MAX_PAGES
+        self.jobs: Dict[Tuple[str, str], List[Dict]] = defaultdict(list)
+        self.leases: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        self._known: Dict[Tuple[str, str], set] = {}
+
+    def _known_urls(self, position: str, location: str) -> set:
+        key = (position, location)
+        if key not in self._known:
+            self._known[key] = known_job_urls(position, location)
+        return self._known[key]
+
+    def _polite(self, url: str) -> None:
+        # Fresh HTTP cache hits never reach the host, so they cost no token
+        if served_from_cache(self.session, _route(url)):
+            return
+        self.frontier.wait_for_token(urlsplit(url).netloc or "linkedin")
+
+    def process(self, item: Dict) -> bool:
+        """Handle one item; True if it produced a job that is not saved yet."""
+        if item["kind"] == "search":
+            self._process_search(item)
+        elif item["kind"] == "detail":
+            return self._process_detail(item)
+        else:
+            logger.warning(f"Unknown frontier item kind: {item['kind']}")
+        return False
+
+    def saved(self, position: str, location: str) -> None:
+        """The jobs for (position, location) were merged: finish their detail pages."""
+        self.jobs.pop((position, location), None)
+        for token in self.leases.pop((position, location), []):
+            self.frontier.ack(token)
+
+    def release(self) -> int:
+        """Drop every unsaved job and requeue its detail page for another worker."""
+        released = self.frontier.release(token for tokens in self.leases.values() for token in tokens)
+        self.jobs.clear()
+        self.leases.clear()
+        return released
+
+    def _process_search(self, item: Dict) -> None:
+        self._polite(item["url"])
+        response = _fetch(self.session, item["url"], "search", timeout=10)
+        if response.status_code != 200:
+            logger.info(f"Search page returned {response.status_code}: {item['url']}")
+            return
+        cards = parse_job_cards(response.text)
+        known = self._known_urls(item["position"], item["location"])
+        fresh = [c for c in cards if c.get("url") and canonical_job_url(c["url"]) not in known]
+        # Fetched and rate limited by the real URL; seen by the canonical one, so
+        # a posting reached through different slugs or tracking URLs is fetched once
+        details = [{
+            "kind": "detail",
+            "url": card["url"],
+            "key": canonical_job_url(card["url"]),
+            "card": card,
+            "position": item["position"],
+            "location": item["location"],
+            "work_type": item["work_type"],
+            "exp_level": item["exp_level"],
+        } for card in fresh]
+        added = self.frontier.push(details)
+
+        # Same stopping rule as scrape_linkedin_jobs: stop at known jobs or a page with nothing new
+        if cards and added and len(fresh) == len(cards) and item["page"] < self.max_pages:
+            self.frontier.push([search_item(
+                item["position"], item["location"], item["work_type"] or None, item["exp_level"] or None,
+                item["start"] + len(cards), item["page"] + 1,
+            )], seen_ttl=SEARCH_SEEN_TTL)
+
+    def _process_detail(self, item: Dict) -> bool:
+        card = item["card"]
+        if not all(card.get(field) for field in CARD_FIELDS):
+            return False
+        self._polite(card["url"])
+        html = fetch_job_detail(self.session, card["url"])
+        job = build_job(card, item["position"], item["work_type"], item["exp_level"], html)
+        self.jobs[(item["position"], item["location"])].append(job)
+        logger.info(f"✓ Scraped: {job['title']} at {job['company']}")
+        return True
+
+    def run(self, max_items: Optional[int] = None, max_seconds: Optional[float] = None,
+            idle_seconds: float = 5.0) -> int:
+        """Process items until the budget is spent or the queue stays empty for idle_seconds."""
+        deadline = time.monotonic() + max_seconds if max_seconds else None
+        processed = 0
+        idle_since = None
+        while (max_items is None or processed < max_items) and (deadline is None or time.monotonic() < deadline):
+            if self.leases:
+                self.frontier.extend(token for tokens in self.leases.values() for token in tokens)
+            leased = self.frontier.pop(1)
+            if not leased:
+                idle_since = idle_since or time.monotonic()
+                if time.monotonic() - idle_since >= idle_seconds:
+                    break
+                time.sleep(min(0.5, idle_seconds))
+                continue
+            idle_since = None
+            token, item = leased[0]
+            unsaved = False
+            try:
+                unsaved = self.process(item)
+                SCRAPER_FRONTIER.inc(event="processed")
+            except Exception as e:
+                SCRAPER_FRONTIER.inc(event="failed")
+                logger.error(f"Frontier item failed ({item.get('kind')} {item.get('url')}): {e}")
+            finally:
+                if unsaved:
+                    self.leases[(item["position"], item["location"])].append(token)
+                else:
+                    # Failed items are dropped rather than retried forever; the next crawl picks them up
+                    self.frontier.ack(token)
+            processed += 1
+        return processed
@@ -0,0 +1,91 @@
+"""
+Recorded LinkedIn HTML fixtures for offline scraper development.
+
+With SCRAPER_RECORD_DIR set, the scraper saves every successful search and
+job-detail response here. `benchmarks/replay_server.py` serves them back
+(point SCRAPER_BASE_URL at it), so parsing and throughput can be measured
+without live LinkedIn runs.
+
+Layout: `<dir>/<kind>/<sha1 of path+query>.html` plus an append-only
+`index.jsonl` with one {"key", "kind", "file", "url"} line per fixture.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Dict, Optional
+from urllib.parse import unquote, urlsplit
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "index.jsonl"
+
+
+def fixture_key(url: str) -> str:
+    """Host-independent, unquoted path plus query, so recorded and replayed URLs match."""
+    parts = urlsplit(url)
+    return unquote(parts.path) + (f"?{unquote(parts.query)}" if parts.query else "")
+
+
+class FixtureStore:
+    def __init__(self, root: str):
+        self.root = root
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, Dict]] = None
+
+    def _file_name(self, kind: str, key: str) -> str:
+        return os.path.join(kind, hashlib.sha1(key.encode("utf-8")).hexdigest()[:20] + ".html")
+
+    def save(self, kind: str, url: str, html: str) -> str:
+        key = fixture_key(url)
+        relative = self._file_name(kind, key)
+        path = os.path.join(self.root, relative)
+        with self._lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as fh:
+                fh.write(html)
+            entry = {"key": key, "kind": kind, "file": relative, "url": url}
+            with open(os.path.join(self.root, INDEX_FILE), "a", encoding="utf-8") as fh:
+                fh.write(json.dumps(entry) + "\n")
+            if self._index is not None:
+                self._index[key] = entry
+        return path
+
+    def index(self) -> Dict[str, Dict]:
+        """key -> entry; later recordings of the same URL win."""
+        if self._index is None:
+            entries = {}
+            index_path = os.path.join(self.root, INDEX_FILE)
+            if os.path.exists(index_path):
+                with open(index_path, encoding="utf-8") as fh:
+                    for line in fh:
+                        if line.strip():
+                            entry = json.loads(line)
+                            entries[entry["key"]] = entry
+            self._index = entries
+        return self._index
+
+    def load(self, url_or_key: str) -> Optional[str]:
+        key = url_or_key if url_or_key.startswith("/") else fixture_key(url_or_key)
+        entry = self.index().get(key)
+        if entry is None:
+            return None
+        with open(os.path.join(self.root, entry["file"]), encoding="utf-8") as fh:
+            return fh.read()
+
+    def by_kind(self, kind: str):
+        return [entry for entry in self.index().values() if entry["kind"] == kind]
+
+
+_recorders: Dict[str, FixtureStore] = {}
+
+
+def record_response(root: str, kind: str, url: str, html: str) -> None:
+    """Save a fetched page under `root`; never lets recording break a scrape."""
+    try:
+        store = _recorders.setdefault(root, FixtureStore(root))
+        store.save(kind, url, html)
+    except Exception as e:
+        logger.warning(f"Could not record fixture for {url}: {e}")
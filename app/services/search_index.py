@@ -0,0 +1,175 @@
+"""
+Full-text job search - tokenized inverted index with BM25 ranking
+"""
+
+import math
+import re
+from array import array
+from typing import Dict, Hashable, List, Tuple
+
+import numpy as np
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Field weights folded into term frequency (a simple BM25F variant)
+FIELD_WEIGHTS = (("title", 3), ("company", 2), ("description", 1))
+
+MAX_TF = 0xFFFF
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our "
+    "that the this to we will with you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with stopwords removed; keeps c++, c#, node.js intact."""
+    if not text:
+        return []
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+class SearchIndex:
+    """
+    Append-only inverted index over title, company and description.
+
+    Each term owns two parallel typed arrays (doc ids as uint32, weighted
+    term frequencies as uint16) instead of Python lists of tuples, which
+    keeps a 100k-job index to a few tens of MB. Documents are added one at
+    a time, so the index grows incrementally with ingest. Scoring views
+    the postings as numpy arrays and accumulates into a dense score vector.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._doc_keys: List[Hashable] = []
+        self._doc_len = array("I")
+        self._total_len = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_keys)
+
+    def add(self, key: Hashable, job: Dict) -> int:
+        """Index one job under an external key. Returns its internal doc id."""
+        doc_id = len(self._doc_keys)
+        tf: Dict[str, int] = {}
+        length = 0
+        for field, weight in FIELD_WEIGHTS:
+            for token in tokenize(job.get(field) or ""):
+                tf[token] = tf.get(token, 0) + weight
+                length += weight
+
+        for term, freq in tf.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = (array("I"), array("H"))
+            postings[0].append(doc_id)
+            postings[1].append(min(freq, MAX_TF))
+
+        self._doc_keys.append(key)
+        self._doc_len.append(length)
+        self._total_len += length
+        return doc_id
+
+    def search(self, query: str, limit: int = 10, exclude=None) -> List[Tuple[Hashable, float]]:
+        """
+        Rank documents for a free-text query with BM25.
+
+        Args:
+            exclude: Doc ids never to return (deleted or superseded documents)
+
+        Returns:
+            List of (key, score) pairs, best first
+        """
+        terms = [t for t in dict.fromkeys(tokenize(query)) if t in self._postings]
+        postings = [
+            (np.frombuffer(self._postings[t][0], dtype=np.uint32), np.frombuffer(self._postings[t][1], dtype=np.uint16))
+            for t in terms
+        ]
+        hits = bm25_rank(postings, np.frombuffer(self._doc_len, dtype=np.uint32), self._total_len, limit, exclude)
+        return [(self._doc_keys[i], score) for i, score in hits]
+
+    def flatten(self) -> Tuple[Dict[str, Tuple[int, int]], np.ndarray, np.ndarray, np.ndarray, int]:
+        """
+        Concatenate all posting lists for `FlatSearchIndex`.
+
+        Returns:
+            (term -> (start, end) into the arrays, doc ids, term frequencies,
+            document lengths, total length)
+        """
+        spans: Dict[str, Tuple[int, int]] = {}
+        ids_parts, tfs_parts = [], []
+        offset = 0
+        for term, (ids, tfs) in self._postings.items():
+            spans[term] = (offset, offset + len(ids))
+            offset += len(ids)
+            ids_parts.append(np.frombuffer(ids, dtype=np.uint32))
+            tfs_parts.append(np.frombuffer(tfs, dtype=np.uint16))
+        ids = np.concatenate(ids_parts) if ids_parts else np.zeros(0, dtype=np.uint32)
+        tfs = np.concatenate(tfs_parts) if tfs_parts else np.zeros(0, dtype=np.uint16)
+        return spans, ids, tfs, np.frombuffer(self._doc_len, dtype=np.uint32).copy(), self._total_len
+
+
+class FlatSearchIndex:
+    """
+    Read-only BM25 index over flat arrays, as produced by
+    `SearchIndex.flatten`. The arrays may be views into a memory-mapped
+    file, so several processes can search one copy. Results are internal
+    doc ids rather than external keys.
+    """
+
+    def __init__(self, spans: Dict[str, Tuple[int, int]], ids: np.ndarray, tfs: np.ndarray,
+                 doc_len: np.ndarray, total_len: int):
+        self._spans = spans
+        self._ids = ids
+        self._tfs = tfs
+        self._doc_len = doc_len
+        self._total_len = total_len
+
+    def __len__(self) -> int:
+        return len(self._doc_len)
+
+    def search(self, query: str, limit: int = 10, exclude=None) -> List[Tuple[int, float]]:
+        """Rank documents for a free-text query; list of (doc id, score), best first."""
+        postings = []
+        for term in dict.fromkeys(tokenize(query)):
+            span = self._spans.get(term)
+            if span is not None:
+                postings.append((self._ids[span[0]:span[1]], self._tfs[span[0]:span[1]]))
+        return bm25_rank(postings, self._doc_len, self._total_len, limit, exclude)
+
+
+def bm25_rank(postings: List[Tuple[np.ndarray, np.ndarray]], doc_len: np.ndarray, total_len: int,
+              limit: int, exclude=None) -> List[Tuple[int, float]]:
+    """
+    BM25 over one (doc ids, term frequencies) pair per query term.
+    Docs in `exclude` still count towards document frequencies and the
+    average length until the index is rebuilt.
+
+    Returns:
+        List of (doc id, score) pairs, best first
+    """
+    n_docs = len(doc_len)
+    if not n_docs or not postings or limit <= 0:
+        return []
+
+    avg_len = total_len / n_docs or 1.0
+    scores = np.zeros(n_docs, dtype=np.float32)
+    for ids, tfs in postings:
+        tfs = tfs.astype(np.float32)
+        df = len(ids)
+        idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+        norm = BM25_K1 * (1.0 - BM25_B + BM25_B * doc_len[ids] / avg_len)
+        # doc ids are unique within one posting list, so fancy-index += is safe
+        scores[ids] += idf * tfs * (BM25_K1 + 1.0) / (tfs + norm)
+    if exclude is not None and len(exclude):
+        scores[exclude] = 0.0
+
+    hits = np.flatnonzero(scores)
+    if hits.size > limit:
+        hits = hits[np.argpartition(scores[hits], -limit)[-limit:]]
+    hits = hits[np.argsort(-scores[hits], kind="stable")]
+    return [(int(i), float(scores[i])) for i in hits]
@@ -0,0 +1,249 @@
+"""
+Redis cache tier shared by all API replicas (on the Celery broker's Redis
+unless SHARED_CACHE_REDIS_URL is set).
+
+- corpus version: `{ns}:corpus:version`, the result of get_corpus_version,
+  kept for SHARED_CACHE_VERSION_TTL so replicas stop listing the bucket
+  themselves
+- corpus: `{ns}:corpus:<version>`, the deduplicated job list as zlib'd JSON
+- recommendations: `{ns}:reco:<version>:<hash>`, match_jobs results keyed
+  by the store generation, normalized skill multiset, top_n and freshness
+  cutoff
+
+Misses are single-flight: one replica takes `<key>:lock` (holding a token
+of its own, so it only ever releases its own lock) and computes the
+value while the others wait for it, so Supabase sees one list/download per
+change however many replicas run. save_jobs and archive_old_caches drop the
+version key and publish on `{ns}:invalidate`; replicas listening there
+re-check their store at once instead of waiting for their refresh interval.
+
+Every operation degrades to a miss when Redis is unreachable, and Redis is
+then skipped for SHARED_CACHE_RETRY_SECONDS.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+import zlib
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.metrics import SHARED_CACHE
+
+logger = logging.getLogger(__name__)
+
+LOCK_SECONDS = 120
+WAIT_POLL_SECONDS = 0.05
+
+# KEYS: lock. ARGV: token. Deletes the lock only while it is still ours: one
+# that outlived LOCK_SECONDS may already belong to another replica.
+_RELEASE_LOCK = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+_client = None
+_client_lock = threading.Lock()
+_down_until = 0.0
+
+
+def _key(*parts: str) -> str:
+    return ":".join((settings.SHARED_CACHE_NAMESPACE,) + parts)
+
+
+def _connect(**options):
+    import redis
+
+    return redis.Redis.from_url(settings.SHARED_CACHE_REDIS_URL or settings.CELERY_BROKER_URL,
+                                socket_connect_timeout=1, **options)
+
+
+def _redis():
+    """Shared client, or None when disabled or recently unreachable."""
+    global _client
+    if not settings.SHARED_CACHE_ENABLED or time.monotonic() < _down_until:
+        return None
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = _connect(socket_timeout=5)
+    return _client
+
+
+def _failed(kind: str, e: Exception) -> None:
+    global _down_until
+    _down_until = time.monotonic() + settings.SHARED_CACHE_RETRY_SECONDS
+    SHARED_CACHE.inc(kind=kind, result="error")
+    logger.warning(f"Shared cache unavailable ({kind}): {e}; retrying in {settings.SHARED_CACHE_RETRY_SECONDS}s")
+
+
+def _encode(value: Any) -> bytes:
+    return zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"), 3)
+
+
+def _decode(raw: bytes) -> Any:
+    return json.loads(zlib.decompress(raw))
+
+
+def get_or_compute(kind: str, key: str, ttl: int, compute: Callable[[], Any],
+                   cacheable: Callable[[Any], bool] = lambda value: True, wait: float = 30.0) -> Any:
+    """
+    Return the cached value at `key`, or compute it once cluster-wide.
+
+    The replica that wins `<key>:lock` runs `compute` and stores the result
+    for `ttl` seconds (if `cacheable`); the others poll for up to `wait`
+    seconds and compute it themselves only if it never shows up.
+    """
+    client = _redis()
+    if client is None:
+        return compute()
+    try:
+        raw = client.get(key)
+        if raw is not None:
+            SHARED_CACHE.inc(kind=kind, result="hit")
+            return _decode(raw)
+        token = uuid.uuid4().hex
+        leader = client.set(f"{key}:lock", token, nx=True, ex=LOCK_SECONDS)
+    except Exception as e:
+        _failed(kind, e)
+        return compute()
+
+    if not leader:
+        deadline = time.monotonic() + wait
+        try:
+            while time.monotonic() < deadline:
+                time.sleep(WAIT_POLL_SECONDS)
+                raw = client.get(key)
+                if raw is not None:
+                    SHARED_CACHE.inc(kind=kind, result="hit")
+                    return _decode(raw)
+                if not client.exists(f"{key}:lock"):
+                    break
+        except Exception as e:
+            _failed(kind, e)
+        SHARED_CACHE.inc(kind=kind, result="miss")
+        return compute()
+
+    SHARED_CACHE.inc(kind=kind, result="miss")
+    try:
+        value = compute()
+        payload = _encode(value) if cacheable(value) else None
+        if payload is not None and len(payload) > settings.SHARED_CACHE_MAX_VALUE_MB * 1024 * 1024:
+            logger.warning(f"Not caching {key}: {len(payload) / 1e6:.1f} MB exceeds SHARED_CACHE_MAX_VALUE_MB")
+            payload = None
+        if payload is not None:
+            try:
+                client.set(key, payload, ex=ttl)
+            except Exception as e:
+                _failed(kind, e)
+        return value
+    finally:
+        try:
+            client.eval(_RELEASE_LOCK, 1, f"{key}:lock", token)
+        except Exception:
+            pass
+
+
+def corpus_version(compute: Callable[[], str]) -> str:
+    """The corpus version, from Redis or `compute` (never caches "empty")."""
+    return get_or_compute(
+        "version", _key("corpus", "version"), settings.SHARED_CACHE_VERSION_TTL, compute,
+        cacheable=lambda version: version != "empty", wait=10.0,
+    )
+
+
+def corpus(version: str, load: Callable[[], List[Dict]]) -> List[Dict]:
+    """The job list for `version`, downloaded from Supabase by one replica only."""
+    if version == "empty":
+        return load()
+    return get_or_compute(
+        "corpus", _key("corpus", version), settings.SHARED_CACHE_CORPUS_TTL, load,
+        cacheable=bool, wait=120.0,
+    )
+
+
+def recommendation_key(version: str, skills: List[str], top_n: int, since: Optional[int] = None,
+                       generation: int = 0) -> str:
+    """
+    Cache key for match_jobs: order-insensitive, duplicates kept (they change
+    scores). `generation` tells apart stores of one version that took in
+    jobs ingested by their own process.
+    """
+    from app.services.matcher import normalize_skill
+
+    normalized = sorted(normalize_skill(s) for s in skills)
+    digest = hashlib.sha1(json.dumps([normalized, top_n, since, generation]).encode("utf-8")).hexdigest()[:24]
+    return _key("reco", version, digest)
+
+
+def get_recommendations(version: str, skills: List[str], top_n: int,
+                        since: Optional[int] = None, generation: int = 0) -> Optional[List[Dict]]:
+    client = _redis()
+    if client is None:
+        return None
+    try:
+        raw = client.get(recommendation_key(version, skills, top_n, since, generation))
+    except Exception as e:
+        _failed("reco", e)
+        return None
+    SHARED_CACHE.inc(kind="reco", result="hit" if raw is not None else "miss")
+    return _decode(raw) if raw is not None else None
+
+
+def put_recommendations(version: str, skills: List[str], top_n: int, results: List[Dict],
+                        since: Optional[int] = None, generation: int = 0) -> None:
+    client = _redis()
+    if client is None:
+        return
+    try:
+        client.set(recommendation_key(version, skills, top_n, since, generation), _encode(results),
+                   ex=settings.SHARED_CACHE_RECO_TTL)
+    except Exception as e:
+        _failed("reco", e)
+
+
+def invalidate_corpus(reason: str) -> None:
+    """Drop the cached version and tell every listening replica the corpus changed."""
+    client = _redis()
+    if client is None:
+        return
+    try:
+        client.delete(_key("corpus", "version"))
+        client.publish(_key("invalidate"), json.dumps({"reason": reason, "at": time.time()}))
+        SHARED_CACHE.inc(kind="invalidate", result="published")
+    except Exception as e:
+        _failed("invalidate", e)
+
+
+def _listen(on_invalidate: Callable[[Dict], None]) -> None:
+    # Own connection without a read timeout: the subscription idles for hours
+    client = _connect(health_check_interval=30)
+    while True:
+        try:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(_key("invalidate"))
+            for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                try:
+                    event = json.loads(message["data"])
+                except ValueError:
+                    event = {}
+                SHARED_CACHE.inc(kind="invalidate", result="received")
+                logger.info(f"Corpus invalidated: {event.get('reason', 'unknown')}")
+                on_invalidate(event)
+        except Exception as e:
+            SHARED_CACHE.inc(kind="invalidate", result="error")
+            logger.warning(f"Invalidation subscription lost: {e}; resubscribing in {settings.SHARED_CACHE_RETRY_SECONDS}s")
+            time.sleep(settings.SHARED_CACHE_RETRY_SECONDS)
+
+
+def start_invalidation_listener(on_invalidate: Callable[[Dict], None]) -> None:
+    """Subscribe to invalidations in a daemon thread (no-op when the cache is disabled)."""
+    if settings.SHARED_CACHE_ENABLED:
+        threading.Thread(target=_listen, args=(on_invalidate,), name="shared-cache-listener", daemon=True).start()
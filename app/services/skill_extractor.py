@@ -1,5 +1,13 @@
+import functools
+import logging
 import re
 import warnings
+from typing import List, Tuple
+
+from app.core.metrics import STAGE_SECONDS
+from app.services.skill_taxonomy import canonicalize, display_name
+
+logger = logging.getLogger(__name__)
 
 # Suppress warnings
 warnings.filterwarnings('ignore')
@@ -112,6 +120,22 @@ TECHNICAL_SKILLS = {
     'defi', 'nft', 'cryptocurrency', 'bitcoin', 'hyperledger',
 }
 
+@functools.lru_cache(maxsize=None)
+def compiled_skill_patterns() -> List[Tuple[str, "re.Pattern", str]]:
+    """
+    (literal, word-boundary pattern, display name) per skill, compiled
+    once. There are more skills than the `re` module caches, so compiling
+    per call meant recompiling most patterns on every resume.
+    """
+    patterns = []
+    for skill in TECHNICAL_SKILLS:
+        literal = skill.lower()
+        pattern = re.compile(r'\b' + re.escape(literal) + r'\b')
+        patterns.append((literal, pattern, display_name(canonicalize(skill) or skill)))
+    return patterns
+
+
+@STAGE_SECONDS.time(stage="skill_extraction")
 def extract_skills(text: str, top_n: int = 10) -> list[str]:
     """
     Extract skills from resume text using keyword matching.
@@ -127,7 +151,7 @@ def extract_skills(text: str, top_n: int = 10) -> list[str]:
         List of skill strings
     """
     if not text:
-        print("⚠️ Empty text provided to extract_skills")
+        logger.warning("extract_skills called with empty text")
         return []
 
     # Convert text to lowercase for matching
@@ -136,37 +160,39 @@ def extract_skills(text: str, top_n: int = 10) -> list[str]:
     # Normalize text: remove extra whitespace and special characters for better matching
     text_normalized = re.sub(r'[^\w\s.#+]', ' ', text_lower)
 
-    print(f"🔍 Searching for skills in text ({len(text)} chars)...")
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("skill_search chars=%d", len(text))
 
-    # Find all matched skills
+    # Find all matched skills; aliases (k8s, postgres, ...) fold into their canonical skill
     matched_skills = []
     skill_count = {}
 
-    for skill in TECHNICAL_SKILLS:
-        # Use word boundary matching to avoid partial matches
-        pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-
-        # Count occurrences
-        matches = re.findall(pattern, text_normalized)
-        if matches:
-            count = len(matches)
-            # Capitalize skill name properly
-            skill_formatted = skill.upper() if len(skill) <= 3 else skill.title()
+    for literal, pattern, skill_formatted in compiled_skill_patterns():
+        # A plain substring scan rules out most skills before the regex runs
+        if literal not in text_normalized:
+            continue
 
+        # Use word boundary matching to avoid partial matches
+        count = len(pattern.findall(text_normalized))
+        if count:
             if skill_formatted not in matched_skills:
                 matched_skills.append(skill_formatted)
-                skill_count[skill_formatted] = count
-                print(f"  ✓ Found: {skill_formatted} ({count}x)")
+                skill_count[skill_formatted] = 0
+            skill_count[skill_formatted] += count
+            if debug:
+                logger.debug("skill_found skill=%s count=%d", skill_formatted, count)
 
     if not matched_skills:
-        print("❌ No skills matched from the skill database")
-        print(f"📝 Text sample (first 500 chars): {text[:500]}")
+        logger.info("skill_extraction matched=0 chars=%d", len(text))
+        if debug:
+            logger.debug("skill_extraction text_sample=%r", text[:500])
         return []
 
     # Sort by frequency, then alphabetically
     matched_skills.sort(key=lambda x: (-skill_count.get(x, 0), x))
 
-    print(f"✓ Extracted {len(matched_skills)} unique skills")
+    logger.debug("skill_extraction matched=%d", len(matched_skills))
 
     # Return top_n skills
     return matched_skills[:top_n]
@@ -0,0 +1,131 @@
+"""
+Canonical skill taxonomy - maps skill aliases to one canonical name and a
+stable integer id, shared by the resume extractor, the scraper and the matcher.
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+# alias -> canonical name. Canonical names must be in TECHNICAL_SKILLS.
+SKILL_ALIASES: Dict[str, str] = {
+    # Languages
+    "golang": "go",
+    "cpp": "c++",
+    "csharp": "c#",
+    "js": "javascript",
+    "ts": "typescript",
+    "es6": "javascript",
+    "es7": "javascript",
+    "es8": "javascript",
+    # Web frameworks
+    "nodejs": "node.js",
+    "node": "node.js",
+    "express.js": "express",
+    "vue.js": "vue",
+    "vuejs": "vue",
+    "reactjs": "react",
+    "react.js": "react",
+    "angularjs": "angular",
+    "nextjs": "next.js",
+    "nuxtjs": "nuxt.js",
+    "springboot": "spring boot",
+    # Databases
+    "postgres": "postgresql",
+    "sqlserver": "mssql",
+    "sql server": "mssql",
+    "mongo": "mongodb",
+    "elastic": "elasticsearch",
+    # Cloud & DevOps
+    "k8s": "kubernetes",
+    "google cloud": "gcp",
+    "amazon web services": "aws",
+    "docker-compose": "docker compose",
+    "load balancer": "load balancing",
+    "continuous integration": "ci/cd",
+    "continuous delivery": "ci/cd",
+    "continuous deployment": "ci/cd",
+    # Data & ML
+    "sklearn": "scikit-learn",
+    "ml": "machine learning",
+    "cv": "computer vision",
+    "natural language processing": "nlp",
+    "huggingface": "hugging face",
+    "powerbi": "power bi",
+    # APIs
+    "rest": "rest api",
+    "restful": "rest api",
+    "restful api": "rest api",
+    # Frontend
+    "html5": "html",
+    "css3": "css",
+    "tailwindcss": "tailwind",
+    "mui": "material-ui",
+    # Testing
+    "e2e": "e2e testing",
+    "unit tests": "unit testing",
+    "quality assurance": "qa",
+    # Methodologies / OS
+    "test driven development": "tdd",
+    "red hat": "rhel",
+    "mac os": "macos",
+    "osx": "macos",
+}
+
+
+def normalize_skill_text(skill: str) -> str:
+    """Lowercase, trim and collapse internal whitespace."""
+    return " ".join((skill or "").lower().split())
+
+
+@lru_cache(maxsize=1)
+def _taxonomy():
+    # Imported lazily: skill_extractor itself depends on this module
+    from app.services.skill_extractor import TECHNICAL_SKILLS
+
+    canonical = sorted({SKILL_ALIASES.get(s, s) for s in TECHNICAL_SKILLS})
+    ids = {name: i for i, name in enumerate(canonical)}
+    return canonical, ids
+
+
+def vocabulary() -> List[str]:
+    """Canonical skill names; a skill's id is its position in this list."""
+    return _taxonomy()[0]
+
+
+def vocabulary_size() -> int:
+    return len(_taxonomy()[0])
+
+
+@lru_cache(maxsize=8192)
+def canonicalize(skill: str) -> Optional[str]:
+    """
+    Canonical name for a skill or alias, or None if it is not in the taxonomy.
+
+    >>> canonicalize("K8s")
+    'kubernetes'
+    """
+    norm = normalize_skill_text(skill)
+    norm = SKILL_ALIASES.get(norm, norm)
+    return norm if norm in _taxonomy()[1] else None
+
+
+def skill_id(skill: str) -> Optional[int]:
+    """Integer id of a skill or alias, or None if it is not in the taxonomy."""
+    name = canonicalize(skill)
+    return None if name is None else _taxonomy()[1][name]
+
+
+def skill_name(skill_id_: int) -> str:
+    """Canonical name for an id."""
+    return _taxonomy()[0][skill_id_]
+
+
+def display_name(skill: str) -> str:
+    """Display form used in API responses: short names upper-cased, others title-cased."""
+    name = canonicalize(skill) or normalize_skill_text(skill)
+    return name.upper() if len(name) <= 3 else name.title()
+
+
+def canonical_skill_ids(skills: Iterable[str]) -> List[int]:
+    """Distinct ids of the skills that resolve, in input order."""
+    return list(dict.fromkeys(i for i in (skill_id(s) for s in skills) if i is not None))
@@ -1,13 +1,23 @@
 """
 Supabase Storage Service for handling resume uploads to cloud storage.
+
+The service is created on first use through `get_supabase_storage()`, so
+importing this module neither imports the supabase SDK nor touches the
+network. `supabase_storage` still resolves (lazily) for older callers.
 """
 
+import logging
+import threading
+import time
 import uuid
 from typing import Optional, Tuple
 from pathlib import Path
 from fastapi import UploadFile, HTTPException
-from supabase import create_client, Client
 from app.core.config import settings
+from app.core.metrics import STAGE_SECONDS
+from app.core.tracing import trace_span
+
+logger = logging.getLogger(__name__)
 
 
 class SupabaseStorageService:
@@ -15,7 +25,7 @@ class SupabaseStorageService:
 
     def __init__(self):
         """Initialize Supabase client."""
-        self.client: Optional[Client] = None
+        self.client = None
         self.bucket_name = settings.SUPABASE_STORAGE_BUCKET
 
         if settings.USE_SUPABASE_STORAGE:
@@ -23,6 +33,8 @@ class SupabaseStorageService:
                 raise ValueError("Supabase credentials not configured. Set SUPABASE_URL and SUPABASE_ANON_KEY in .env")
 
             try:
+                from supabase import create_client
+
                 self.client = create_client(settings.SUPABASE_URL, settings.SUPABASE_ANON_KEY)
                 self._ensure_bucket_exists()
             except Exception as e:
@@ -36,8 +48,10 @@ class SupabaseStorageService:
         except Exception as e:
             # If bucket doesn't exist, it will raise an error
             # Note: Creating buckets via API might require service role key
-            print(f"Warning: Could not verify bucket '{self.bucket_name}': {e}")
-            print(f"Please ensure the bucket '{self.bucket_name}' exists in your Supabase project.")
+            logger.warning(
+                f"Could not verify bucket '{self.bucket_name}': {e}. "
+                f"Please ensure the bucket '{self.bucket_name}' exists in your Supabase project."
+            )
 
     async def upload_file(self, file: UploadFile) -> Tuple[str, str]:
         """
@@ -70,11 +84,13 @@ class SupabaseStorageService:
 
             # Upload to Supabase Storage with explicit content type
             # file_options with "content-type" is required to override mime type detection
-            response = self.client.storage.from_(self.bucket_name).upload(
-                path=file_path,
-                file=file_content,
-                file_options={"content-type": "application/pdf"}
-            )
+            span_attrs = {"storage.bucket": self.bucket_name, "storage.path": file_path, "storage.bytes": len(file_content)}
+            with STAGE_SECONDS.time(stage="upload"), trace_span("supabase.storage.upload", span_attrs):
+                response = self.client.storage.from_(self.bucket_name).upload(
+                    path=file_path,
+                    file=file_content,
+                    file_options={"content-type": "application/pdf"}
+                )
 
             # Check if upload was successful
             if hasattr(response, 'error') and response.error:
@@ -122,7 +138,9 @@ class SupabaseStorageService:
             raise HTTPException(status_code=500, detail="Supabase storage not initialized")
 
         try:
-            response = self.client.storage.from_(self.bucket_name).download(file_path)
+            span_attrs = {"storage.bucket": self.bucket_name, "storage.path": file_path}
+            with STAGE_SECONDS.time(stage="storage_download"), trace_span("supabase.storage.download", span_attrs):
+                response = self.client.storage.from_(self.bucket_name).download(file_path)
             return response
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to download from Supabase: {str(e)}")
@@ -144,7 +162,8 @@ class SupabaseStorageService:
             raise HTTPException(status_code=500, detail="Supabase storage not initialized")
 
         try:
-            self.client.storage.from_(self.bucket_name).remove([file_path])
+            with trace_span("supabase.storage.remove", {"storage.bucket": self.bucket_name, "storage.path": file_path}):
+                self.client.storage.from_(self.bucket_name).remove([file_path])
             return True
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to delete from Supabase: {str(e)}")
@@ -165,6 +184,39 @@ class SupabaseStorageService:
         return self.client.storage.from_(self.bucket_name).get_public_url(file_path)
 
 
-# Create a singleton instance
-supabase_storage = SupabaseStorageService() if settings.USE_SUPABASE_STORAGE else None
+# Seconds before retrying a failed client initialization
+INIT_RETRY_SECONDS = 30
+
+_supabase_storage: Optional[SupabaseStorageService] = None
+_init_failed_at: Optional[float] = None
+_init_lock = threading.Lock()
+
+
+def get_supabase_storage() -> Optional[SupabaseStorageService]:
+    """
+    Shared storage service, created on first call. Returns None when
+    storage is disabled or could not be initialized (retried after
+    INIT_RETRY_SECONDS), so callers degrade instead of failing at import.
+    """
+    global _supabase_storage, _init_failed_at
+    if _supabase_storage is not None or not settings.USE_SUPABASE_STORAGE:
+        return _supabase_storage
+    with _init_lock:
+        if _supabase_storage is None:
+            if _init_failed_at is not None and time.monotonic() - _init_failed_at < INIT_RETRY_SECONDS:
+                return None
+            try:
+                _supabase_storage = SupabaseStorageService()
+                _init_failed_at = None
+            except Exception as e:
+                _init_failed_at = time.monotonic()
+                logger.error(f"Supabase storage unavailable: {e}")
+    return _supabase_storage
+
+
+def __getattr__(name: str):
+    # Backwards compatible `from app.services.supabase_storage import supabase_storage`
+    if name == "supabase_storage":
+        return get_supabase_storage()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
@@ -1,10 +1,13 @@
-import logging
 import random
 import time
 from datetime import timedelta
 from app.celery_app import celery_app
+from app.core.config import settings
+from app.core.metrics import SCRAPER_THROTTLE_SECONDS
+from app.core.tracing import trace_span
 from app.services.linkedin_scraper_simple import scrape_linkedin_jobs
-from app.db.supabase_db import save_jobs, archive_old_caches
+from app.services.scrape_frontier import FrontierWorker, ScrapeFrontier, seed_frontier
+from app.db.supabase_db import merge_jobs, archive_old_caches
 from celery.utils.log import get_task_logger
 
 logger = get_task_logger(__name__)
@@ -25,21 +28,93 @@ def initial_linkedin_scrape(self):
     combos = [(random.choice(positions), random.choice(locations)) for _ in range(3)]
     random.shuffle(combos)
 
+    if settings.SCRAPER_FRONTIER_WORKERS > 0:
+        # Shared frontier: seed it and let any free worker pull pages from it
+        seeded = seed_frontier(ScrapeFrontier(), combos)
+        for _ in range(settings.SCRAPER_FRONTIER_WORKERS):
+            frontier_scrape.delay()
+        logger.info("[Celery] Seeded frontier with %d search pages for %d workers",
+                    seeded, settings.SCRAPER_FRONTIER_WORKERS)
+        archive_job_caches.delay()
+        return
+
     logger.info("[Celery] Starting initial LinkedIn scrape (%d combos)", len(combos))
     for pos, loc in combos:
-        delay = random.uniform(60, 120)  # throttle per target
+        delay = random.uniform(60, 120) * settings.SCRAPER_THROTTLE_SCALE  # throttle per target
         logger.info("[Celery] Target: %s in %s (sleep %.1fs)", pos, loc, delay)
+        SCRAPER_THROTTLE_SECONDS.inc(delay)
         time.sleep(delay)
-        jobs = scrape_linkedin_jobs(pos, loc, max_results=3)
-        logger.info("[Celery] Scraped %d jobs for %s in %s", len(jobs or []), pos, loc)
-        if jobs:
-            save_jobs(jobs, pos, loc)
-            logger.info("[Celery] Saved %d jobs for %s in %s", len(jobs), pos, loc)
+        with trace_span("scrape.target", {"scrape.position": pos, "scrape.location": loc}) as span:
+            jobs = scrape_linkedin_jobs(pos, loc, max_results=3)
+            span.set_attribute("scrape.jobs", len(jobs or []))
+            # scrape_linkedin_jobs merges them into the cache file itself
+            logger.info("[Celery] Scraped %d new jobs for %s in %s", len(jobs or []), pos, loc)
+
+    archive_job_caches.delay()
+    if settings.JOB_INDEX_SHARED:
+        publish_job_index.delay()
+    logger.info("[Celery] Completed initial LinkedIn scrape")
+
+
+FRONTIER_SAVE_BATCH = 25
+
 
+@celery_app.task(bind=True, name="app.services.tasks.frontier_scrape")
+def frontier_scrape(self, max_seconds: float = 4 * 3600, idle_seconds: float = 60.0):
+    """
+    Pull search and detail pages from the shared Redis frontier until it
+    stays empty for idle_seconds, merging jobs into their cache files every
+    FRONTIER_SAVE_BATCH items (other workers add to the same files, so a
+    batch must not replace them; a batch that fails to merge is retried
+    with the next one, and one still unsaved at the end goes back to the
+    frontier for another worker). Run as many of these as there are free workers; the
+    per-host token bucket keeps their combined request rate at
+    SCRAPER_HOST_RATE_PER_MIN.
+    """
+    worker = FrontierWorker(ScrapeFrontier())
+    deadline = time.monotonic() + max_seconds
+    total = saved = 0
+    try:
+        while time.monotonic() < deadline:
+            processed = worker.run(max_items=FRONTIER_SAVE_BATCH, max_seconds=deadline - time.monotonic(),
+                                   idle_seconds=idle_seconds)
+            total += processed
+            for (pos, loc), jobs in list(worker.jobs.items()):
+                if merge_jobs(jobs, pos, loc):
+                    saved += len(jobs)
+                    worker.saved(pos, loc)
+            if processed < FRONTIER_SAVE_BATCH:
+                break
+    finally:
+        if worker.jobs:
+            logger.warning("[Celery] Requeued %d unsaved detail pages", worker.release())
+    logger.info("[Celery] Frontier worker processed %d items, saved %d jobs", total, saved)
+    if saved and settings.JOB_INDEX_SHARED:
+        publish_job_index.delay()
+    return {"processed": total, "saved": saved}
+
+
+@celery_app.task(bind=True, name="app.services.tasks.archive_job_caches")
+def archive_job_caches(self):
+    """Move expired job cache files to the archive bucket (archive queue)."""
     logger.info("[Celery] Starting archive of old cache files...")
     archived_count = archive_old_caches()
     logger.info("[Celery] Archived %d old cache files", archived_count)
-    logger.info("[Celery] Completed initial LinkedIn scrape")
+    return archived_count
+
+
+@celery_app.task(bind=True, name="app.services.tasks.publish_job_index")
+def publish_job_index(self, force: bool = False):
+    """
+    Rebuild the shared job index at JOB_INDEX_PATH if the corpus version
+    changed (index queue). Only useful on a worker that shares that path
+    with the API processes.
+    """
+    from app.db import shared_index
+
+    published = shared_index.publish_job_index(force=force)
+    logger.info("[Celery] Job index %s", "published" if published else "already current")
+    return published
 
 
 @celery_app.on_after_configure.connect
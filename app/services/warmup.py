@@ -0,0 +1,170 @@
+"""
+Startup warm-up for API replicas.
+
+Runs once in a background thread after the app starts, so the process is
+live immediately but only reports ready (GET /health/ready) once the
+first request would not pay for cold state:
+
+- storage:   Supabase client created (skipped when storage is disabled)
+- corpus:    job corpus downloaded, JobStore filters, BM25 and skill
+             bitsets built
+- extractor: skill patterns compiled
+- synthetic: a few recommendations and a search run end to end
+             (WARMUP_SYNTHETIC_REQUESTS, 0 to skip)
+
+A failed step (typically storage being unreachable) leaves the replica
+not ready and the whole warm-up is retried every WARMUP_RETRY_SECONDS.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import STAGE_SECONDS, WARMUP_READY
+
+logger = logging.getLogger(__name__)
+
+PENDING, RUNNING, READY, FAILED = "pending", "running", "ready", "failed"
+
+SYNTHETIC_QUERIES = [
+    ["Python", "Django", "PostgreSQL", "Docker"],
+    ["JavaScript", "React", "TypeScript", "Node.js"],
+    ["Java", "Spring Boot", "Kubernetes", "AWS"],
+    ["Machine Learning", "PyTorch", "SQL"],
+]
+SYNTHETIC_RESUME = (
+    "Senior software engineer. Built REST APIs in Python with FastAPI and Django, "
+    "deployed on Kubernetes with Docker and Terraform on AWS. PostgreSQL, Redis, Kafka. "
+    "Frontend work in React and TypeScript. CI/CD with GitHub Actions, pytest, agile."
+)
+
+
+class WarmupState:
+    """Progress of the warm-up, safe to read from request handlers."""
+
+    def __init__(self):
+        self.status = PENDING
+        self.attempts = 0
+        self.steps: Dict[str, Dict] = {}
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.error: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self.status == READY
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "status": self.status,
+                "attempts": self.attempts,
+                "duration_seconds": round((self.finished_at or time.time()) - self.started_at, 3)
+                if self.started_at else None,
+                "error": self.error,
+                "steps": {name: dict(step) for name, step in self.steps.items()},
+            }
+
+    def _set(self, **fields) -> None:
+        with self._lock:
+            for name, value in fields.items():
+                setattr(self, name, value)
+        WARMUP_READY.set(1 if self.status == READY else 0)
+
+    def _step(self, name: str, **fields) -> None:
+        with self._lock:
+            self.steps.setdefault(name, {}).update(fields)
+
+
+state = WarmupState()
+
+
+def _warm_storage() -> str:
+    if not settings.USE_SUPABASE_STORAGE:
+        return "storage disabled"
+    from app.services.supabase_storage import get_supabase_storage
+
+    if get_supabase_storage() is None:
+        raise RuntimeError("Supabase storage unavailable")
+    return "client ready"
+
+
+def _warm_corpus() -> str:
+    from app.db.job_store import get_job_store
+
+    store = get_job_store(force_refresh=True)
+    if settings.USE_SUPABASE_STORAGE and store.version == "empty":
+        # get_corpus_version's marker for "could not list the cache bucket"
+        raise RuntimeError("job cache bucket could not be listed")
+    rows, _, _ = store.skill_matrix()
+    return f"{len(store)} jobs, version {store.version}, {rows.nbytes} skill bitset bytes"
+
+
+def _warm_extractor() -> str:
+    from app.services.skill_extractor import compiled_skill_patterns, extract_skills
+
+    patterns = compiled_skill_patterns()
+    skills = extract_skills(SYNTHETIC_RESUME, top_n=15)
+    return f"{len(patterns)} patterns, {len(skills)} skills from the sample resume"
+
+
+def _warm_synthetic() -> str:
+    count = settings.WARMUP_SYNTHETIC_REQUESTS
+    if count <= 0:
+        return "skipped"
+    from app.db.job_store import get_job_store
+    from app.services.recommender import get_job_recommendations
+
+    for i in range(count):
+        result = get_job_recommendations(SYNTHETIC_QUERIES[i % len(SYNTHETIC_QUERIES)], top_n=5)
+        if not result.get("success"):
+            raise RuntimeError(result.get("error", "synthetic recommendation failed"))
+    get_job_store().search("python developer", limit=5)
+    return f"{count} recommendations and 1 search"
+
+
+STEPS: List[Tuple[str, Callable[[], str]]] = [
+    ("storage", _warm_storage),
+    ("corpus", _warm_corpus),
+    ("extractor", _warm_extractor),
+    ("synthetic", _warm_synthetic),
+]
+
+
+def run_warmup() -> bool:
+    """Run every step once; True if all succeeded."""
+    state._set(status=RUNNING, attempts=state.attempts + 1, started_at=time.time(), finished_at=None, error=None)
+    for name, step in STEPS:
+        state._step(name, status=RUNNING, error=None)
+        started = time.perf_counter()
+        try:
+            with STAGE_SECONDS.time(stage=f"warmup_{name}"):
+                detail = step()
+        except Exception as e:
+            seconds = round(time.perf_counter() - started, 3)
+            state._step(name, status=FAILED, seconds=seconds, error=str(e))
+            state._set(status=FAILED, finished_at=time.time(), error=f"{name}: {e}")
+            logger.warning(f"Warm-up step {name} failed after {seconds}s: {e}")
+            return False
+        seconds = round(time.perf_counter() - started, 3)
+        state._step(name, status=READY, seconds=seconds, detail=detail)
+        logger.info(f"Warm-up step {name} done in {seconds}s ({detail})")
+    state._set(status=READY, finished_at=time.time())
+    logger.info(f"Warm-up complete in {state.finished_at - state.started_at:.2f}s, replica ready")
+    return True
+
+
+def _warmup_loop() -> None:
+    while not run_warmup():
+        time.sleep(settings.WARMUP_RETRY_SECONDS)
+
+
+def start_warmup() -> None:
+    """Start warm-up in a daemon thread, or mark ready at once when disabled."""
+    if not settings.WARMUP_ENABLED:
+        state._set(status=READY, started_at=time.time(), finished_at=time.time())
+        return
+    threading.Thread(target=_warmup_loop, name="warmup", daemon=True).start()
@@ -0,0 +1,3 @@
+"""
+Benchmarks and synthetic data generators. Run modules with `python -m benchmarks.<name>`.
+"""
@@ -0,0 +1,152 @@
+"""
+Cold-start benchmark: import time of the API and worker entry points, each
+measured in fresh interpreters (`python -X importtime`), so regressions from
+eager imports or import-time I/O show up before they reach autoscaled
+replicas.
+
+- import: wall time to import each target, plus self time grouped by
+  top-level package and the slowest modules
+- startup: import app.main and run its startup handlers
+- over_baseline_ms: p50 minus the p50 of importing fastapi alone, i.e. what
+  this repo adds on top of the framework
+
+Storage is enabled with an unreachable SUPABASE_URL, so an import that
+touches the network shows up as a stall or a failure.
+
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --runs 20 --budget-ms 50   # exit 1 if app.main adds more than 50 ms
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from benchmarks.harness import emit, result, run_metadata
+
+BASELINE = "fastapi"
+TARGETS = ("app.main", "app.celery_app", "app.services.tasks")
+STARTUP = "startup"
+
+_IMPORTTIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+_IMPORT_SNIPPET = """
+import time
+started = time.perf_counter()
+import {module}
+print("WALL_MS", (time.perf_counter() - started) * 1000)
+"""
+
+_STARTUP_SNIPPET = """
+import asyncio, time
+started = time.perf_counter()
+import app.main
+
+async def startup():
+    async with app.main.app.router.lifespan_context(app.main.app):
+        print("WALL_MS", (time.perf_counter() - started) * 1000)
+
+asyncio.run(startup())
+"""
+
+
+def _environment(supabase_url: str) -> Dict[str, str]:
+    env = dict(os.environ)
+    env.update({
+        "USE_SUPABASE_STORAGE": "true",
+        "SUPABASE_URL": supabase_url,
+        "SUPABASE_ANON_KEY": env.get("SUPABASE_ANON_KEY", "bench-anon-key"),
+        # Never reach a real broker from the startup handler
+        "CELERY_BROKER_URL": env.get("BENCH_BROKER_URL", "redis://127.0.0.1:9/0"),
+        "PYTHONDONTWRITEBYTECODE": "1",
+    })
+    return env
+
+
+def run_once(snippet: str, env: Dict[str, str], timeout: float) -> Tuple[float, List[Tuple[str, int, int]]]:
+    """Run `snippet` in a fresh interpreter; (wall ms, [(module, self_us, cumulative_us)])."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", snippet],
+        capture_output=True, text=True, env=env, timeout=timeout,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import failed:\n{proc.stderr[-2000:]}")
+    wall = next(float(line.split()[1]) for line in proc.stdout.splitlines() if line.startswith("WALL_MS"))
+    modules = []
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match:
+            modules.append((match.group(4), int(match.group(1)), int(match.group(2))))
+    return wall, modules
+
+
+def bench_target(name: str, snippet: str, runs: int, env: Dict[str, str], timeout: float, top: int) -> Dict:
+    walls = []
+    self_by_package = defaultdict(list)
+    self_by_module = defaultdict(list)
+    for _ in range(runs):
+        wall, modules = run_once(snippet, env, timeout)
+        walls.append(wall)
+        packages = defaultdict(int)
+        for module, self_us, _ in modules:
+            packages[module.split(".")[0]] += self_us
+            self_by_module[module].append(self_us)
+        for package, total in packages.items():
+            self_by_package[package].append(total)
+
+    def median_ms(values: List[int]) -> float:
+        return round(sorted(values)[len(values) // 2] / 1000, 2)
+
+    entry = result("import", walls, target=name)
+    entry["packages_ms"] = dict(sorted(
+        ((pkg, median_ms(v)) for pkg, v in self_by_package.items()), key=lambda kv: -kv[1],
+    )[:top])
+    entry["slowest_modules_ms"] = dict(sorted(
+        ((mod, median_ms(v)) for mod, v in self_by_module.items()), key=lambda kv: -kv[1],
+    )[:top])
+    entry["app_self_ms"] = entry["packages_ms"].get("app", median_ms(self_by_package.get("app", [0])))
+    entry["modules_loaded"] = len(self_by_module)
+    return entry
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="Fresh interpreters per target")
+    parser.add_argument("--targets", default=",".join(TARGETS + (STARTUP,)),
+                        help=f"Modules to import, plus '{STARTUP}' for app.main with its startup handlers")
+    parser.add_argument("--top", type=int, default=10, help="Packages/modules listed per target")
+    parser.add_argument("--supabase-url", default="http://127.0.0.1:9", help="Storage URL (default unreachable)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds before an import counts as hung")
+    parser.add_argument("--budget-ms", type=float,
+                        help="Fail (exit 1) if app.main p50 exceeds the fastapi baseline by more than this")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    env = _environment(args.supabase_url)
+    baseline = bench_target(BASELINE, _IMPORT_SNIPPET.format(module=BASELINE), args.runs, env, args.timeout, args.top)
+    results = [baseline]
+    for target in args.targets.split(","):
+        snippet = _STARTUP_SNIPPET if target == STARTUP else _IMPORT_SNIPPET.format(module=target)
+        entry = bench_target(target, snippet, args.runs, env, args.timeout, args.top)
+        entry["over_baseline_ms"] = round(entry["p50_ms"] - baseline["p50_ms"], 2)
+        results.append(entry)
+
+    emit({
+        "benchmark": "import",
+        "metadata": run_metadata(runs=args.runs, supabase_url=args.supabase_url),
+        "results": results,
+    }, args.output)
+
+    if args.budget_ms is not None:
+        main_entry = next((r for r in results if r["params"]["target"] == "app.main"), None)
+        if main_entry and main_entry["over_baseline_ms"] > args.budget_ms:
+            print(f"app.main adds {main_entry['over_baseline_ms']} ms over {BASELINE}, budget {args.budget_ms} ms",
+                  file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Matcher benchmark: the original per-job SequenceMatcher loop versus the
+bitset fast path in `app.services.matcher.rank_jobs`.
+
+    python -m benchmarks.bench_match --jobs 2000 --queries 5
+"""
+
+import argparse
+import json
+import statistics
+import time
+from difflib import SequenceMatcher
+
+from app.db.job_store import JobStore
+from app.services.matcher import rank_jobs
+from benchmarks.synthetic import generate_jobs, generate_skill_queries
+
+
+def legacy_match_jobs(jobs_db: list[dict], skills: list[str], top_n: int = 5) -> list[dict]:
+    """The scoring loop as it was before skill ids and bitsets (reference only)."""
+
+    def similarity(user_skill, job_skill):
+        user_norm, job_norm = user_skill.lower().strip(), job_skill.lower().strip()
+        if user_norm == job_norm:
+            return 1.0
+        ratio = SequenceMatcher(None, user_norm, job_norm).ratio()
+        return ratio if ratio > 0.6 else 0.0
+
+    matched_jobs = []
+    for job in jobs_db:
+        job_skills = job.get("skills", [])
+        if isinstance(job_skills, str):
+            job_skills = [s.strip() for s in job_skills.split(",")]
+        if not job_skills:
+            continue
+        total_similarity = 0.0
+        matched_skills_count = 0
+        for user_skill in skills:
+            best = max(similarity(user_skill, job_skill) for job_skill in job_skills)
+            if best > 0:
+                total_similarity += best
+                matched_skills_count += 1
+        if matched_skills_count > 0:
+            job_copy = job.copy()
+            job_copy["match_score"] = round(total_similarity / len(skills) * 100, 2)
+            job_copy["matched_skills_count"] = matched_skills_count
+            matched_jobs.append(job_copy)
+    matched_jobs.sort(key=lambda x: x["match_score"], reverse=True)
+    return matched_jobs[:top_n]
+
+
+def _time(fn, queries):
+    samples = []
+    for skills in queries:
+        started = time.perf_counter()
+        fn(skills)
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        "mean_ms": round(statistics.mean(samples), 3),
+        "p50_ms": round(statistics.median(samples), 3),
+        "max_ms": round(max(samples), 3),
+    }
+
+
+def run(n_jobs: int, n_queries: int, top_n: int, skip_legacy: bool = False) -> dict:
+    jobs = generate_jobs(n_jobs)
+    queries = generate_skill_queries(n_queries)
+    # One out-of-taxonomy skill per query exercises the fuzzy correction
+    queries = [q + ["Pythonista"] for q in queries]
+
+    started = time.perf_counter()
+    store = JobStore(jobs, "bench")
+    build_s = time.perf_counter() - started
+
+    result = {
+        "benchmark": "match_jobs",
+        "jobs": n_jobs,
+        "queries": n_queries,
+        "store_build_seconds": round(build_s, 3),
+        "bitset_mb": round(store.skill_bits.nbytes / 1e6, 2),
+        "bitset": _time(lambda skills: rank_jobs(store, skills, top_n), queries),
+    }
+    if not skip_legacy:
+        result["legacy_loop"] = _time(lambda skills: legacy_match_jobs(jobs, skills, top_n), queries)
+        result["speedup"] = round(result["legacy_loop"]["mean_ms"] / result["bitset"]["mean_ms"], 1)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=2_000)
+    parser.add_argument("--queries", type=int, default=5)
+    parser.add_argument("--top-n", type=int, default=5)
+    parser.add_argument("--skip-legacy", action="store_true", help="Only time the bitset path (large corpora)")
+    args = parser.parse_args()
+    print(json.dumps(run(args.jobs, args.queries, args.top_n, args.skip_legacy), indent=2))
+
+
+if __name__ == "__main__":
+    main()
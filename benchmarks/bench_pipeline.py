@@ -0,0 +1,165 @@
+"""
+Resume-to-recommendation pipeline benchmark. Times each stage in isolation
+and the whole path end to end on synthetic resumes and job corpora:
+
+- pdf_parse                  `_extract_text_from_bytes` per resume page count
+- extract_skills             resume text -> ranked skills
+- extract_skills_from_text   scraper-side skill tagging of job descriptions
+- calculate_skill_similarity per call, taxonomy and out-of-taxonomy pairs
+- corpus_load                cache JSON decode + dedup + JobStore build
+- match_jobs                 scoring against a loaded store
+- end_to_end                 PDF bytes -> recommendations
+
+    python -m benchmarks.bench_pipeline --corpus-sizes 1000,10000 --output base.json
+    python -m benchmarks.bench_pipeline --corpus-sizes 1000000 --repeat 5
+
+Compare two runs with `python -m benchmarks.compare base.json head.json`.
+"""
+
+import argparse
+import json
+import math
+import random
+import time
+
+from app.core.config import settings
+from app.db import job_store
+from app.db.job_store import JobStore
+from app.services.dedup import dedupe_jobs
+from app.services.linkedin_scraper_simple import extract_skills_from_text
+from app.services.matcher import calculate_skill_similarity, match_jobs
+from app.services.pdf_parser import _extract_text_from_bytes
+from app.services.skill_extractor import extract_skills
+from benchmarks.harness import emit, result, run_metadata, time_calls
+from benchmarks.synthetic import generate_jobs, generate_resume_pdf, generate_skill_queries
+
+JOBS_PER_CACHE_FILE = 500
+SIMILARITY_BATCH = 1000
+
+
+def _cache_payloads(jobs):
+    """Serialize jobs the way save_jobs writes cache files."""
+    return [
+        json.dumps({"jobs": jobs[i:i + JOBS_PER_CACHE_FILE]}).encode("utf-8")
+        for i in range(0, len(jobs), JOBS_PER_CACHE_FILE)
+    ]
+
+
+def load_corpus(payloads) -> JobStore:
+    """The work get_job_store does after downloading: decode, dedup, index."""
+    jobs = []
+    for content in payloads:
+        jobs.extend(json.loads(content.decode("utf-8")).get("jobs", []))
+    jobs, _ = dedupe_jobs(jobs, label="bench")
+    return JobStore(jobs, "bench")
+
+
+def _install_store(store: JobStore) -> None:
+    # match_jobs reads the process-wide store; pin it so no refresh hits Supabase
+    job_store._store = store
+    job_store._store_checked_at = math.inf
+    # Synthetic jobs carry fixed dates, so score them all regardless of age
+    settings.JOB_MAX_AGE_HOURS = 0
+
+
+def bench_resume_stages(pages_list, repeat):
+    results = []
+    for pages in pages_list:
+        pdf = generate_resume_pdf(pages)
+        text = _extract_text_from_bytes(pdf)
+        parse = result("pdf_parse", time_calls(_extract_text_from_bytes, [pdf] * repeat), pages=pages)
+        parse["bytes"] = len(pdf)
+        skills = result("extract_skills", time_calls(lambda t: extract_skills(t, top_n=15), [text] * repeat),
+                        pages=pages)
+        skills["chars"] = len(text)
+        results.extend([parse, skills])
+    return results
+
+
+def bench_text_stages(repeat):
+    jobs = generate_jobs(max(repeat, 200), seed=3)
+    descriptions = [job["description"] for job in jobs]
+    results = [result("extract_skills_from_text", time_calls(extract_skills_from_text, descriptions),
+                      docs=len(descriptions))]
+
+    rng = random.Random(5)
+    known = [s for q in generate_skill_queries(50) for s in q]
+    unknown = ["Pythonista", "Kubernets", "ReactJS Native", "Postgre", "Terraforming", "Dockerized"]
+    pair_sets = {
+        "taxonomy": [(rng.choice(known), rng.choice(known)) for _ in range(SIMILARITY_BATCH)],
+        "fuzzy": [(rng.choice(unknown), rng.choice(known)) for _ in range(SIMILARITY_BATCH)],
+    }
+    for kind, pairs in pair_sets.items():
+        def batch(_, pairs=pairs):
+            for a, b in pairs:
+                calculate_skill_similarity(a, b)
+        samples = time_calls(batch, range(repeat))
+        entry = result("calculate_skill_similarity", samples, pairs=kind, batch=SIMILARITY_BATCH)
+        entry["per_call_us"] = round(entry["p50_ms"] * 1000 / SIMILARITY_BATCH, 3)
+        results.append(entry)
+    return results
+
+
+def bench_corpus(n_jobs, pdfs, n_queries, repeat, top_n):
+    jobs = generate_jobs(n_jobs)
+    payloads = _cache_payloads(jobs)
+    del jobs
+
+    load_repeat = min(repeat, 3) if n_jobs >= 100_000 else repeat
+    store = None
+    samples = []
+    for _ in range(load_repeat):
+        started = time.perf_counter()
+        store = load_corpus(payloads)
+        samples.append((time.perf_counter() - started) * 1000)
+    load = result("corpus_load", samples, jobs=n_jobs)
+    load.update(files=len(payloads), payload_mb=round(sum(map(len, payloads)) / 1e6, 2), loaded_jobs=len(store))
+    results = [load]
+    del payloads
+
+    _install_store(store)
+    queries = generate_skill_queries(n_queries)
+    results.append(result("match_jobs", time_calls(lambda q: match_jobs(q, top_n=top_n), queries),
+                          jobs=n_jobs, top_n=top_n))
+
+    def end_to_end(pdf):
+        text = _extract_text_from_bytes(pdf)
+        return match_jobs(extract_skills(text, top_n=15), top_n=top_n)
+
+    for pages, pdf in pdfs.items():
+        results.append(result("end_to_end", time_calls(end_to_end, [pdf] * repeat), jobs=n_jobs, pages=pages))
+    return results
+
+
+def run(corpus_sizes, pages_list, repeat, n_queries, top_n) -> dict:
+    results = bench_resume_stages(pages_list, repeat)
+    results.extend(bench_text_stages(repeat))
+    pdfs = {pages: generate_resume_pdf(pages) for pages in pages_list}
+    for n_jobs in corpus_sizes:
+        results.extend(bench_corpus(n_jobs, pdfs, n_queries, repeat, top_n))
+    return {
+        "benchmark": "pipeline",
+        "metadata": run_metadata(corpus_sizes=corpus_sizes, pages=pages_list, repeat=repeat),
+        "results": results,
+    }
+
+
+def _int_list(value: str):
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus-sizes", type=_int_list, default=[1_000, 10_000],
+                        help="Comma-separated job counts, e.g. 1000,100000,1000000")
+    parser.add_argument("--pages", type=_int_list, default=[1, 3, 10], help="Resume page counts")
+    parser.add_argument("--repeat", type=int, default=20, help="Samples per stage")
+    parser.add_argument("--queries", type=int, default=50, help="Skill queries per match_jobs run")
+    parser.add_argument("--top-n", type=int, default=5)
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    args = parser.parse_args()
+    emit(run(args.corpus_sizes, args.pages, args.repeat, args.queries, args.top_n), args.output)
+
+
+if __name__ == "__main__":
+    main()
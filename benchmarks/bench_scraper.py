@@ -0,0 +1,230 @@
+"""
+Offline scraper benchmark on recorded (or synthetic) LinkedIn fixtures:
+
+- parse: search-page and detail-page parse time and parse time per card,
+  for each available HTML backend (selectolax, lxml, bs4)
+- scrape: scrape_linkedin_jobs end to end against the replay server, with
+  jobs per minute, requests by status, 429s and time spent throttling;
+  --passes N repeats the full crawl (the first one on a cold HTTP cache) to show
+  revalidations (304s) and fresh hits on repeat visits
+- frontier (--frontier-workers 1,2,4 --redis-url ...): the shared Redis
+  frontier drained by N worker threads, with jobs per minute per worker
+  count and the request rate the host saw against --host-rate-per-min
+
+    python -m benchmarks.bench_scraper                       # synthetic fixtures
+    python -m benchmarks.bench_scraper --fixtures fixtures/linkedin --position "Data Engineer" --location India
+    python -m benchmarks.bench_scraper --latency-ms 200 --rate-429 0.1 --throttle-scale 0.001
+    python -m benchmarks.bench_scraper --passes 2 --max-age 600
+    python -m benchmarks.bench_scraper --frontier-workers 1,2,4 --redis-url redis://localhost:6379/15
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import threading
+import time
+
+os.environ.setdefault("USE_SUPABASE_STORAGE", "false")
+
+from app.core.config import settings  # noqa: E402
+from app.core.metrics import (  # noqa: E402
+    SCRAPER_HTTP_CACHE, SCRAPER_HTTP_CACHE_BYTES_SAVED, SCRAPER_REQUESTS, SCRAPER_THROTTLE_SECONDS, SCRAPER_THROTTLED,
+)
+from app.services import html_parsing, linkedin_scraper_simple as scraper  # noqa: E402
+from app.services.scrape_frontier import FrontierWorker, ScrapeFrontier, seed_frontier  # noqa: E402
+from app.services.scraper_fixtures import FixtureStore  # noqa: E402
+from benchmarks import fake_supabase  # noqa: E402
+from benchmarks.harness import emit, result, run_metadata, time_calls  # noqa: E402
+from benchmarks.replay_server import start_replay_server  # noqa: E402
+from benchmarks.synthetic import write_linkedin_fixtures  # noqa: E402
+
+
+def bench_parse(store: FixtureStore, repeat: int, backends) -> list:
+    results = []
+    search_pages = [store.load(entry["key"]) for entry in store.by_kind("search")]
+    detail_pages = [store.load(entry["key"]) for entry in store.by_kind("detail")][:200]
+
+    for backend in backends:
+        if search_pages:
+            cards = sum(len(html_parsing.parse_job_cards(html, backend)) for html in search_pages)
+            samples = time_calls(lambda html: html_parsing.parse_job_cards(html, backend), search_pages * repeat)
+            entry = result("parse_search_page", samples, backend=backend)
+            entry.update(pages=len(search_pages), cards=cards,
+                         avg_page_kb=round(sum(map(len, search_pages)) / len(search_pages) / 1024, 1),
+                         per_card_ms=round(sum(samples) / repeat / max(cards, 1), 4))
+            results.append(entry)
+        if detail_pages:
+            samples = time_calls(lambda html: html_parsing.parse_job_page(html, backend), detail_pages * repeat)
+            entry = result("parse_detail_page", samples, backend=backend)
+            entry.update(pages=len(detail_pages),
+                         avg_page_kb=round(sum(map(len, detail_pages)) / len(detail_pages) / 1024, 1))
+            results.append(entry)
+    return results
+
+
+def _counter_total(counter) -> float:
+    return sum(counter._values.values())
+
+
+def _label_deltas(counter, before: dict) -> dict:
+    deltas = {}
+    for key, value in counter._values.items():
+        delta = value - before.get(key, 0)
+        if delta:
+            deltas[",".join(f"{k}={v}" for k, v in key)] = int(delta)
+    return deltas
+
+
+def _scrape_pass(position: str, location: str, max_results: int, facets: str) -> dict:
+    throttle_before = _counter_total(SCRAPER_THROTTLE_SECONDS)
+    throttled_before = _counter_total(SCRAPER_THROTTLED)
+    saved_before = _counter_total(SCRAPER_HTTP_CACHE_BYTES_SAVED)
+    requests_before = dict(SCRAPER_REQUESTS._values)
+    cache_before = dict(SCRAPER_HTTP_CACHE._values)
+    started = time.perf_counter()
+    # known_urls=set(): every pass crawls the full result set, as a cold scrape would
+    jobs = scraper.scrape_linkedin_jobs(position, location, max_results=max_results, facets=facets, known_urls=set())
+    elapsed = time.perf_counter() - started
+
+    requests = _label_deltas(SCRAPER_REQUESTS, requests_before)
+    throttle_s = _counter_total(SCRAPER_THROTTLE_SECONDS) - throttle_before
+    return {
+        "jobs": len(jobs),
+        "elapsed_s": round(elapsed, 3),
+        "jobs_per_minute": round(len(jobs) / elapsed * 60, 2) if elapsed else None,
+        "requests": requests,
+        "requests_per_job": round(sum(requests.values()) / len(jobs), 2) if jobs else None,
+        "http_cache": _label_deltas(SCRAPER_HTTP_CACHE, cache_before),
+        "http_cache_kb_saved": round((_counter_total(SCRAPER_HTTP_CACHE_BYTES_SAVED) - saved_before) / 1024, 1),
+        "rate_limited": int(_counter_total(SCRAPER_THROTTLED) - throttled_before),
+        "throttle_sleep_s": round(throttle_s, 3),
+        "throttle_share": round(throttle_s / elapsed, 3) if elapsed else None,
+    }
+
+
+def bench_scrape(root: str, position: str, location: str, max_results: int, throttle_scale: float,
+                 facets: str, passes: int = 1, **server_options) -> dict:
+    server = start_replay_server(root, **server_options)
+    settings.SCRAPER_BASE_URL = server.url
+    settings.SCRAPER_THROTTLE_SCALE = throttle_scale
+    # A throwaway HTTP cache so the first pass is always cold
+    settings.SCRAPER_HTTP_CACHE_PATH = os.path.join(tempfile.mkdtemp(prefix="scraper-http-cache-"), "cache.sqlite")
+    scraper._http_cache = None
+    fake_supabase.install(fake_supabase.FakeSupabaseClient())
+
+    runs = []
+    for number in range(passes):
+        stats_before = dict(server.stats)
+        run = _scrape_pass(position, location, max_results, facets)
+        run["server_responses"] = {k: v - stats_before.get(k, 0) for k, v in server.stats.items()
+                                   if v - stats_before.get(k, 0)}
+        runs.append({"pass": number + 1, **run})
+    server.shutdown()
+
+    return {
+        "name": "scrape",
+        "params": {"max_results": max_results, "facets": facets, "throttle_scale": throttle_scale, **server_options},
+        **runs[0],
+        "passes": runs if passes > 1 else None,
+    }
+
+
+def bench_frontier(root: str, position: str, location: str, facets: str, worker_counts, redis_url: str,
+                   host_rate_per_min: float, **server_options) -> list:
+    import redis
+
+    client = redis.Redis.from_url(redis_url)
+    server = start_replay_server(root, **server_options)
+    settings.SCRAPER_BASE_URL = server.url
+    settings.SCRAPER_HOST_RATE_PER_MIN = host_rate_per_min
+    settings.SCRAPER_HTTP_CACHE_MAX_MB = 0
+    scraper._http_cache = None
+    fake_supabase.install(fake_supabase.FakeSupabaseClient())
+
+    results = []
+    for workers in worker_counts:
+        frontier = ScrapeFrontier(client, namespace=f"bench_frontier:{os.getpid()}:{workers}")
+        frontier.clear()
+        seed_frontier(frontier, [(position, location)], facets=facets)
+        stats_before = sum(server.stats.values())
+        crawlers = [FrontierWorker(frontier) for _ in range(workers)]
+        threads = [threading.Thread(target=c.run, kwargs={"idle_seconds": 1.0}) for c in crawlers]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # The last second is each worker waiting out idle_seconds on an empty queue
+        elapsed = time.perf_counter() - started - 1.0
+        jobs = [job for c in crawlers for batch in c.jobs.values() for job in batch]
+        requests = sum(server.stats.values()) - stats_before
+        frontier.clear()
+        results.append({
+            "name": "frontier",
+            "params": {"workers": workers, "facets": facets, "host_rate_per_min": host_rate_per_min, **server_options},
+            "jobs": len(jobs),
+            "unique_jobs": len({job["url"] for job in jobs}),
+            "requests": requests,
+            "elapsed_s": round(elapsed, 3),
+            "jobs_per_minute": round(len(jobs) / elapsed * 60, 2) if elapsed > 0 else None,
+            "host_requests_per_min": round(requests / elapsed * 60, 2) if elapsed > 0 else None,
+        })
+    server.shutdown()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", help="Recorded fixture directory; synthetic fixtures are generated if omitted")
+    parser.add_argument("--position", default="Software Engineer")
+    parser.add_argument("--location", default="United States")
+    parser.add_argument("--max-results", type=int, default=50)
+    parser.add_argument("--facets", default=settings.SCRAPER_FACETS, help="none | work_type | experience | grid")
+    parser.add_argument("--repeat", type=int, default=5, help="Parse passes over the fixtures")
+    parser.add_argument("--backends", default=",".join(html_parsing.BACKENDS),
+                        help="HTML parser backends to time (default: all installed)")
+    parser.add_argument("--skip-scrape", action="store_true", help="Only run the parse benchmark")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Replay server latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-429", type=float, default=0.02, help="Probability of an injected 429")
+    parser.add_argument("--throttle-scale", type=float, default=0.0,
+                        help="SCRAPER_THROTTLE_SCALE during the run (0 = no politeness sleeps)")
+    parser.add_argument("--passes", type=int, default=1, help="Full crawls per scrape run (repeats hit the HTTP cache)")
+    parser.add_argument("--max-age", type=int, help="Replay server Cache-Control max-age (default: validators only)")
+    parser.add_argument("--frontier-workers", help="Comma-separated worker counts for the frontier benchmark")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15", help="Redis for the frontier benchmark")
+    parser.add_argument("--host-rate-per-min", type=float, default=0.0,
+                        help="Shared per-host request budget for the frontier benchmark (0 = unlimited)")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    args = parser.parse_args()
+    logging.getLogger("app").setLevel(logging.WARNING)
+
+    root = args.fixtures or tempfile.mkdtemp(prefix="linkedin-fixtures-")
+    store = FixtureStore(root)
+    if not args.fixtures:
+        write_linkedin_fixtures(store, args.position, args.location)
+
+    backends = [b for b in args.backends.split(",") if b in html_parsing.BACKENDS]
+    results = bench_parse(store, args.repeat, backends)
+    if not args.skip_scrape:
+        results.append(bench_scrape(
+            root, args.position, args.location, args.max_results, args.throttle_scale, args.facets, args.passes,
+            latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, rate_429=args.rate_429, max_age=args.max_age,
+        ))
+    if args.frontier_workers:
+        results.extend(bench_frontier(
+            root, args.position, args.location, args.facets, [int(n) for n in args.frontier_workers.split(",")],
+            args.redis_url, args.host_rate_per_min,
+            latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, rate_429=args.rate_429,
+        ))
+    emit({
+        "benchmark": "scraper",
+        "metadata": run_metadata(fixtures=args.fixtures or "synthetic", fixture_count=len(store.index()),
+                                 html_parser=html_parsing.backend_name()),
+        "results": results,
+    }, args.output)
+
+
+if __name__ == "__main__":
+    main()
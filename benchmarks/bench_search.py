@@ -0,0 +1,76 @@
+"""
+Search index benchmark: build time, memory and BM25 query latency on a
+synthetic corpus.
+
+    python -m benchmarks.bench_search --jobs 100000 --queries 200
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+
+from app.services.search_index import SearchIndex
+from benchmarks.synthetic import generate_jobs
+
+QUERY_TERMS = [
+    "python", "senior backend", "machine learning engineer", "react typescript",
+    "kubernetes docker aws", "data engineer spark kafka", "acme labs", "remote devops",
+    "node.js graphql", "c++ embedded", "staff software engineer", "postgresql django",
+]
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run(n_jobs: int, n_queries: int, limit: int) -> dict:
+    jobs = generate_jobs(n_jobs)
+
+    started = time.perf_counter()
+    index = SearchIndex()
+    for i, job in enumerate(jobs):
+        index.add(i, job)
+    build_s = time.perf_counter() - started
+    posting_bytes = sum(
+        ids.buffer_info()[1] * ids.itemsize + tfs.buffer_info()[1] * tfs.itemsize
+        for ids, tfs in index._postings.values()
+    )
+
+    rng = random.Random(1)
+    latencies_ms = []
+    for _ in range(n_queries):
+        query = rng.choice(QUERY_TERMS)
+        started = time.perf_counter()
+        index.search(query, limit=limit)
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "benchmark": "search_index",
+        "jobs": n_jobs,
+        "queries": n_queries,
+        "build_seconds": round(build_s, 3),
+        "postings_mb": round(posting_bytes / 1e6, 1),
+        "terms": len(index._postings),
+        "latency_ms": {
+            "mean": round(statistics.mean(latencies_ms), 3),
+            "p50": round(percentile(latencies_ms, 50), 3),
+            "p95": round(percentile(latencies_ms, 95), 3),
+            "p99": round(percentile(latencies_ms, 99), 3),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+    print(json.dumps(run(args.jobs, args.queries, args.limit), indent=2))
+
+
+if __name__ == "__main__":
+    main()
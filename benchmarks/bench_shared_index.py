@@ -0,0 +1,178 @@
+"""
+Shared job index benchmark: memory of N API worker processes each holding
+an in-process JobStore versus all of them mapping one published index file
+(app/db/shared_index.py), plus query latency of both and a check that they
+return identical results.
+
+Memory is the summed proportional set size (Pss, from
+/proc/<pid>/smaps_rollup) of the workers after they have loaded the store
+and served a few queries, minus the same number of idle interpreters with
+the app imported. Pages of the shared file are split between the processes
+mapping them, so "shared" should stay roughly flat as workers are added.
+Linux only.
+
+    python -m benchmarks.bench_shared_index --jobs 20000 --workers 1,2,4
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from benchmarks.harness import emit, result, run_metadata, time_calls
+from benchmarks.synthetic import generate_jobs, generate_skill_queries
+
+MODES = ("baseline", "local", "shared")
+SEARCH_QUERIES = ["python developer", "senior java engineer", "react typescript", "data engineer spark", "devops aws"]
+
+
+def _child(mode: str, index_path: str, jobs_path: str) -> None:
+    """Worker body: load the store for `mode`, touch it like live traffic, then wait for the parent."""
+    from app.db.job_store import JobStore
+    from app.db.shared_index import MappedJobStore
+    from app.services.matcher import rank_jobs
+
+    if mode == "local":
+        with open(jobs_path) as f:
+            store = JobStore(json.load(f), "bench")
+    elif mode == "shared":
+        store = MappedJobStore(index_path)
+    else:
+        store = None
+    if store is not None:
+        for skills in generate_skill_queries(3):
+            rank_jobs(store, skills, 10)
+        for query in SEARCH_QUERIES:
+            store.search(query, limit=10)
+        store.page(limit=20)
+    print("READY", flush=True)
+    sys.stdin.read()
+
+
+def _pss_kb(pid: int) -> int:
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            if line.startswith("Pss:"):
+                return int(line.split()[1])
+    raise RuntimeError(f"no Pss for pid {pid}")
+
+
+def measure_workers(mode: str, workers: int, index_path: str, jobs_path: str) -> int:
+    """Summed Pss (kB) of `workers` concurrent child processes in `mode`."""
+    env = dict(os.environ, USE_SUPABASE_STORAGE="false")
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-m", "benchmarks.bench_shared_index", "--child", mode,
+             "--index-path", index_path, "--jobs-file", jobs_path],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=env, text=True,
+        )
+        for _ in range(workers)
+    ]
+    try:
+        for proc in procs:
+            if proc.stdout.readline().strip() != "READY":
+                raise RuntimeError(f"{mode} worker {proc.pid} failed to start")
+        return sum(_pss_kb(proc.pid) for proc in procs)
+    finally:
+        for proc in procs:
+            proc.stdin.close()
+            proc.wait()
+
+
+def check_equivalent(local, shared, jobs: List[Dict]) -> None:
+    """Raise AssertionError unless both stores answer pages, counts, searches and matches identically."""
+    from app.services.matcher import rank_jobs
+
+    samples = [jobs[i] for i in range(0, len(jobs), max(len(jobs) // 20, 1))]
+    for job in samples:
+        for filters in ({}, {"location": job.get("location")},
+                        {"work_type": job.get("work_type"), "experience_level": job.get("experience_level")}):
+            assert local.count(filters) == shared.count(filters), filters
+            cursor, pages = None, 0
+            while pages < 5:
+                expected = local.page(limit=25, cursor=cursor, filters=filters)
+                assert shared.page(limit=25, cursor=cursor, filters=filters) == expected, filters
+                cursor, pages = expected[1], pages + 1
+                if cursor is None:
+                    break
+    for query in SEARCH_QUERIES:
+        assert local.search(query, limit=20) == shared.search(query, limit=20), query
+    for skills in generate_skill_queries(10):
+        assert rank_jobs(local, skills, 10) == rank_jobs(shared, skills, 10), skills
+
+
+def run(n_jobs: int, worker_counts: List[int], queries: int) -> Dict:
+    from app.db.job_store import JobStore
+    from app.db.shared_index import MappedJobStore, write_index
+    from app.services.matcher import rank_jobs
+
+    jobs = generate_jobs(n_jobs)
+    workdir = tempfile.mkdtemp(prefix="bench-shared-index-")
+    jobs_path = os.path.join(workdir, "jobs.json")
+    index_path = os.path.join(workdir, "job_index.bin")
+    with open(jobs_path, "w") as f:
+        json.dump(jobs, f)
+
+    started = time.perf_counter()
+    local = JobStore(jobs, "bench")
+    build_s = time.perf_counter() - started
+    started = time.perf_counter()
+    index_bytes = write_index(local, index_path)
+    write_s = time.perf_counter() - started
+    started = time.perf_counter()
+    shared = MappedJobStore(index_path)
+    map_ms = (time.perf_counter() - started) * 1000
+    check_equivalent(local, shared, jobs)
+
+    skill_queries = generate_skill_queries(queries)
+    search_queries = (SEARCH_QUERIES * queries)[:queries]
+    results = []
+    for mode, store in (("local", local), ("shared", shared)):
+        results.append(result("page", time_calls(lambda _: store.page(limit=20, skip=100), range(queries)), mode=mode))
+        results.append(result("search", time_calls(lambda q: store.search(q, limit=10), search_queries), mode=mode))
+        results.append(result("match", time_calls(lambda s: rank_jobs(store, s, 10), skill_queries), mode=mode))
+
+    memory = []
+    for workers in worker_counts:
+        baseline = measure_workers("baseline", workers, index_path, jobs_path)
+        entry = {"workers": workers}
+        for mode in ("local", "shared"):
+            entry[f"{mode}_mb"] = round((measure_workers(mode, workers, index_path, jobs_path) - baseline) / 1024, 1)
+        memory.append(entry)
+
+    return {
+        "benchmark": "shared_index",
+        "metadata": run_metadata(jobs=n_jobs, queries=queries),
+        "store_build_seconds": round(build_s, 3),
+        "index_write_seconds": round(write_s, 3),
+        "index_map_ms": round(map_ms, 3),
+        "index_mb": round(index_bytes / 1e6, 1),
+        "equivalent": True,
+        "memory": memory,
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=20_000)
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated worker counts to measure")
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--index-path", help=argparse.SUPPRESS)
+    parser.add_argument("--jobs-file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child, args.index_path, args.jobs_file)
+        return
+    emit(run(args.jobs, [int(n) for n in args.workers.split(",")], args.queries), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Compare two benchmark JSON reports (e.g. from two commits) by p50 latency.
+
+    python -m benchmarks.compare base.json head.json [--threshold 10]
+
+Rows whose p50 changed by more than the threshold percent are flagged;
+the exit status is 1 if any result regressed past it.
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks.harness import result_key
+
+
+def _load(path: str):
+    with open(path, encoding="utf-8") as fh:
+        report = json.load(fh)
+    return {result_key(entry): entry for entry in report.get("results", [])}, report.get("metadata", {})
+
+
+def compare(base: dict, head: dict, threshold: float):
+    rows, regressed = [], False
+    for key in sorted(base.keys() | head.keys()):
+        before, after = base.get(key), head.get(key)
+        if before is None or after is None:
+            rows.append((key, before and before["p50_ms"], after and after["p50_ms"], None, "only in " + ("head" if before is None else "base")))
+            continue
+        change = (after["p50_ms"] - before["p50_ms"]) / before["p50_ms"] * 100 if before["p50_ms"] else 0.0
+        flag = ""
+        if change > threshold:
+            flag, regressed = "slower", True
+        elif change < -threshold:
+            flag = "faster"
+        rows.append((key, before["p50_ms"], after["p50_ms"], change, flag))
+    return rows, regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Percent change to flag")
+    args = parser.parse_args()
+
+    base, base_meta = _load(args.base)
+    head, head_meta = _load(args.head)
+    rows, regressed = compare(base, head, args.threshold)
+
+    print(f"base {base_meta.get('commit')}  ->  head {head_meta.get('commit')}  (p50 ms)")
+    width = max((len(r[0]) for r in rows), default=10)
+    for key, before, after, change, flag in rows:
+        before_s = f"{before:.3f}" if before is not None else "-"
+        after_s = f"{after:.3f}" if after is not None else "-"
+        change_s = f"{change:+.1f}%" if change is not None else ""
+        print(f"{key:<{width}}  {before_s:>12}  {after_s:>12}  {change_s:>8}  {flag}")
+    sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
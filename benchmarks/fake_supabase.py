@@ -0,0 +1,201 @@
+"""
+Local stand-in for the Supabase client surface the app uses, for load tests
+and benchmarks that must not touch the network.
+
+Implements `client.storage.from_(bucket)` with upload / download / list /
+remove / get_public_url, backed by memory or a local directory. Every call
+sleeps for a configurable latency with `time.sleep`, because the real
+supabase-py client is synchronous too: a slow storage call blocks whichever
+thread (or event loop) makes it, and a load test should see that.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.db import supabase_db
+
+
+class StorageError(Exception):
+    """Raised like supabase's StorageException (missing object, duplicate upload)."""
+
+
+class _MemoryBackend:
+    def __init__(self):
+        self._objects: Dict[Tuple[str, str], Tuple[bytes, str]] = {}
+        self._lock = threading.Lock()
+
+    def put(self, bucket: str, path: str, data: bytes) -> None:
+        with self._lock:
+            self._objects[(bucket, path)] = (data, datetime.now(timezone.utc).isoformat())
+
+    def get(self, bucket: str, path: str) -> Optional[bytes]:
+        entry = self._objects.get((bucket, path))
+        return entry[0] if entry else None
+
+    def exists(self, bucket: str, path: str) -> bool:
+        return (bucket, path) in self._objects
+
+    def delete(self, bucket: str, path: str) -> None:
+        with self._lock:
+            self._objects.pop((bucket, path), None)
+
+    def items(self, bucket: str):
+        with self._lock:
+            return [(path, len(data), updated) for (b, path), (data, updated) in self._objects.items() if b == bucket]
+
+
+class _DiskBackend:
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def _file(self, bucket: str, path: str) -> Path:
+        return self.root / bucket / path
+
+    def put(self, bucket: str, path: str, data: bytes) -> None:
+        target = self._file(bucket, path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+
+    def get(self, bucket: str, path: str) -> Optional[bytes]:
+        target = self._file(bucket, path)
+        return target.read_bytes() if target.is_file() else None
+
+    def exists(self, bucket: str, path: str) -> bool:
+        return self._file(bucket, path).is_file()
+
+    def delete(self, bucket: str, path: str) -> None:
+        self._file(bucket, path).unlink(missing_ok=True)
+
+    def items(self, bucket: str):
+        base = self.root / bucket
+        if not base.is_dir():
+            return []
+        out = []
+        for target in base.rglob("*"):
+            if target.is_file() and not target.name.endswith(".tmp"):
+                stat = target.stat()
+                updated = datetime.fromtimestamp(stat.st_mtime, timezone.utc).isoformat()
+                out.append((target.relative_to(base).as_posix(), stat.st_size, updated))
+        return out
+
+
+class FakeBucket:
+    """The object returned by `client.storage.from_(bucket)`."""
+
+    def __init__(self, storage: "FakeStorage", name: str):
+        self._storage = storage
+        self.name = name
+
+    def upload(self, path: str, file: bytes, file_options: Optional[Dict] = None):
+        self._storage.delay()
+        options = {k.lower(): str(v).lower() for k, v in (file_options or {}).items()}
+        upsert = options.get("upsert") == "true" or options.get("x-upsert") == "true"
+        if not upsert and self._storage.backend.exists(self.name, path):
+            raise StorageError({"statusCode": 409, "error": "Duplicate", "message": "The resource already exists"})
+        self._storage.backend.put(self.name, path, bytes(file))
+        return {"path": path, "fullPath": f"{self.name}/{path}"}
+
+    def download(self, path: str) -> bytes:
+        self._storage.delay()
+        data = self._storage.backend.get(self.name, path)
+        if data is None:
+            raise StorageError({"statusCode": 404, "error": "not_found", "message": "Object not found"})
+        return data
+
+    def list(self, path: str = "", options: Optional[Dict] = None) -> List[Dict]:
+        """Direct children of `path`, shaped like the Storage API list response."""
+        self._storage.delay()
+        prefix = path.strip("/") + "/" if path.strip("/") else ""
+        files, folders = {}, set()
+        for object_path, size, updated in self._storage.backend.items(self.name):
+            if not object_path.startswith(prefix):
+                continue
+            rest = object_path[len(prefix):]
+            if "/" in rest:
+                folders.add(rest.split("/", 1)[0])
+            else:
+                files[rest] = (size, updated)
+        entries = [{"name": name, "id": None, "updated_at": None, "created_at": None, "metadata": None}
+                   for name in sorted(folders)]
+        entries.extend(
+            {"name": name, "id": name, "updated_at": updated, "created_at": updated,
+             "metadata": {"size": size, "mimetype": "application/octet-stream"}}
+            for name, (size, updated) in sorted(files.items())
+        )
+        return entries
+
+    def remove(self, paths: List[str]) -> List[Dict]:
+        self._storage.delay()
+        for path in paths:
+            self._storage.backend.delete(self.name, path)
+        return [{"name": path} for path in paths]
+
+    def get_public_url(self, path: str) -> str:
+        return f"http://fake-supabase.local/storage/v1/object/public/{self.name}/{path}"
+
+
+class FakeStorage:
+    def __init__(self, backend, latency_ms: float = 0.0, jitter_ms: float = 0.0, seed: int = 0):
+        self.backend = backend
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.calls = 0
+        self._rng = random.Random(seed)
+
+    def delay(self) -> None:
+        self.calls += 1
+        latency = self.latency_ms + (self._rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0)
+        if latency > 0:
+            time.sleep(latency / 1000)
+
+    def from_(self, bucket: str) -> FakeBucket:
+        return FakeBucket(self, bucket)
+
+
+class FakeSupabaseClient:
+    """Drop-in for the `supabase.Client` attributes the app touches (`.storage`)."""
+
+    def __init__(self, root: Optional[str] = None, latency_ms: float = 0.0, jitter_ms: float = 0.0, seed: int = 0):
+        backend = _DiskBackend(root) if root else _MemoryBackend()
+        self.storage = FakeStorage(backend, latency_ms, jitter_ms, seed)
+
+
+def install(client: FakeSupabaseClient):
+    """
+    Point the app's storage service (and through it supabase_db) at `client`.
+    Requires USE_SUPABASE_STORAGE=false so no real client is built.
+    """
+    from app.services import supabase_storage as storage_module
+
+    service = storage_module.SupabaseStorageService()
+    service.client = client
+    storage_module._supabase_storage = service
+    return service
+
+
+def seed_job_cache(client: FakeSupabaseClient, jobs: List[Dict], jobs_per_file: int = 500, age_hours: float = 1.0) -> int:
+    """Write `jobs` as cache files in the layout save_jobs produces. Returns the file count."""
+    scraped_at = datetime.now(timezone.utc) - timedelta(hours=age_hours)
+    backend = client.storage.backend
+    files = 0
+    for start in range(0, len(jobs), jobs_per_file):
+        chunk = jobs[start:start + jobs_per_file]
+        data = {
+            "position": chunk[0].get("position", ""),
+            "location": chunk[0].get("location", ""),
+            "total_jobs": len(chunk),
+            "scraped_at": scraped_at.isoformat(),
+            "cache_expires_at": (scraped_at + timedelta(hours=supabase_db.CACHE_DURATION_HOURS)).isoformat(),
+            "jobs": chunk,
+        }
+        backend.put(supabase_db.JOBS_BUCKET, f"jobs/cache/jobs_seed_{files:05d}.json", json.dumps(data).encode("utf-8"))
+        files += 1
+    return files
@@ -0,0 +1,91 @@
+"""
+Shared timing and result helpers for the benchmark scripts.
+
+Results are plain JSON: a `metadata` block identifying the commit and
+machine, and a flat `results` list keyed by (name, params) so two runs can
+be diffed with `python -m benchmarks.compare`.
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def summarize(samples_ms: List[float]) -> Dict:
+    return {
+        "n": len(samples_ms),
+        "mean_ms": round(statistics.mean(samples_ms), 4),
+        "p50_ms": round(statistics.median(samples_ms), 4),
+        "p95_ms": round(percentile(samples_ms, 95), 4),
+        "p99_ms": round(percentile(samples_ms, 99), 4),
+        "min_ms": round(min(samples_ms), 4),
+        "max_ms": round(max(samples_ms), 4),
+    }
+
+
+def time_calls(fn: Callable, inputs: Iterable, warmup: int = 1) -> List[float]:
+    """Call `fn(x)` for every input and return per-call wall times in ms."""
+    inputs = list(inputs)
+    for x in inputs[:warmup]:
+        fn(x)
+    samples = []
+    for x in inputs:
+        started = time.perf_counter()
+        fn(x)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def result(name: str, samples_ms: List[float], **params) -> Dict:
+    """A result row. `params` identify it across runs; add measurements as extra keys."""
+    return {"name": name, "params": params, **summarize(samples_ms)}
+
+
+def result_key(entry: Dict) -> str:
+    params = ",".join(f"{k}={v}" for k, v in sorted(entry.get("params", {}).items()))
+    return f"{entry['name']}[{params}]" if params else entry["name"]
+
+
+def git_revision() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5, check=True,
+        )
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                               capture_output=True, text=True, timeout=5).stdout.strip()
+        return out.stdout.strip() + ("-dirty" if dirty else "")
+    except Exception:
+        return None
+
+
+def run_metadata(**extra) -> Dict:
+    return {
+        "commit": git_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        **extra,
+    }
+
+
+def emit(report: Dict, output: Optional[str] = None) -> None:
+    """Print the report as JSON, and also write it to `output` if given."""
+    text = json.dumps(report, indent=2)
+    if output:
+        with open(output, "w", encoding="utf-8") as fh:
+            fh.write(text + "\n")
+    print(text)
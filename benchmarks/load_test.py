@@ -0,0 +1,168 @@
+"""
+In-process load test: many concurrent clients drive `app.main:app` over
+ASGI (httpx.ASGITransport, no sockets) against a local Supabase stand-in,
+so capacity and concurrency regressions can be measured on one machine.
+
+Endpoints (weighted by --mix): POST /upload-resume, POST /recommend-by-skills,
+GET /jobs (following next_cursor). Reports throughput, p50/p95/p99 latency
+per endpoint, status codes, and event-loop lag measured by a probe task
+that sleeps --lag-interval and records how late it wakes up.
+
+    python -m benchmarks.load_test --clients 50 --duration 30 --storage-latency-ms 40
+    python -m benchmarks.load_test --mix upload=1,recommend=0,jobs=0 --storage-root /tmp/fake-supabase
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from collections import Counter, defaultdict
+
+# The fake client replaces storage; never build a real Supabase client here
+os.environ["USE_SUPABASE_STORAGE"] = "false"
+# Synthetic jobs carry fixed dates, so serve them all regardless of age
+os.environ.setdefault("JOB_MAX_AGE_HOURS", "0")
+
+import httpx  # noqa: E402
+
+from app.db.job_store import get_job_store  # noqa: E402
+from app.main import app  # noqa: E402
+from benchmarks import fake_supabase  # noqa: E402
+from benchmarks.harness import emit, result, run_metadata, summarize  # noqa: E402
+from benchmarks.synthetic import generate_jobs, generate_resume_pdf, generate_skill_queries  # noqa: E402
+
+ENDPOINTS = ("upload", "recommend", "jobs")
+
+
+def _parse_mix(value: str) -> dict:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in ENDPOINTS:
+            raise argparse.ArgumentTypeError(f"unknown endpoint '{name}', expected {ENDPOINTS}")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+class LoadTest:
+    def __init__(self, client: httpx.AsyncClient, mix: dict, seed: int = 1):
+        self.client = client
+        self.names = [n for n in ENDPOINTS if mix.get(n, 0) > 0]
+        self.weights = [mix[n] for n in self.names]
+        self.rng = random.Random(seed)
+        self.resumes = [generate_resume_pdf(pages, seed=seed + pages) for pages in (1, 2, 3)]
+        self.queries = generate_skill_queries(200, seed=seed)
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.lag_ms = []
+
+    async def upload(self):
+        pdf = self.rng.choice(self.resumes)
+        return await self.client.post("/upload-resume", files={"file": ("resume.pdf", pdf, "application/pdf")})
+
+    async def recommend(self):
+        return await self.client.post("/recommend-by-skills", json={"skills": self.rng.choice(self.queries), "top_n": 5})
+
+    async def jobs(self, cursor=None):
+        params = {"limit": 20}
+        if cursor:
+            params["cursor"] = cursor
+        return await self.client.get("/jobs", params=params)
+
+    async def _client_loop(self, deadline: float):
+        cursor = None
+        while time.perf_counter() < deadline:
+            name = self.rng.choices(self.names, weights=self.weights)[0]
+            started = time.perf_counter()
+            try:
+                if name == "jobs":
+                    response = await self.jobs(cursor)
+                    # Half the time keep paging, like a client scrolling the list
+                    cursor = response.json().get("next_cursor") if response.status_code == 200 and self.rng.random() < 0.5 else None
+                else:
+                    response = await getattr(self, name)()
+                status = str(response.status_code)
+            except Exception as e:
+                status = type(e).__name__
+            self.latencies[name].append((time.perf_counter() - started) * 1000)
+            self.statuses[name][status] += 1
+
+    async def _lag_probe(self, interval: float, stop: asyncio.Event):
+        loop = asyncio.get_running_loop()
+        while not stop.is_set():
+            expected = loop.time() + interval
+            await asyncio.sleep(interval)
+            self.lag_ms.append(max(0.0, (loop.time() - expected) * 1000))
+
+    async def run(self, clients: int, duration: float, lag_interval: float) -> float:
+        stop = asyncio.Event()
+        probe = asyncio.create_task(self._lag_probe(lag_interval, stop))
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*(self._client_loop(deadline) for _ in range(clients)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await probe
+        return elapsed
+
+
+async def _main(args) -> dict:
+    fake = fake_supabase.FakeSupabaseClient(
+        root=args.storage_root, latency_ms=args.storage_latency_ms, jitter_ms=args.storage_jitter_ms,
+    )
+    fake_supabase.install(fake)
+    files = fake_supabase.seed_job_cache(fake, generate_jobs(args.jobs))
+    # Load the corpus before measuring so the first requests don't pay for it
+    store = get_job_store(force_refresh=True)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=None) as client:
+        test = LoadTest(client, args.mix)
+        elapsed = await test.run(args.clients, args.duration, args.lag_interval)
+
+    total = sum(len(v) for v in test.latencies.values())
+    results = []
+    for name in test.names:
+        if not test.latencies[name]:
+            continue
+        entry = result(name, test.latencies[name], clients=args.clients, storage_latency_ms=args.storage_latency_ms)
+        entry["throughput_rps"] = round(len(test.latencies[name]) / elapsed, 2)
+        entry["status"] = dict(test.statuses[name])
+        results.append(entry)
+    return {
+        "benchmark": "load_test",
+        "metadata": run_metadata(
+            clients=args.clients, duration_s=args.duration, mix=args.mix, jobs=len(store), cache_files=files,
+            storage_latency_ms=args.storage_latency_ms, storage_jitter_ms=args.storage_jitter_ms,
+            storage_backend="disk" if args.storage_root else "memory",
+        ),
+        "summary": {
+            "requests": total,
+            "elapsed_s": round(elapsed, 3),
+            "throughput_rps": round(total / elapsed, 2),
+            "storage_calls": fake.storage.calls,
+            "event_loop_lag": summarize(test.lag_ms) if test.lag_ms else None,
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=20, help="Concurrent simulated clients")
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds to run")
+    parser.add_argument("--mix", type=_parse_mix, default=_parse_mix("upload=1,recommend=4,jobs=5"),
+                        help="Endpoint weights, e.g. upload=1,recommend=4,jobs=5")
+    parser.add_argument("--jobs", type=int, default=5_000, help="Jobs seeded into the fake cache bucket")
+    parser.add_argument("--storage-latency-ms", type=float, default=30.0, help="Per-call fake storage latency")
+    parser.add_argument("--storage-jitter-ms", type=float, default=10.0, help="Uniform extra latency per call")
+    parser.add_argument("--storage-root", help="Serve buckets from this directory instead of memory")
+    parser.add_argument("--lag-interval", type=float, default=0.01, help="Event-loop lag probe interval (s)")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    args = parser.parse_args()
+    emit(asyncio.run(_main(args)), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Local HTTP server replaying recorded LinkedIn fixtures (see
+app/services/scraper_fixtures.py) with configurable latency and injected
+HTTP 429s, for offline scraper development:
+
+    # record once against live LinkedIn
+    SCRAPER_RECORD_DIR=fixtures/linkedin celery -A app.celery_app worker
+    # replay
+    python -m benchmarks.replay_server fixtures/linkedin --port 8700 --latency-ms 300 --rate-429 0.05
+    SCRAPER_BASE_URL=http://127.0.0.1:8700 SCRAPER_THROTTLE_SCALE=0.01 celery -A app.celery_app worker
+
+Unknown URLs get a 404, as LinkedIn returns for removed postings. Pages
+carry an ETag and Last-Modified and conditional requests get 304s, so the
+scraper's HTTP cache can be exercised; --max-age adds a freshness lifetime.
+"""
+
+import argparse
+import email.utils
+import hashlib
+import os
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Tuple
+
+from app.services.scraper_fixtures import FixtureStore, fixture_key
+
+
+class ReplayServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, store: FixtureStore, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 rate_429: float = 0.0, retry_after: int = 1, max_age: int = None, seed: int = 0):
+        super().__init__(address, _ReplayHandler)
+        self.store = store
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.max_age = max_age
+        self.stats = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def decide(self) -> Tuple[float, bool]:
+        with self._lock:
+            delay = self.latency_ms + (self._rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0)
+            return delay / 1000, self._rng.random() < self.rate_429
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    server: ReplayServer
+
+    def do_GET(self):
+        delay, throttle = self.server.decide()
+        if delay:
+            time.sleep(delay)
+        if throttle:
+            self.server.stats["429"] += 1
+            self._send(429, b"Too Many Requests", {"Retry-After": str(self.server.retry_after)})
+            return
+        store = self.server.store
+        entry = store.index().get(fixture_key(self.path))
+        if entry is None:
+            self.server.stats["404"] += 1
+            self._send(404, b"Not Found")
+            return
+        body = store.load(entry["key"]).encode("utf-8")
+        headers = {
+            "ETag": '"' + hashlib.sha1(body).hexdigest()[:16] + '"',
+            "Last-Modified": email.utils.formatdate(os.path.getmtime(os.path.join(store.root, entry["file"])), usegmt=True),
+        }
+        if self.server.max_age is not None:
+            headers["Cache-Control"] = f"max-age={self.server.max_age}"
+        if self.headers.get("If-None-Match") == headers["ETag"]:
+            self.server.stats["304"] += 1
+            self._send(304, b"", headers)
+            return
+        self.server.stats["200"] += 1
+        self._send(200, body, {"Content-Type": "text/html; charset=utf-8", **headers})
+
+    def _send(self, status: int, body: bytes, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_replay_server(root: str, port: int = 0, host: str = "127.0.0.1", **options) -> ReplayServer:
+    """Serve fixtures from `root` on a background thread. port=0 picks a free port."""
+    server = ReplayServer((host, port), FixtureStore(root), **options)
+    threading.Thread(target=server.serve_forever, name="replay-server", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("fixtures", help="Fixture directory (SCRAPER_RECORD_DIR of a recording run)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8700)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-429", type=float, default=0.0, help="Probability a request gets HTTP 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--max-age", type=int, help="Send Cache-Control: max-age=N with pages")
+    args = parser.parse_args()
+
+    server = ReplayServer(
+        (args.host, args.port), FixtureStore(args.fixtures), latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms, rate_429=args.rate_429, retry_after=args.retry_after, max_age=args.max_age,
+    )
+    print(f"Replaying {len(server.store.index())} fixtures from {args.fixtures} on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"Served: {dict(server.stats)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""
+Synthetic job corpora and resume PDFs for benchmarks.
+
+Skill popularity follows a Zipf distribution over SKILLS_DATABASE-style
+vocabulary, which is close to what the LinkedIn scraper produces: a few
+skills (Python, SQL, AWS, ...) appear in most postings, most appear rarely.
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from app.services.skill_extractor import TECHNICAL_SKILLS
+
+POSITIONS = [
+    "Software Engineer", "Backend Developer", "Frontend Developer", "Data Scientist",
+    "Full Stack Developer", "DevOps Engineer", "Machine Learning Engineer", "Data Engineer",
+]
+LOCATIONS = [
+    "San Francisco, California, United States", "New York, New York, United States",
+    "London, England, United Kingdom", "Bengaluru, Karnataka, India", "Berlin, Germany",
+    "Toronto, Ontario, Canada", "Sydney, New South Wales, Australia", "Remote",
+]
+WORK_TYPES = ["Remote", "Hybrid", "On-site"]
+EXP_LEVELS = ["Entry level", "Associate", "Mid-Senior level"]
+SENIORITY = ["", "Junior ", "Senior ", "Staff ", "Lead ", "Principal "]
+COMPANY_PARTS = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne", "Tyrell",
+                 "Cyberdyne", "Soylent", "Aperture", "Vandelay", "Wonka", "Massive", "Pied Piper"]
+COMPANY_SUFFIXES = ["", " Labs", " Inc", " Systems", " Technologies", " Group", " AI", " Cloud"]
+FILLER = (
+    "we are looking for an engineer to join our team and build reliable scalable services "
+    "you will collaborate with product design and data teams ship features own production "
+    "systems mentor peers and improve our developer experience across the stack"
+).split()
+
+
+def _format_skill(skill: str) -> str:
+    return skill.upper() if len(skill) <= 3 else skill.title()
+
+
+def zipf_weights(n: int, s: float = 1.1) -> List[float]:
+    return [1.0 / (rank ** s) for rank in range(1, n + 1)]
+
+
+def skill_popularity() -> List[str]:
+    """Vocabulary in a fixed popularity order shared by jobs and queries."""
+    vocab = sorted(TECHNICAL_SKILLS)
+    random.Random(0).shuffle(vocab)
+    return vocab
+
+
+def generate_jobs(n: int, seed: int = 42, skills_per_job: int = 8, start: Optional[datetime] = None) -> List[Dict]:
+    """
+    Generate `n` jobs shaped like scraper output.
+
+    Args:
+        n: Number of jobs
+        seed: RNG seed, so runs are reproducible between commits
+        skills_per_job: Mean number of skills per job
+        start: Scrape date of the first job, one minute apart after it (fixed by default)
+
+    Returns:
+        List of job dictionaries
+    """
+    rng = random.Random(seed)
+    vocab = skill_popularity()
+    weights = zipf_weights(len(vocab))
+    companies = [p + s for p in COMPANY_PARTS for s in COMPANY_SUFFIXES]
+    base_date = start or datetime(2026, 1, 1)
+
+    jobs = []
+    for i in range(n):
+        position = rng.choice(POSITIONS)
+        k = max(1, int(rng.gauss(skills_per_job, 2)))
+        skills = list(dict.fromkeys(rng.choices(vocab, weights=weights, k=k)))
+        words = rng.choices(FILLER, k=rng.randint(60, 180)) + skills
+        rng.shuffle(words)
+        jobs.append({
+            "position": position,
+            "date": (base_date + timedelta(minutes=i)).strftime("%Y-%m-%d %H:%M:%S"),
+            "work_type": rng.choice(WORK_TYPES),
+            "experience_level": rng.choice(EXP_LEVELS),
+            "title": rng.choice(SENIORITY) + position,
+            "company": rng.choice(companies),
+            "location": rng.choice(LOCATIONS),
+            "url": f"https://www.linkedin.com/jobs/view/{4000000000 + i}",
+            "description": " ".join(words),
+            "skills": ", ".join(_format_skill(s) for s in skills),
+            "source": "Synthetic",
+        })
+    return jobs
+
+
+def generate_skill_queries(n: int, seed: int = 7, size: int = 12) -> List[List[str]]:
+    """Generate resume-like skill lists drawn from the same Zipf distribution."""
+    rng = random.Random(seed)
+    vocab = skill_popularity()
+    weights = zipf_weights(len(vocab))
+    return [
+        [_format_skill(s) for s in dict.fromkeys(rng.choices(vocab, weights=weights, k=size))]
+        for _ in range(n)
+    ]
+
+
+RESUME_SECTIONS = ["Summary", "Experience", "Projects", "Education", "Certifications"]
+RESUME_VERBS = ["Built", "Designed", "Migrated", "Led", "Optimized", "Maintained", "Automated", "Shipped"]
+RESUME_OBJECTS = [
+    "a payments service", "the data pipeline", "internal dashboards", "the CI/CD workflow",
+    "a recommendation engine", "customer-facing APIs", "the search backend", "monitoring and alerting",
+]
+LINES_PER_PAGE = 48
+
+
+def generate_resume_text(pages: int = 1, seed: int = 11, skills: int = 20) -> List[str]:
+    """
+    Resume-like lines: section headings, bullet points mentioning skills
+    from the same Zipf distribution as jobs, and a skills section.
+    Returns `pages * LINES_PER_PAGE` lines.
+    """
+    rng = random.Random(seed)
+    vocab = skill_popularity()
+    weights = zipf_weights(len(vocab))
+    resume_skills = [_format_skill(s) for s in dict.fromkeys(rng.choices(vocab, weights=weights, k=skills))]
+
+    lines = ["Jordan Example", "jordan@example.com | +1 555 0100 | linkedin.com/in/jordan-example", ""]
+    while len(lines) < pages * LINES_PER_PAGE:
+        lines.append(rng.choice(RESUME_SECTIONS))
+        for _ in range(rng.randint(4, 9)):
+            used = ", ".join(rng.sample(resume_skills, k=min(3, len(resume_skills))))
+            lines.append(f"- {rng.choice(RESUME_VERBS)} {rng.choice(RESUME_OBJECTS)} using {used}")
+        lines.append("")
+    lines = lines[:pages * LINES_PER_PAGE - 1]
+    lines.append("Skills: " + ", ".join(resume_skills))
+    return lines
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def generate_resume_pdf(pages: int = 1, seed: int = 11, skills: int = 20) -> bytes:
+    """
+    Build a text-only PDF resume with `pages` pages (Helvetica, one content
+    stream per page), readable by PyPDF2. No PDF library needed.
+    """
+    lines = generate_resume_text(pages, seed, skills)
+    page_count = max(1, pages)
+    n_objects = 3 + 2 * page_count  # catalog, pages, font, then (page, content) pairs
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        ("<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            " ".join(f"{4 + 2 * i} 0 R" for i in range(page_count)), page_count)).encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i in range(page_count):
+        page_lines = lines[i * LINES_PER_PAGE:(i + 1) * LINES_PER_PAGE]
+        ops = ["BT", "/F1 10 Tf", "14 TL", "50 760 Td"]
+        ops.extend(f"({_pdf_escape(line)}) '" for line in page_lines)
+        ops.append("ET")
+        stream = "\n".join(ops).encode("latin-1", "replace")
+        objects.append((
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>"
+        ).encode())
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref_at = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (n_objects + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (n_objects + 1, xref_at)
+    return bytes(out)
+
+
+# --- LinkedIn guest HTML, shaped like the markup the scraper parses ---
+
+_PAGE_CHROME = (
+    '<header class="global-nav"><nav>' + "".join(
+        f'<a class="nav-link" href="/jobs/{slug}">{slug.title()}</a>'
+        for slug in ("search", "collections", "alerts", "saved", "salary", "companies")
+    ) + "</nav></header>"
+)
+_PAGE_SCRIPT = "<script>window.__tracking = {" + ",".join(f'"k{i}": {i}' for i in range(400)) + "};</script>"
+
+
+def _linkedin_page(body: str, padding_blocks: int) -> str:
+    padding = "".join(
+        f'<section class="related-searches"><ul>{"".join(f"<li><a href=/jobs/q{i}-{j}>Related {j}</a></li>" for j in range(25))}</ul></section>'
+        for i in range(padding_blocks)
+    )
+    return (
+        "<!DOCTYPE html><html lang=\"en\"><head><meta charset=\"utf-8\"><title>Jobs | LinkedIn</title>"
+        + _PAGE_SCRIPT + "</head><body>" + _PAGE_CHROME
+        + "<main class=\"two-pane-serp-page\">" + body + "</main>" + padding + _PAGE_SCRIPT + "</body></html>"
+    )
+
+
+def job_view_url(job: Dict) -> str:
+    job_id = job["url"].rsplit("/", 1)[-1]
+    slug = "-".join((job["title"] + " at " + job["company"]).lower().split())
+    return f"https://www.linkedin.com/jobs/view/{slug}-{job_id}"
+
+
+def linkedin_search_html(jobs: List[Dict], padding_blocks: int = 40) -> str:
+    """A guest search results page with one `base-card` per job."""
+    cards = []
+    for job in jobs:
+        view_url = job_view_url(job)
+        cards.append(
+            f'<li><div class="base-card relative w-full job-search-card" data-entity-urn="urn:li:jobPosting:{view_url.rsplit("-", 1)[-1]}">'
+            f'<a class="base-card__full-link absolute top-0 right-0" href="{view_url}?refId=abc%3D%3D&amp;trackingId=xyz%3D%3D">'
+            f'<span class="sr-only">{job["title"]}</span></a>'
+            f'<div class="search-entity-media"><img class="artdeco-entity-image" alt="{job["company"]}" data-delayed-url="https://media.licdn.com/logo.png"></div>'
+            f'<div class="base-search-card__info"><h3 class="base-search-card__title">{job["title"]}</h3>'
+            f'<h4 class="base-search-card__subtitle"><a class="hidden-nested-link" href="https://www.linkedin.com/company/x">{job["company"]}</a></h4>'
+            f'<div class="base-search-card__metadata"><span class="job-search-card__location">{job["location"]}</span>'
+            f'<time class="job-search-card__listdate" datetime="{job["date"][:10]}">1 day ago</time></div></div></div></li>'
+        )
+    return _linkedin_page(f'<ul class="jobs-search__results-list">{"".join(cards)}</ul>', padding_blocks)
+
+
+def linkedin_detail_html(job: Dict, padding_blocks: int = 20) -> str:
+    """A guest job view page with the description in `show-more-less-html__markup` and the job criteria list."""
+    paragraphs = "".join(f"<p>{chunk}</p>" for chunk in job["description"].split(". "))
+    body = (
+        f'<section class="top-card-layout"><h1 class="top-card-layout__title">{job["title"]}</h1>'
+        f'<a class="topcard__org-name-link">{job["company"]}</a></section>'
+        f'<section class="description"><div class="description__text description__text--rich">'
+        f'<div class="show-more-less-html__markup">{paragraphs}<ul><li>Skills: {job["skills"]}</li></ul></div>'
+        f'</div><ul class="description__job-criteria-list">'
+        f'<li class="description__job-criteria-item"><h3 class="description__job-criteria-subheader">Seniority level</h3>'
+        f'<span class="description__job-criteria-text description__job-criteria-text--criteria">{job["experience_level"]}</span></li>'
+        f'<li class="description__job-criteria-item"><h3 class="description__job-criteria-subheader">Employment type</h3>'
+        f'<span class="description__job-criteria-text description__job-criteria-text--criteria">Full-time</span></li>'
+        f'</ul></section>'
+    )
+    return _linkedin_page(body, padding_blocks)
+
+
+def linkedin_guest_page_html(jobs: List[Dict]) -> str:
+    """A guest API results page: bare `<li>` cards, no page chrome ("" past the last page)."""
+    html = linkedin_search_html(jobs, padding_blocks=0)
+    start, end = html.find("<li>"), html.rfind("</li>")
+    return html[start:end + len("</li>")] if start >= 0 else ""
+
+
+def write_linkedin_fixtures(store, position: str, location: str, total_jobs: int = 150,
+                            page_size: int = 10, seed: int = 42) -> int:
+    """
+    Record synthetic guest search pages, newest first and paged by start=,
+    for every facet the scraper can crawl (unfiltered, per work type, per
+    experience level and the full grid), plus a detail page per job, into
+    a FixtureStore. Facet pages hold the jobs matching that filter, so
+    facets overlap the unfiltered crawl like LinkedIn's do.
+    Returns the number of distinct jobs.
+    """
+    from app.services.linkedin_scraper_simple import search_facets, search_url
+
+    jobs = sorted(generate_jobs(total_jobs, seed=seed), key=lambda job: job["date"], reverse=True)
+    facets = {facet for mode in ("none", "work_type", "experience", "grid") for facet in search_facets(mode)}
+    for work_type, exp_level in facets:
+        matching = [
+            job for job in jobs
+            if work_type in (None, job["work_type"]) and exp_level in (None, job["experience_level"])
+        ]
+        # The scraper advances start by the cards it got, so the last offset is len(matching)
+        for start in [*range(0, len(matching), page_size), len(matching)]:
+            page = matching[start:start + page_size]
+            store.save("search", search_url(position, location, work_type, exp_level, start), linkedin_guest_page_html(page))
+    for job in jobs:
+        store.save("detail", job_view_url(job), linkedin_detail_html(job))
+    return len(jobs)
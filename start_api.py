@@ -1,32 +1,73 @@
 #!/usr/bin/env python3
 """
 Start script for Render deployment
-Runs Celery worker and FastAPI in a single process with unified logging
+Runs the API, Celery workers and beat as separate processes with unified logging
+
+Which processes run is picked by a topology preset (--topology or TOPOLOGY):
+
+    single   API + one solo worker on every queue (one small container, the default)
+    split    API + scrape pool + maintenance pool + beat, in one container
+    api      API only (API_WORKERS uvicorn workers)
+    worker   scrape pool + maintenance pool
+    scrape   scrape pool only
+    beat     beat only (run exactly one per deployment)
+
+Pools:
+    scrape       scrape queue; threads pool sized for I/O-bound scraping
+                 (CELERY_SCRAPE_POOL, CELERY_SCRAPE_CONCURRENCY)
+    maintenance  index and archive queues plus the default queue; prefork
+                 (CELERY_MAINTENANCE_CONCURRENCY)
 """
+import argparse
 import os
 import sys
 import logging
 import multiprocessing
+import signal
+import socket
 
 # Configure logging format
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
     format='[%(asctime)s] [%(name)s] %(levelname)s: %(message)s',
     handlers=[logging.StreamHandler(sys.stdout)]
 )
 
 logger = logging.getLogger(__name__)
 
-
-def start_celery_worker():
-    """Start Celery worker in background process"""
-    from app.celery_app import celery_app
-
-    logger.info("Starting Celery worker...")
+# Pool name -> (queues, pool, concurrency); None means every queue
+WORKER_POOLS = {
+    "all": (None, "solo", 1),
+    "scrape": (("scrape",), os.getenv("CELERY_SCRAPE_POOL", "threads"),
+               int(os.getenv("CELERY_SCRAPE_CONCURRENCY", "4"))),
+    "maintenance": (("index", "archive", "celery"), "prefork",
+                    int(os.getenv("CELERY_MAINTENANCE_CONCURRENCY", "1"))),
+}
+
+TOPOLOGIES = {
+    "single": ("api", "worker:all"),
+    "split": ("api", "worker:scrape", "worker:maintenance", "beat"),
+    "api": ("api",),
+    "worker": ("worker:scrape", "worker:maintenance"),
+    "scrape": ("worker:scrape",),
+    "beat": ("beat",),
+}
+
+
+def start_celery_worker(pool_name: str = "all"):
+    """Start one Celery worker pool in a background process"""
+    from app.celery_app import ALL_QUEUES, celery_app
+
+    queues, pool, concurrency = WORKER_POOLS[pool_name]
+    queues = list(queues or ALL_QUEUES)
+    logger.info(f"Starting Celery worker {pool_name}: pool={pool} concurrency={concurrency} queues={queues}")
 
     # Create worker instance
     worker = celery_app.Worker(
-        pool='solo',  # Use solo pool for compatibility
+        hostname=f"{pool_name}@{socket.gethostname()}",
+        queues=queues,
+        pool=pool,
+        concurrency=concurrency,
         loglevel='INFO',
         logfile=None,  # Log to stdout
     )
@@ -34,6 +75,18 @@ def start_celery_worker():
     worker.start()
 
 
+def start_celery_beat():
+    """Start the Celery beat scheduler (daily scrape)"""
+    from app.celery_app import celery_app
+
+    logger.info("Starting Celery beat...")
+    celery_app.Beat(
+        loglevel='INFO',
+        logfile=None,
+        schedule=os.getenv("CELERY_BEAT_SCHEDULE", "celerybeat-schedule"),
+    ).run()
+
+
 def start_api_server():
     """Start FastAPI server"""
     import uvicorn
@@ -42,19 +95,58 @@ def start_api_server():
 
     host = os.getenv("API_HOST", "0.0.0.0")
     port = int(os.getenv("API_PORT", "10000"))
+    workers = int(os.getenv("API_WORKERS", "1"))
+
+    if workers > 1:
+        publish_shared_index()
+        enqueue_initial_scrape()
 
     uvicorn.run(
         "app.main:app",
         host=host,
         port=port,
+        workers=workers,
         log_level="info",
         access_log=True,
     )
 
 
+def publish_shared_index():
+    """
+    Build the job index once in this (master) process and keep republishing
+    it on corpus changes; uvicorn workers map the file instead of each
+    loading the corpus (see app/db/shared_index.py).
+    """
+    from app.db.shared_index import publish_job_index, start_index_publisher
+
+    try:
+        publish_job_index()
+    except Exception as e:
+        logger.error(f"Initial job index publish failed, workers load the corpus themselves: {e}")
+    start_index_publisher()
+
+
+def enqueue_initial_scrape():
+    """
+    Enqueue the startup scrape once for all uvicorn workers, whose startup
+    hooks skip it when API_WORKERS > 1; in a thread, so a down broker does
+    not hold up the API.
+    """
+    import threading
+
+    from app.celery_app import enqueue_initial_scrape as enqueue
+
+    threading.Thread(target=enqueue, name="enqueue-initial-scrape", daemon=True).start()
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--topology", default=os.getenv("TOPOLOGY", "single"), choices=sorted(TOPOLOGIES))
+    args = parser.parse_args()
+    roles = TOPOLOGIES[args.topology]
+
     logger.info("=" * 60)
-    logger.info("Starting Job Scraper Application")
+    logger.info(f"Starting Job Scraper Application ({args.topology}: {', '.join(roles)})")
     logger.info("=" * 60)
 
     # Check Redis connection
@@ -64,17 +156,43 @@ if __name__ == "__main__":
     else:
         logger.warning("CELERY_BROKER_URL not set - using default")
 
-    # Start Celery worker in background process
-    worker_process = multiprocessing.Process(target=start_celery_worker, daemon=True)
-    worker_process.start()
-    logger.info(f"Celery worker started (PID: {worker_process.pid})")
-
-    # Start API server in main process (blocks)
+    if "api" in roles and int(os.getenv("API_WORKERS", "1")) > 1:
+        # Before anything imports settings, so co-located workers see it too
+        # and rebuild the index after scrapes
+        os.environ["JOB_INDEX_SHARED"] = "true"
+
+    # Workers and beat run in child processes; not daemonic, since a
+    # prefork pool has to start children of its own
+    processes = []
+    for role in roles:
+        if role.startswith("worker:"):
+            pool_name = role.split(":", 1)[1]
+            process = multiprocessing.Process(target=start_celery_worker, args=(pool_name,), name=role)
+        elif role == "beat":
+            process = multiprocessing.Process(target=start_celery_beat, name=role)
+        else:
+            continue
+        process.start()
+        processes.append(process)
+        logger.info(f"Started {role} (PID: {process.pid})")
+
+    # Turn `docker stop` into a clean shutdown of the children (uvicorn
+    # re-raises SIGTERM through this handler once it has stopped serving)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    # Start API server in main process (blocks), or wait on the children
     try:
-        start_api_server()
+        if "api" in roles:
+            start_api_server()
+        else:
+            for process in processes:
+                process.join()
     except KeyboardInterrupt:
+        pass
+    finally:
         logger.info("Shutting down...")
-        worker_process.terminate()
-        worker_process.join()
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
         logger.info("Shutdown complete")
-
@@ -0,0 +1,96 @@
+"""
+Shared fixtures. The app runs against the in-memory Supabase stand-in from
+benchmarks/fake_supabase.py; nothing touches the network.
+"""
+
+import os
+
+# The fake client replaces storage; never build a real Supabase client here
+os.environ["USE_SUPABASE_STORAGE"] = "false"
+os.environ["SHARED_CACHE_ENABLED"] = "false"
+os.environ["JOB_INDEX_SHARED"] = "false"
+os.environ["SCRAPER_HTTP_CACHE_MAX_MB"] = "0"
+
+from datetime import datetime, timedelta  # noqa: E402
+
+import pytest  # noqa: E402
+
+from app.api import response_cache  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.db import job_store, supabase_db  # noqa: E402
+from app.services import supabase_storage  # noqa: E402
+from app.services.scraper_fixtures import FixtureStore  # noqa: E402
+from benchmarks import fake_supabase  # noqa: E402
+from benchmarks.replay_server import start_replay_server  # noqa: E402
+from benchmarks.synthetic import generate_jobs, write_linkedin_fixtures  # noqa: E402
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    """A fresh fake Supabase installed as the app's storage, with all corpus state reset."""
+    client = fake_supabase.FakeSupabaseClient()
+    monkeypatch.setattr(supabase_storage, "_supabase_storage", None)
+    fake_supabase.install(client)
+    monkeypatch.setattr(supabase_db, "_file_cache", {})
+    monkeypatch.setattr(supabase_db, "_dedup", None)
+    monkeypatch.setattr(supabase_db, "_url_owner", {})
+    monkeypatch.setattr(job_store, "_store", None)
+    monkeypatch.setattr(job_store, "_store_checked_at", 0.0)
+    monkeypatch.setattr(job_store, "_store_baseline", None)
+    # Synthetic jobs carry fixed dates, so serve them all unless a test sets a window
+    monkeypatch.setattr(settings, "JOB_MAX_AGE_HOURS", 0.0)
+    response_cache.cache.clear()
+    yield client
+    response_cache.cache.clear()
+
+
+@pytest.fixture
+def api(fake_client):
+    """Test client for the API (lifespan and warm-up are not run)."""
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    return TestClient(app)
+
+
+def _make_job(job_id: int, hours_ago: float = 1.0, **fields) -> dict:
+    job = {
+        "position": "Software Engineer",
+        "date": (datetime.now() - timedelta(hours=hours_ago)).strftime("%Y-%m-%d %H:%M:%S"),
+        "work_type": "Remote",
+        "experience_level": "Entry level",
+        "title": f"Engineer {job_id}",
+        "company": f"Company {job_id}",
+        "location": "Berlin, Germany",
+        "url": f"https://www.linkedin.com/jobs/view/engineer-{job_id}",
+        "description": "No description available",
+        "skills": "Python, SQL",
+        "source": "LinkedIn",
+    }
+    job.update(fields)
+    return job
+
+
+@pytest.fixture
+def make_job():
+    """Factory for a scraper-shaped job with a LinkedIn URL: make_job(job_id, hours_ago=1.0, **fields)."""
+    return _make_job
+
+
+@pytest.fixture
+def linkedin(request, tmp_path, monkeypatch):
+    """
+    Replay server for 30 synthetic postings in pages of 10, searched for the
+    test module's POSITION and LOCATION, with throttling and the host rate
+    limit off. Returns the postings newest first.
+    """
+    write_linkedin_fixtures(
+        FixtureStore(str(tmp_path)), request.module.POSITION, request.module.LOCATION, total_jobs=30, page_size=10,
+    )
+    server = start_replay_server(str(tmp_path))
+    monkeypatch.setattr(settings, "SCRAPER_BASE_URL", server.url)
+    monkeypatch.setattr(settings, "SCRAPER_THROTTLE_SCALE", 0.0)
+    monkeypatch.setattr(settings, "SCRAPER_HOST_RATE_PER_MIN", 0.0)
+    yield sorted(generate_jobs(30, start=datetime.now() - timedelta(days=1)), key=lambda job: job["date"], reverse=True)
+    server.shutdown()
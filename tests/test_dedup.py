@@ -0,0 +1,44 @@
+from app.services.dedup import JobDeduplicator, canonical_job_url, dedupe_jobs
+from benchmarks.synthetic import generate_jobs
+
+
+def test_linkedin_urls_collapse_to_the_job_id():
+    urls = [
+        "https://www.linkedin.com/jobs/view/4000000001",
+        "https://in.linkedin.com/jobs/view/data-engineer-at-acme-4000000001/?refId=abc&trackingId=xyz",
+    ]
+
+    assert {canonical_job_url(url) for url in urls} == {"linkedin:4000000001"}
+    assert canonical_job_url("https://Example.com/Careers/42/?utm=x") == "example.com/careers/42"
+
+
+def test_first_copy_wins():
+    jobs = generate_jobs(3)
+    repost = dict(jobs[1], url=jobs[1]["url"] + "?trackingId=1", title="Repost")
+
+    unique, stats = dedupe_jobs(jobs + [repost])
+
+    assert unique == jobs
+    assert stats.url_duplicates == 1
+
+
+def test_near_duplicates_under_another_url():
+    job = generate_jobs(1)[0]
+    reposted = dict(job, url="https://www.linkedin.com/jobs/view/4999999999",
+                    description=job["description"] + " apply now")
+    dedup = JobDeduplicator(near_duplicates=True, threshold=0.85)
+
+    assert dedup.add(job)
+    assert not dedup.add(reposted)
+    assert dedup.stats.near_duplicates == 1
+    assert JobDeduplicator(near_duplicates=False).add(reposted)
+
+
+def test_discarded_jobs_can_return():
+    job = generate_jobs(1)[0]
+    dedup = JobDeduplicator(near_duplicates=True)
+    dedup.add(job)
+
+    dedup.discard(canonical_job_url(job["url"]))
+
+    assert dedup.add(dict(job))
@@ -0,0 +1,46 @@
+import json
+
+from app.core.config import settings
+from app.db import job_store, supabase_db
+from benchmarks.synthetic import generate_jobs
+
+
+def _put(client, jobs, name="jobs_export.json"):
+    data = {"jobs": jobs}
+    client.storage.backend.put(supabase_db.JOBS_BUCKET, f"jobs/cache/{name}", json.dumps(data).encode("utf-8"))
+
+
+def _lines(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_export_streams_full_then_incremental(api, fake_client, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_STORE_REFRESH_SECONDS", 0)
+    jobs = generate_jobs(40)
+    _put(fake_client, jobs[:30])
+    # A second, unchanged file, so the change below is applied as a delta
+    _put(fake_client, jobs[30:], name="jobs_other.json")
+    full = api.get("/jobs/export")
+    version = full.headers["x-corpus-version"]
+
+    assert full.headers["x-export-mode"] == "full"
+    assert len(_lines(full)) == 40
+
+    added = dict(generate_jobs(1, seed=4)[0], url="https://www.linkedin.com/jobs/view/4100000000")
+    _put(fake_client, jobs[1:30] + [added])
+    job_store.mark_stale()
+    delta = api.get("/jobs/export", params={"since_version": version, "compress": True})
+
+    assert delta.headers["x-export-mode"] == "incremental"
+    assert delta.headers["content-encoding"] == "gzip"
+    assert delta.headers["x-corpus-version"] != version
+    assert _lines(delta) == [added, {"url": jobs[0]["url"], "deleted": True}]
+
+
+def test_export_with_unknown_version_is_full(api, fake_client):
+    _put(fake_client, generate_jobs(5))
+
+    response = api.get("/jobs/export", params={"since_version": "unknown", "company": generate_jobs(5)[0]["company"]})
+
+    assert response.headers["x-export-mode"] == "full"
+    assert {job["company"] for job in _lines(response)} == {generate_jobs(5)[0]["company"]}
@@ -0,0 +1,58 @@
+import threading
+
+import pytest
+
+from app import main
+from app.core.config import settings
+from app.services import supabase_storage, warmup
+from benchmarks import fake_supabase
+from benchmarks.synthetic import generate_jobs
+
+
+@pytest.fixture
+def warmup_state(fake_client, monkeypatch):
+    monkeypatch.setattr(warmup, "state", warmup.WarmupState())
+    monkeypatch.setattr(settings, "WARMUP_SYNTHETIC_REQUESTS", 1)
+    monkeypatch.setattr(settings, "WARMUP_RETRY_SECONDS", 0)
+    fake_supabase.seed_job_cache(fake_client, generate_jobs(50))
+    return warmup.state
+
+
+def test_ready_only_after_warmup(api, warmup_state):
+    before = api.get("/health/ready")
+    assert warmup.run_warmup()
+    after = api.get("/health/ready")
+
+    assert before.status_code == 503 and before.json()["warmup"]["status"] == "pending"
+    assert after.status_code == 200
+    assert set(after.json()["warmup"]["steps"]) == {"storage", "corpus", "extractor", "synthetic"}
+    assert api.get("/health/live").status_code == 200
+
+
+def test_warmup_retries_while_storage_is_unreachable(api, fake_client, warmup_state, monkeypatch):
+    monkeypatch.setattr(settings, "USE_SUPABASE_STORAGE", True)
+    outages = iter([None, None])
+    real = supabase_storage.get_supabase_storage
+    monkeypatch.setattr(supabase_storage, "get_supabase_storage", lambda: next(outages, real()))
+    seen = []
+    run_warmup = warmup.run_warmup
+    monkeypatch.setattr(warmup, "run_warmup", lambda: seen.append(api.get("/health/ready").status_code) or run_warmup())
+
+    warmup._warmup_loop()
+
+    assert seen == [503, 503, 503]
+    assert warmup_state.attempts == 3
+    assert api.get("/health/ready").status_code == 200
+
+
+@pytest.mark.parametrize("workers, enqueued", [(1, 1), (4, 0)])
+def test_one_process_enqueues_the_startup_scrape(monkeypatch, workers, enqueued):
+    calls = []
+    done = threading.Event()
+    monkeypatch.setattr(settings, "API_WORKERS", workers)
+    monkeypatch.setattr(main, "_enqueue_initial_scrape", lambda: calls.append(1) or done.set())
+
+    main.start_background_tasks()
+
+    done.wait(1 if enqueued else 0.1)
+    assert len(calls) == enqueued
@@ -0,0 +1,61 @@
+import pytest
+
+from app.core.config import settings
+from app.services import html_parsing
+from app.services.html_parsing import BACKENDS, parse_job_cards, parse_job_description, parse_job_page
+from benchmarks.synthetic import (
+    generate_jobs,
+    job_view_url,
+    linkedin_detail_html,
+    linkedin_guest_page_html,
+    linkedin_search_html,
+)
+
+JOBS = generate_jobs(5)
+# A card whose company link is missing still parses, with company None
+PARTIAL_CARD = linkedin_guest_page_html(JOBS[:1]).replace("hidden-nested-link", "plain-link")
+
+
+@pytest.fixture
+def reset_backend_choice():
+    html_parsing._resolve.cache_clear()
+    yield
+    html_parsing._resolve.cache_clear()
+
+
+@pytest.mark.parametrize("backend", list(BACKENDS))
+def test_backends_parse_search_pages_alike(backend):
+    for html in (linkedin_search_html(JOBS), linkedin_guest_page_html(JOBS)):
+        cards = parse_job_cards(html, backend=backend)
+        assert cards == parse_job_cards(html, backend="bs4")
+        assert cards == [
+            {"title": job["title"], "company": job["company"], "location": job["location"], "url": job_view_url(job)}
+            for job in JOBS
+        ]
+    assert parse_job_cards(PARTIAL_CARD, backend=backend)[0]["company"] is None
+    assert parse_job_cards("", backend=backend) == []
+
+
+@pytest.mark.parametrize("backend", list(BACKENDS))
+def test_backends_parse_job_pages_alike(backend):
+    for job in JOBS:
+        html = linkedin_detail_html(job)
+        description = parse_job_description(html, backend=backend)
+        page = parse_job_page(html, backend=backend)
+        assert description == parse_job_description(html, backend="bs4")
+        assert page == parse_job_page(html, backend="bs4")
+        assert page["description"] == description and job["skills"] in description
+        assert page["criteria"] == {"seniority level": job["experience_level"], "employment type": "Full-time"}
+    assert parse_job_page("<html></html>", backend=backend) == {"description": "", "criteria": {}}
+
+
+def test_auto_picks_the_first_installed_backend(reset_backend_choice, monkeypatch):
+    monkeypatch.setattr(settings, "SCRAPER_HTML_PARSER", "auto")
+    assert html_parsing.backend_name() == next(iter(BACKENDS))
+
+    monkeypatch.delitem(BACKENDS, "selectolax", raising=False)
+    monkeypatch.delitem(BACKENDS, "lxml", raising=False)
+    html_parsing._resolve.cache_clear()
+    assert html_parsing.backend_name() == "bs4"
+    assert html_parsing.backend_name("selectolax") == "bs4"
+    assert parse_job_cards(linkedin_search_html(JOBS))[0]["url"] == job_view_url(JOBS[0])
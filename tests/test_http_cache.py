@@ -0,0 +1,109 @@
+import email.utils
+import time
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from app.services import http_cache
+from app.services.http_cache import CachingHTTPAdapter, HTTPCache
+
+URL = "http://jobs.test/view/1"
+
+
+class Origin:
+    """Stands in for the network behind CachingHTTPAdapter; records each request it gets."""
+
+    def __init__(self, headers, body=b"<html>posting</html>"):
+        self.headers = headers
+        self.body = body
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(dict(request.headers))
+        validators = (request.headers.get("If-None-Match"), request.headers.get("If-Modified-Since"))
+        response = requests.Response()
+        response.status_code = 304 if any(validators) else 200
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = b"" if any(validators) else self.body
+        response.url = request.url
+        response.request = request
+        return response
+
+
+@pytest.fixture
+def session_for(tmp_path, monkeypatch):
+    def make(origin):
+        monkeypatch.setattr(HTTPAdapter, "send", lambda adapter, request, **kwargs: origin.send(request, **kwargs))
+        session = requests.Session()
+        session.mount("http://", CachingHTTPAdapter(HTTPCache(str(tmp_path / "cache.sqlite"), 1024 * 1024)))
+        return session
+    return make
+
+
+def test_fresh_entry_is_served_without_a_request(session_for):
+    origin = Origin({"Cache-Control": "max-age=60", "ETag": '"v1"'})
+    session = session_for(origin)
+
+    first = session.get(URL)
+    second = session.get(URL)
+
+    assert len(origin.requests) == 1
+    assert "X-Cache" not in first.headers
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.content == origin.body
+
+
+@pytest.mark.parametrize("validator, conditional", [
+    ("ETag", "If-None-Match"),
+    ("Last-Modified", "If-Modified-Since"),
+])
+def test_stale_entry_is_revalidated(session_for, validator, conditional):
+    now = email.utils.formatdate(time.time(), usegmt=True)
+    # Date equal to Last-Modified leaves no heuristic lifetime, so every reuse revalidates
+    value = '"v1"' if validator == "ETag" else now
+    origin = Origin({validator: value, "Date": now})
+    session = session_for(origin)
+
+    session.get(URL)
+    second = session.get(URL)
+
+    assert len(origin.requests) == 2
+    assert conditional not in origin.requests[0]
+    assert origin.requests[1][conditional] == value
+    assert second.status_code == 200
+    assert second.headers["X-Cache"] == "REVALIDATED"
+    assert second.content == origin.body
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    cache = HTTPCache(str(tmp_path / "cache.sqlite"), max_bytes=250)
+    cache.put("a", {}, b"x" * 100, 0)
+    cache.put("b", {}, b"x" * 100, 0)
+    cache.get("a")
+    cache.put("b", {}, b"x" * 100, 0)  # replacing an entry does not count it twice
+    cache.get("a")
+
+    cache.put("c", {}, b"x" * 100, 0)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.size() == 200
+
+
+def test_size_counter_resyncs_with_other_processes(tmp_path, monkeypatch):
+    path = str(tmp_path / "cache.sqlite")
+    mine, other = HTTPCache(path, max_bytes=250), HTTPCache(path, max_bytes=250)
+    mine.put("a", {}, b"x" * 100, 0)
+    other.put("b", {}, b"x" * 100, 0)
+
+    # Mine has only counted its own 200 bytes; once its counter is stale it
+    # re-reads the file and sees the budget is exceeded
+    mine.put("c", {}, b"x" * 100, 0)
+    assert mine.size() == 300
+    monkeypatch.setattr(http_cache, "SIZE_RESYNC_SECONDS", 0.0)
+    mine.put("c", {}, b"x" * 100, 0)
+
+    assert mine.size() <= 250
+    assert mine.get("c") is not None
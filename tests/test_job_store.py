@@ -0,0 +1,149 @@
+import json
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.db import job_store, supabase_db
+from app.db.job_store import JobStore, freshness_cutoff, get_job_store
+from app.services.search_index import FlatSearchIndex, SearchIndex, bm25_rank
+from benchmarks.synthetic import generate_jobs
+
+
+def _put(client, name, jobs):
+    data = {"scraped_at": datetime.now(timezone.utc).isoformat(), "jobs": jobs}
+    client.storage.backend.put(supabase_db.JOBS_BUCKET, f"jobs/cache/{name}", json.dumps(data).encode("utf-8"))
+
+
+def _new_jobs(n, seed):
+    jobs = generate_jobs(n, seed=seed)
+    for i, job in enumerate(jobs):
+        job["url"] = f"https://www.linkedin.com/jobs/view/{5000000000 + seed * 1000 + i}"
+    return jobs
+
+
+def _listing(store):
+    jobs, _ = store.page(limit=len(store) + 1)
+    return [(job["url"], job["title"]) for job in jobs]
+
+
+def _full_reload(monkeypatch):
+    monkeypatch.setattr(supabase_db, "_file_cache", {})
+    return JobStore(supabase_db.get_cached_jobs(), "full")
+
+
+@pytest.fixture
+def corpus(fake_client, monkeypatch):
+    """Four cache files of 50 jobs; the last one repeats 10 jobs of the first."""
+    monkeypatch.setattr(settings, "JOB_STORE_REFRESH_SECONDS", 0)
+    jobs = generate_jobs(200)
+    for i in range(4):
+        _put(fake_client, f"jobs_{i}.json", jobs[i * 50:(i + 1) * 50] + (jobs[:10] if i == 3 else []))
+    get_job_store(force_refresh=True)
+    return jobs
+
+
+def test_delta_after_upsert_matches_full_reload(fake_client, corpus, monkeypatch):
+    store = get_job_store()
+    changed = [dict(job, title=job["title"] + " (updated)") for job in corpus[50:60]]
+    _put(fake_client, "jobs_1.json", changed + corpus[60:100] + _new_jobs(5, seed=3))
+
+    job_store.mark_stale()
+    updated = get_job_store()
+
+    assert updated is store, "expected the delta to be applied in place"
+    assert len(updated) == 205
+    assert _listing(updated) == _listing(_full_reload(monkeypatch))
+
+
+def test_delta_after_shrink_matches_full_reload(fake_client, corpus, monkeypatch):
+    store = get_job_store()
+    # jobs_0 drops 20 jobs; 10 of them are still cached in jobs_3
+    _put(fake_client, "jobs_0.json", corpus[20:50])
+
+    job_store.mark_stale()
+    updated = get_job_store()
+
+    assert updated is store
+    assert len(updated) == 190
+    assert updated.garbage > 0
+    assert _listing(updated) == _listing(_full_reload(monkeypatch))
+    assert _listing(updated.compacted()) == _listing(updated)
+
+
+def test_cursor_survives_a_delta(fake_client, corpus):
+    store = get_job_store()
+    first, cursor = store.page(limit=20)
+    newer = _new_jobs(3, seed=5)
+    for job in newer:
+        job["date"] = "2030-01-01 00:00:00"
+    store.apply_delta(newer, version="v2")
+
+    second, _ = store.page(limit=20, cursor=cursor)
+    rest, _ = store.page(limit=len(store), skip=20 + len(newer))
+
+    assert not {job["url"] for job in first} & {job["url"] for job in second}
+    assert second == rest[:20]
+
+
+def test_apply_delta_tombstones_and_revives(fake_client):
+    jobs = generate_jobs(10)
+    store = JobStore(jobs, "v1")
+
+    counts = store.apply_delta([], [jobs[3]["url"]], version="v2")
+    assert counts == {"added": 0, "updated": 0, "removed": 1}
+    assert len(store) == 9 and store.count() == 9
+    assert jobs[3]["url"] not in {job["url"] for job in store.page(limit=20)[0]}
+
+    counts = store.apply_delta([jobs[3]], version="v3")
+    assert counts["added"] == 1
+    assert len(store) == 10 and store.count() == 10
+    assert store.changes_since("v1") == ([jobs[3]], [])
+
+
+def test_search_ranks_title_above_description_matches():
+    index = SearchIndex()
+    index.add("description", {"title": "Data Engineer", "description": "Streaming with Kafka and Spark"})
+    index.add("title", {"title": "Kafka Engineer", "description": "Streaming platform team"})
+    index.add("other", {"title": "Frontend Developer", "description": "React and TypeScript"})
+
+    hits = index.search("kafka streaming")
+
+    assert [key for key, _ in hits] == ["title", "description"]
+    assert hits[0][1] > hits[1][1] > 0
+    assert [key for key, _ in index.search("kafka", exclude=[1])] == ["description"]
+
+
+def test_flat_index_matches_search_index():
+    index = SearchIndex()
+    for i, job in enumerate(generate_jobs(300)):
+        index.add(i, job)
+    flat = FlatSearchIndex(*index.flatten())
+
+    for query in ["python", "senior data engineer", "kubernetes aws", "c++ developer", "nothing-matches-this"]:
+        expected = index.search(query, limit=15, exclude=[0, 5])
+        assert flat.search(query, limit=15, exclude=[0, 5]) == expected
+
+
+def test_bm25_rank_limits_and_excludes():
+    ids = np.array([0, 1, 2, 3], dtype=np.uint32)
+    tfs = np.array([1, 4, 2, 3], dtype=np.uint16)
+    doc_len = np.array([10, 10, 10, 10], dtype=np.uint32)
+
+    ranked = bm25_rank([(ids, tfs)], doc_len, 40, limit=4)
+    assert [doc for doc, _ in ranked] == [1, 3, 2, 0]
+    assert [doc for doc, _ in bm25_rank([(ids, tfs)], doc_len, 40, limit=2, exclude=np.array([1]))] == [3, 2]
+    assert bm25_rank([], doc_len, 40, limit=4) == []
+
+
+def test_store_search_skips_tombstoned_and_stale_jobs(make_job):
+    jobs = [make_job(i, hours_ago=1 + i * 20, title=f"Kafka Engineer {i}") for i in range(4)]
+    store = JobStore(jobs, "v1")
+    store.apply_delta([], [jobs[0]["url"]], version="v2")
+
+    everything = [job["url"] for job in store.search("kafka")]
+    recent = [job["url"] for job in store.search("kafka", since=freshness_cutoff(30))]
+
+    assert jobs[0]["url"] not in everything and len(everything) == 3
+    assert recent == [jobs[1]["url"]]
@@ -0,0 +1,95 @@
+import pytest
+
+from app.core.config import settings
+from benchmarks import fake_supabase
+from benchmarks.synthetic import generate_jobs
+
+
+def _seed_ages(fake_client, make_job):
+    fresh = [make_job(i, hours_ago=2 + i) for i in range(4)]
+    stale = [make_job(i, hours_ago=72 + i) for i in range(4, 7)]
+    fake_supabase.seed_job_cache(fake_client, fresh + stale)
+    return fresh, stale
+
+
+def test_jobs_only_lists_fresh_postings(api, fake_client, make_job, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_MAX_AGE_HOURS", 48.0)
+    fresh, _ = _seed_ages(fake_client, make_job)
+
+    default = api.get("/jobs", params={"limit": 20}).json()
+    unlimited = api.get("/jobs", params={"limit": 20, "max_age_hours": 0}).json()
+
+    assert [job["url"] for job in default["jobs"]] == [job["url"] for job in fresh]
+    assert default["total_jobs"] == 4
+    assert unlimited["total_jobs"] == 7
+
+
+def test_search_and_recommendations_use_the_window(api, fake_client, make_job):
+    _seed_ages(fake_client, make_job)
+
+    search = api.get("/jobs/search", params={"q": "engineer", "max_age_hours": 24}).json()
+    recommend = api.post("/recommend-by-skills", json={"skills": ["Python"], "top_n": 10, "max_age_hours": 24}).json()
+
+    assert search["returned_jobs"] == 4
+    assert recommend["recommendations_count"] == 4
+
+
+def test_search_ranks_title_matches_first(api, fake_client, make_job):
+    fake_supabase.seed_job_cache(fake_client, [
+        make_job(1, description="We stream events with Kafka"),
+        make_job(2, title="Kafka Platform Engineer"),
+        make_job(3, title="Frontend Engineer"),
+    ])
+
+    search = api.get("/jobs/search", params={"q": "kafka"}).json()
+
+    assert [job["url"] for job in search["jobs"]] == [make_job(2)["url"], make_job(1)["url"]]
+    assert search["jobs"][0]["search_score"] > search["jobs"][1]["search_score"]
+
+
+@pytest.mark.parametrize("filters", [
+    {},
+    {"work_type": "remote"},
+    {"work_type": "remote", "experience_level": "entry level"},
+])
+def test_cursor_pages_walk_the_filtered_corpus(api, fake_client, filters):
+    jobs = generate_jobs(120)
+    fake_supabase.seed_job_cache(fake_client, jobs, jobs_per_file=40)
+    expected = sorted(
+        (job for job in jobs if all(job[field].lower() == value for field, value in filters.items())),
+        key=lambda job: job["date"], reverse=True,
+    )
+
+    seen, cursor = [], None
+    while True:
+        params = dict(filters, limit=5)
+        if cursor:
+            params["cursor"] = cursor
+        page = api.get("/jobs", params=params).json()
+        assert page["total_jobs"] == len(expected)
+        seen.extend(job["url"] for job in page["jobs"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(expected) > 10
+    assert seen == [job["url"] for job in expected]
+    skipped = api.get("/jobs", params=dict(filters, limit=5, skip=5)).json()
+    assert [job["url"] for job in skipped["jobs"]] == seen[5:10]
+
+
+def test_invalid_cursor_is_rejected(api, fake_client):
+    fake_supabase.seed_job_cache(fake_client, generate_jobs(5))
+
+    assert api.get("/jobs", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+def test_oversized_limits_are_clamped(api, fake_client):
+    fake_supabase.seed_job_cache(fake_client, generate_jobs(150))
+
+    clamped = api.get("/jobs", params={"limit": 500})
+    empty = api.get("/jobs", params={"limit": 0})
+
+    assert clamped.status_code == 200
+    assert clamped.json()["limit"] == 100 and clamped.json()["returned_jobs"] == 100
+    assert empty.status_code == 200 and empty.json()["jobs"] == []
@@ -0,0 +1,45 @@
+import pytest
+
+from app.db.job_store import JobStore, job_skill_list
+from app.services.matcher import calculate_skill_similarity, rank_jobs
+
+JOB_SKILLS = [
+    "Python, SQL, Kubernetes",
+    "node.js, React, Docker",
+    "Snowflake, dbt, Python",
+    "Terraform, AWS, K8s",
+    "Pandas, NumPy, Airflow",
+    "Postgres, Snowflake",
+    "No skills found",
+]
+
+
+def _reference_scores(jobs, skills):
+    """Match scores from the plain per-skill loop the bitset path replaces."""
+    scores = {}
+    for job in jobs:
+        total, matched = 0.0, 0
+        for user_skill in skills:
+            best = max((calculate_skill_similarity(user_skill, s) for s in job_skill_list(job)), default=0.0)
+            if best > 0:
+                total += best
+                matched += 1
+        if matched:
+            scores[job["url"]] = (round(total / len(skills) * 100, 2), matched)
+    return scores
+
+
+@pytest.mark.parametrize("skills", [
+    ["Python", "k8s"],
+    ["nodejs", "docker", "python"],
+    ["pythn", "kubernets", "Snowflak"],
+    ["Python", "Python", "dbt"],
+    ["terraformm", "postgresql", "Airflow", "numpy"],
+])
+def test_bitset_scores_match_per_skill_scoring(make_job, skills):
+    jobs = [make_job(i, skills=value) for i, value in enumerate(JOB_SKILLS)]
+
+    ranked = rank_jobs(JobStore(jobs, "v1"), skills, top_n=len(jobs))
+
+    assert {job["url"]: (job["match_score"], job["matched_skills_count"]) for job in ranked} == \
+        _reference_scores(jobs, skills)
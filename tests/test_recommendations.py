@@ -0,0 +1,42 @@
+from benchmarks import fake_supabase
+from app.services.skill_extractor import extract_skills
+from benchmarks.synthetic import generate_jobs, generate_resume_pdf, generate_resume_text
+
+
+def _upload(api, path, **params):
+    pdf = generate_resume_pdf(seed=3)
+    return api.post(path, params=params, files={"file": ("resume.pdf", pdf, "application/pdf")})
+
+
+def test_upload_resume_returns_recommendations(api, fake_client):
+    fake_supabase.seed_job_cache(fake_client, generate_jobs(200))
+
+    response = _upload(api, "/upload-resume")
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["skills"]
+    assert body["recommendations_count"] == len(body["recommendations"]) > 0
+
+
+def test_get_recommendations_honours_top_n(api, fake_client):
+    fake_supabase.seed_job_cache(fake_client, generate_jobs(200))
+
+    response = _upload(api, "/get-recommendations", top_n=3)
+
+    assert response.status_code == 200, response.text
+    assert response.json()["recommendations_count"] == 3
+
+
+def test_resume_recommendations_use_freshness_window(api, fake_client, make_job):
+    skills = ", ".join(extract_skills("\n".join(generate_resume_text(seed=3)), top_n=5))
+    fresh = [make_job(i, hours_ago=2, skills=skills) for i in range(3)]
+    stale = [make_job(i, hours_ago=100, skills=skills) for i in range(3, 6)]
+    fake_supabase.seed_job_cache(fake_client, fresh + stale)
+
+    windowed = _upload(api, "/get-recommendations", top_n=10, max_age_hours=24)
+    unlimited = _upload(api, "/get-recommendations", top_n=10, max_age_hours=0)
+
+    assert windowed.status_code == unlimited.status_code == 200
+    assert {job["url"] for job in windowed.json()["recommendations"]} == {job["url"] for job in fresh}
+    assert unlimited.json()["recommendations_count"] == 6
@@ -0,0 +1,64 @@
+from app.services import recommender
+from benchmarks import fake_supabase
+from benchmarks.synthetic import generate_jobs
+
+
+def test_jobs_etag_answers_304_until_the_corpus_changes(api, fake_client, make_job):
+    fake_supabase.seed_job_cache(fake_client, generate_jobs(50))
+    first = api.get("/jobs", params={"limit": 5})
+    etag = first.headers["etag"]
+
+    assert first.status_code == 200
+    repeat = api.get("/jobs", params={"limit": 5}, headers={"If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+    assert repeat.headers["etag"] == etag
+
+    other_page = api.get("/jobs", params={"limit": 6}, headers={"If-None-Match": etag})
+    assert other_page.status_code == 200
+
+    from app.db.supabase_db import save_jobs
+    save_jobs([make_job(1, hours_ago=0.5)], "Software Engineer", "Berlin")
+    changed = api.get("/jobs", params={"limit": 5}, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["jobs"][0]["url"] == make_job(1)["url"]
+
+
+def test_jobs_are_gzipped_for_clients_that_accept_it(api, fake_client):
+    fake_supabase.seed_job_cache(fake_client, generate_jobs(50))
+    plain = api.get("/jobs", params={"limit": 20}, headers={"Accept-Encoding": "identity"})
+
+    response = api.get("/jobs", params={"limit": 20}, headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.headers["etag"] != plain.headers["etag"]
+    assert response.json() == plain.json()
+    assert int(response.headers["content-length"]) < len(plain.content)
+
+
+def test_recommend_by_skills_is_conditional(api, fake_client):
+    fake_supabase.seed_job_cache(fake_client, generate_jobs(50))
+    body = {"skills": ["Python", "SQL"], "top_n": 3}
+    first = api.post("/recommend-by-skills", json=body)
+
+    assert first.status_code == 200
+    assert api.post("/recommend-by-skills", json=body, headers={"If-None-Match": first.headers["etag"]}).status_code == 304
+    other = api.post("/recommend-by-skills", json=dict(body, skills=["Docker"]), headers={"If-None-Match": first.headers["etag"]})
+    assert other.status_code == 200
+
+
+def test_recommend_by_skills_shares_entries_across_spellings(api, fake_client, monkeypatch):
+    fake_supabase.seed_job_cache(fake_client, generate_jobs(50))
+    builds = []
+    build = recommender.get_job_recommendations
+    monkeypatch.setattr(recommender, "get_job_recommendations", lambda *args, **kwargs: builds.append(1) or build(*args, **kwargs))
+    first = api.post("/recommend-by-skills", json={"skills": ["Python", "k8s", "sql"], "top_n": 3})
+
+    same = api.post("/recommend-by-skills", json={"skills": ["SQL", "kubernetes", " python"], "top_n": 3},
+                    headers={"If-None-Match": first.headers["etag"]})
+
+    assert same.status_code == 304
+    assert first.json()["input_skills"] == ["Kubernetes", "Python", "SQL"]
+    assert len(builds) == 1
@@ -0,0 +1,122 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.db import supabase_db
+from app.services import tasks
+from app.services.dedup import canonical_job_url
+from app.services.scrape_frontier import ScrapeFrontier, seed_frontier
+from benchmarks.synthetic import generate_jobs
+
+fakeredis = pytest.importorskip("fakeredis")
+
+POSITION, LOCATION = "Data Engineer", "Berlin"
+CACHE_FILE = "jobs/cache/jobs_data_engineer_berlin.json"
+
+
+@pytest.fixture
+def frontier():
+    return ScrapeFrontier(fakeredis.FakeRedis(), namespace="test_frontier")
+
+
+def _cached_keys(client):
+    data = json.loads(client.storage.backend.get(supabase_db.JOBS_BUCKET, CACHE_FILE))
+    return {canonical_job_url(job["url"]) for job in data["jobs"]}
+
+
+def test_frontier_scrape_batches_add_to_the_cache_file(fake_client, linkedin, frontier, monkeypatch):
+    older = generate_jobs(3, seed=9, start=datetime.now() - timedelta(days=1))
+    for i, job in enumerate(older):
+        job["url"] = f"https://www.linkedin.com/jobs/view/{3000000000 + i}"
+    supabase_db.save_jobs(older, POSITION, LOCATION)
+    monkeypatch.setattr(tasks, "ScrapeFrontier", lambda: frontier)
+    monkeypatch.setattr(tasks, "FRONTIER_SAVE_BATCH", 4)
+    seed_frontier(frontier, [(POSITION, LOCATION)], facets="none")
+
+    result = tasks.frontier_scrape(max_seconds=60, idle_seconds=0.05)
+
+    assert result["saved"] == 30
+    assert _cached_keys(fake_client) == {canonical_job_url(job["url"]) for job in linkedin + older}
+
+
+def test_detail_pages_share_the_search_host_bucket(fake_client, linkedin, frontier, monkeypatch):
+    hosts = []
+    monkeypatch.setattr(frontier, "wait_for_token", lambda host, *args: hosts.append(host) or 0.0)
+    worker = tasks.FrontierWorker(frontier)
+    seed_frontier(frontier, [(POSITION, LOCATION)], facets="none")
+
+    worker.run(idle_seconds=0.05)
+
+    # Four search pages (the last one empty) and 30 detail pages
+    assert len(hosts) == 4 + 30
+    assert set(hosts) == {"www.linkedin.com"}
+
+
+def test_detail_items_are_seen_by_canonical_url(frontier):
+    card_url = "https://www.linkedin.com/jobs/view/data-engineer-at-acme-4000000001"
+    item = {"kind": "detail", "url": card_url, "key": canonical_job_url(card_url)}
+    tracked = dict(item, url=card_url + "?refId=abc&trackingId=xyz")
+
+    assert frontier.push([item]) == 1
+    assert frontier.push([tracked]) == 0
+    (_, leased), = frontier.pop(5)
+    assert leased["url"] == card_url
+
+
+def test_search_pages_are_leased_before_detail_pages(frontier):
+    frontier.push([{"kind": "detail", "url": "https://www.linkedin.com/jobs/view/1"}])
+    frontier.push([{"kind": "search", "url": "https://www.linkedin.com/search?start=0"}])
+
+    kinds = [item["kind"] for _, item in frontier.pop(2)]
+
+    assert kinds == ["search", "detail"]
+
+
+def test_expired_leases_are_requeued(frontier):
+    frontier.push([{"kind": "search", "url": "https://www.linkedin.com/search?start=0"}])
+    (token, _), = frontier.pop(1, lease_seconds=-1)
+
+    assert frontier.stats()["queued"] == 0
+    (again, _), = frontier.pop(1)
+    assert again == token
+    frontier.ack(again)
+    assert frontier.stats() == {"queued": 0, "inflight": 0, "seen": 1}
+
+
+def test_token_bucket_is_shared_by_workers(frontier):
+    other = ScrapeFrontier(frontier.redis, namespace=frontier.namespace)
+
+    assert frontier.acquire("www.linkedin.com", rate=1.0, burst=2) == 0.0
+    assert other.acquire("www.linkedin.com", rate=1.0, burst=2) == 0.0
+    assert other.acquire("www.linkedin.com", rate=1.0, burst=2) > 0.0
+    assert frontier.acquire("in.linkedin.com", rate=1.0, burst=2) == 0.0
+
+
+def test_unsaved_jobs_go_back_to_the_frontier(fake_client, linkedin, frontier, monkeypatch):
+    monkeypatch.setattr(tasks, "ScrapeFrontier", lambda: frontier)
+    monkeypatch.setattr(tasks, "merge_jobs", lambda jobs, position, location: False)
+    seed_frontier(frontier, [(POSITION, LOCATION)], facets="none")
+
+    failed = tasks.frontier_scrape(max_seconds=60, idle_seconds=0.05)
+
+    # The detail pages are still in the seen-set, but queued again rather than lost
+    assert failed["saved"] == 0
+    assert frontier.stats()["queued"] == 30 and frontier.stats()["inflight"] == 0
+    monkeypatch.setattr(tasks, "merge_jobs", supabase_db.merge_jobs)
+    retried = tasks.frontier_scrape(max_seconds=60, idle_seconds=0.05)
+    assert retried["saved"] == 30
+    assert _cached_keys(fake_client) == {canonical_job_url(job["url"]) for job in linkedin}
+
+
+def test_unsaved_detail_pages_stay_leased(fake_client, linkedin, frontier):
+    worker = tasks.FrontierWorker(frontier)
+    seed_frontier(frontier, [(POSITION, LOCATION)], facets="none")
+
+    worker.run(idle_seconds=0.05)
+
+    # A worker that dies now leaves its pages to be requeued when the leases expire
+    assert frontier.stats() == {"queued": 0, "inflight": 30, "seen": 34}
+    assert frontier.pop(1) == []
+    worker.saved(POSITION, LOCATION)
+    assert frontier.stats()["inflight"] == 0
@@ -0,0 +1,100 @@
+import json
+from datetime import datetime, timedelta
+
+from app.core.config import settings
+from app.db import supabase_db
+from app.services import linkedin_scraper_simple as scraper
+from app.services.dedup import canonical_job_url
+from benchmarks.replay_server import start_replay_server
+from benchmarks.synthetic import generate_jobs
+
+POSITION, LOCATION = "Data Engineer", "Berlin"
+CACHE_FILE = "jobs/cache/jobs_data_engineer_berlin.json"
+
+
+def _cached_keys(client):
+    data = json.loads(client.storage.backend.get(supabase_db.JOBS_BUCKET, CACHE_FILE))
+    return [canonical_job_url(job["url"]) for job in data["jobs"]]
+
+
+def test_incremental_scrape_merges_into_cached_jobs(fake_client, linkedin):
+    older = linkedin[10:]
+    supabase_db.save_jobs(older, POSITION, LOCATION)
+
+    jobs = scraper.scrape_linkedin_jobs(POSITION, LOCATION, max_results=50, facets="none")
+
+    assert [canonical_job_url(job["url"]) for job in jobs] == [canonical_job_url(job["url"]) for job in linkedin[:10]]
+    assert _cached_keys(fake_client) == [canonical_job_url(job["url"]) for job in linkedin]
+
+
+def test_scrape_with_nothing_new_leaves_cache_file(fake_client, linkedin):
+    supabase_db.save_jobs(linkedin, POSITION, LOCATION)
+    before = fake_client.storage.backend.get(supabase_db.JOBS_BUCKET, CACHE_FILE)
+
+    jobs = scraper.scrape_linkedin_jobs(POSITION, LOCATION, max_results=50, facets="none")
+
+    assert jobs == []
+    assert fake_client.storage.backend.get(supabase_db.JOBS_BUCKET, CACHE_FILE) == before
+
+
+def test_merge_jobs_replaces_older_copies(fake_client):
+    old = generate_jobs(5, start=datetime.now() - timedelta(days=1))
+    supabase_db.save_jobs(old, POSITION, LOCATION)
+    updated = dict(old[2], title="Updated title")
+
+    assert supabase_db.merge_jobs([updated], POSITION, LOCATION)
+
+    data = json.loads(fake_client.storage.backend.get(supabase_db.JOBS_BUCKET, CACHE_FILE))
+    assert len(data["jobs"]) == 5
+    assert data["jobs"][0]["title"] == "Updated title"
+
+
+def test_merge_jobs_drops_jobs_past_the_archive_age(fake_client):
+    recent = generate_jobs(3, start=datetime.now() - timedelta(days=1))
+    expired = generate_jobs(2, seed=2, start=datetime.now() - timedelta(days=supabase_db.ARCHIVE_AGE_DAYS + 1))
+    for i, job in enumerate(expired):
+        job["url"] = f"https://www.linkedin.com/jobs/view/{4100000000 + i}"
+    supabase_db.save_jobs(recent + expired, POSITION, LOCATION)
+    new = dict(generate_jobs(1, seed=3)[0], url="https://www.linkedin.com/jobs/view/4200000000",
+               date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+
+    assert supabase_db.merge_jobs([new], POSITION, LOCATION)
+
+    assert _cached_keys(fake_client) == [canonical_job_url(job["url"]) for job in [new] + recent]
+
+
+def test_scraped_jobs_are_found_by_work_type_and_experience_filters(api, fake_client, linkedin):
+    jobs = scraper.scrape_linkedin_jobs(POSITION, LOCATION, max_results=12)
+    scraped = {canonical_job_url(job["url"]): job for job in jobs}
+    source = {canonical_job_url(job["url"]): job for job in linkedin}
+
+    assert scraped and all(job["work_type"] and job["experience_level"] for job in jobs)
+    for key, job in scraped.items():
+        assert (job["work_type"], job["experience_level"]) == (source[key]["work_type"], source[key]["experience_level"])
+    job = jobs[0]
+    listed = api.get("/jobs", params={"limit": 100, "work_type": job["work_type"],
+                                      "experience_level": job["experience_level"]}).json()
+    assert job["url"] in {listed_job["url"] for listed_job in listed["jobs"]}
+    exported = api.get("/jobs/export", params={"work_type": job["work_type"]})
+    assert job["url"] in exported.text
+
+
+def test_cached_pages_skip_the_politeness_throttle(fake_client, linkedin, tmp_path, monkeypatch):
+    server = start_replay_server(str(tmp_path), max_age=3600)
+    monkeypatch.setattr(settings, "SCRAPER_BASE_URL", server.url)
+    monkeypatch.setattr(settings, "SCRAPER_HTTP_CACHE_MAX_MB", 1)
+    monkeypatch.setattr(settings, "SCRAPER_HTTP_CACHE_PATH", str(tmp_path / "http_cache.sqlite"))
+    monkeypatch.setattr(scraper, "_http_cache", None)
+    throttles = []
+    monkeypatch.setattr(scraper, "_throttle", lambda low, high: throttles.append((low, high)))
+
+    first = scraper.scrape_linkedin_jobs(POSITION, LOCATION, max_results=15, facets="none", known_urls=set())
+    served = dict(server.stats)
+    throttled = len(throttles)
+    again = scraper.scrape_linkedin_jobs(POSITION, LOCATION, max_results=15, facets="none", known_urls=set())
+    server.shutdown()
+
+    assert len(again) == len(first) == 15
+    # One throttle per detail page plus one for the second search page
+    assert throttled == 16
+    assert len(throttles) == throttled and dict(server.stats) == served
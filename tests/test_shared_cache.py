@@ -0,0 +1,77 @@
+import threading
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.db import job_store
+from app.services import shared_cache
+from app.services.matcher import match_jobs
+from benchmarks import fake_supabase
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    client = fakeredis.FakeRedis()
+    monkeypatch.setattr(settings, "SHARED_CACHE_ENABLED", True)
+    monkeypatch.setattr(shared_cache, "_client", client)
+    monkeypatch.setattr(shared_cache, "_down_until", 0.0)
+    return client
+
+
+def test_concurrent_misses_compute_once(redis):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"jobs": 3}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(shared_cache.get_or_compute("corpus", "k", 60, compute)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"jobs": 3}] * 5
+    assert not redis.exists("k:lock")
+
+
+def test_leader_does_not_release_a_lock_it_lost(redis):
+    def slow_compute():
+        # The leader overran LOCK_SECONDS: its lock expired and another replica took it
+        redis.set("k:lock", b"other-replica", ex=60)
+        return "value"
+
+    assert shared_cache.get_or_compute("corpus", "k", 60, slow_compute) == "value"
+
+    assert redis.get("k:lock") == b"other-replica"
+
+
+def test_recommendation_key_ignores_order_and_aliases():
+    key = shared_cache.recommendation_key("v1", ["Python", "k8s"], 5)
+
+    assert shared_cache.recommendation_key("v1", ["kubernetes", "python"], 5) == key
+    assert shared_cache.recommendation_key("v1", ["python", "kubernetes"], 5, generation=1) != key
+    assert shared_cache.recommendation_key("v1", ["python", "python", "kubernetes"], 5) != key
+
+
+def test_recommendations_follow_jobs_ingested_in_process(redis, fake_client, make_job):
+    fake_supabase.seed_job_cache(fake_client, [make_job(i, skills="SQL") for i in range(3)])
+    store = job_store.get_job_store(force_refresh=True)
+
+    before = match_jobs(["Python", "SQL"], top_n=3)
+    store.add_jobs([make_job(99, skills="Python, SQL")])
+    after = match_jobs(["Python", "SQL"], top_n=3)
+
+    assert store.version == job_store.get_job_store().version
+    assert make_job(99)["url"] not in {job["url"] for job in before}
+    assert after[0]["url"] == make_job(99)["url"]
+    assert match_jobs(["sql", "python"], top_n=3) == after
@@ -0,0 +1,96 @@
+import os
+import threading
+
+import pytest
+
+from app.core.config import settings
+from app.db import shared_index, supabase_db
+from app.db.job_store import JobStore, freshness_cutoff
+from app.db.shared_index import MappedJobStore, get_mapped_store, publish_job_index, read_header, write_index
+from app.services import shared_cache
+from benchmarks import fake_supabase
+from benchmarks.synthetic import generate_jobs
+
+
+@pytest.fixture
+def index_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "job_index.bin")
+    monkeypatch.setattr(settings, "JOB_INDEX_PATH", path)
+    monkeypatch.setattr(settings, "JOB_INDEX_CHECK_SECONDS", 0.0)
+    monkeypatch.setattr(shared_index, "_mapped", None)
+    return path
+
+
+def _walk(store, **filters):
+    """Every page of `store` for the filters, as (urls per page, total count)."""
+    pages, cursor = [], None
+    while True:
+        jobs, cursor = store.page(limit=7, cursor=cursor, filters=filters)
+        pages.append([job["url"] for job in jobs])
+        if cursor is None:
+            return pages, store.count(filters)
+
+
+def test_mapped_store_matches_job_store(index_path, make_job):
+    jobs = [make_job(i, hours_ago=i * 3, title=f"Kafka Engineer {i}" if i % 4 == 0 else f"Engineer {i}",
+                     work_type=["Remote", "Hybrid", "On-site"][i % 3]) for i in range(40)]
+    store = JobStore(jobs + generate_jobs(60), "v1")
+    write_index(store, index_path)
+    mapped = MappedJobStore(index_path)
+
+    assert len(mapped) == len(store) and mapped.version == "v1"
+    for filters in ({}, {"work_type": "Remote"}, {"work_type": "remote", "experience_level": "Entry level"}):
+        assert _walk(mapped, **filters) == _walk(store, **filters)
+    since = freshness_cutoff(24)
+    assert mapped.page(limit=50, since=since)[0] == store.page(limit=50, since=since)[0]
+    assert mapped.count(since=since) == store.count(since=since)
+    assert [job["url"] for job in mapped.search("kafka", limit=20)] == [job["url"] for job in store.search("kafka", limit=20)]
+
+
+def test_republish_swaps_the_file_and_remaps(index_path):
+    write_index(JobStore(generate_jobs(30), "v1"), index_path)
+    first = get_mapped_store()
+
+    write_index(JobStore(generate_jobs(45, seed=2), "v2"), index_path)
+    second = get_mapped_store()
+
+    assert (first.version, len(first)) == ("v1", 30)
+    assert (second.version, len(second)) == ("v2", 45)
+    # Requests holding the old mapping keep reading the replaced file
+    assert len(first.page(limit=50)[0]) == 30
+    assert os.listdir(os.path.dirname(index_path)) == ["job_index.bin"]
+
+
+def test_failed_write_keeps_the_published_index(index_path, monkeypatch):
+    write_index(JobStore(generate_jobs(30), "v1"), index_path)
+
+    def fail(src, dst):
+        raise OSError("disk full")
+    monkeypatch.setattr(shared_index.os, "replace", fail)
+    with pytest.raises(OSError):
+        write_index(JobStore(generate_jobs(45, seed=2), "v2"), index_path)
+
+    assert read_header(index_path)["version"] == "v1"
+    assert os.listdir(os.path.dirname(index_path)) == ["job_index.bin"]
+
+
+def test_publish_only_on_new_corpus_versions(fake_client, index_path, make_job):
+    fake_supabase.seed_job_cache(fake_client, generate_jobs(20))
+
+    assert publish_job_index()
+    assert not publish_job_index()
+    supabase_db.save_jobs([make_job(1)], "Software Engineer", "Berlin")
+    assert publish_job_index()
+    assert len(get_mapped_store()) == 21
+
+
+def test_publisher_republishes_on_invalidation(index_path, monkeypatch):
+    listeners, published = [], threading.Event()
+    monkeypatch.setattr(shared_cache, "start_invalidation_listener", listeners.append)
+    monkeypatch.setattr(shared_index, "publish_job_index", lambda path: published.set())
+
+    shared_index.start_index_publisher(interval=3600, path=index_path)
+    assert not published.wait(0.1)
+    listeners[0]({"type": "corpus"})
+
+    assert published.wait(5)
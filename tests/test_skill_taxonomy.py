@@ -0,0 +1,43 @@
+import pytest
+
+from app.services.skill_taxonomy import (
+    canonical_skill_ids,
+    canonicalize,
+    display_name,
+    skill_id,
+    skill_name,
+    vocabulary,
+)
+
+
+@pytest.mark.parametrize("alias, canonical", [
+    ("k8s", "kubernetes"),
+    ("K8S ", "kubernetes"),
+    ("nodejs", "node.js"),
+    ("Node.JS", "node.js"),
+    ("node", "node.js"),
+    ("Postgres", "postgresql"),
+    ("C#", "c#"),
+])
+def test_aliases_resolve_to_one_canonical_skill(alias, canonical):
+    assert canonicalize(alias) == canonical
+    assert skill_id(alias) == skill_id(canonical)
+
+
+def test_unknown_skills_have_no_id():
+    assert canonicalize("Snowflake") is None
+    assert skill_id("kubernets") is None
+    assert display_name("dbt") == "DBT"
+
+
+def test_ids_round_trip_through_names():
+    for sid, name in enumerate(vocabulary()):
+        assert skill_id(name) == sid
+        assert skill_name(sid) == name
+        assert canonicalize(display_name(name)) == name
+
+
+def test_canonical_skill_ids_are_distinct_in_input_order():
+    assert canonical_skill_ids(["k8s", "Python", "kubernetes", "Snowflake", "python"]) == [
+        skill_id("kubernetes"), skill_id("python"),
+    ]
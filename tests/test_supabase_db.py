@@ -0,0 +1,32 @@
+from app.db import supabase_db
+from benchmarks import fake_supabase
+from benchmarks.synthetic import generate_jobs
+
+
+def test_save_jobs_bumps_the_manifest_version(fake_client):
+    before = supabase_db.get_corpus_version()
+
+    supabase_db.save_jobs(generate_jobs(3), "Data Engineer", "Berlin")
+    after = supabase_db.get_corpus_version()
+
+    assert after.startswith("m-") and after != before
+    supabase_db.save_jobs(generate_jobs(3), "Data Engineer", "Berlin")
+    assert supabase_db.get_corpus_version() != after
+
+
+def test_reload_downloads_only_changed_files(fake_client, monkeypatch):
+    fake_supabase.seed_job_cache(fake_client, generate_jobs(100), jobs_per_file=25)
+    assert len(supabase_db.get_cached_jobs()) == 100
+    downloads = []
+    download = fake_supabase.FakeBucket.download
+    monkeypatch.setattr(fake_supabase.FakeBucket, "download",
+                        lambda self, path: downloads.append(path) or download(self, path))
+
+    # generate_jobs numbers URLs from the same base: these replace five seeded postings
+    newer = generate_jobs(5, seed=2)
+    supabase_db.save_jobs(newer, "Data Engineer", "Berlin")
+    jobs = supabase_db.get_cached_jobs()
+
+    assert downloads == ["jobs/cache/jobs_data_engineer_berlin.json"]
+    assert len(jobs) == 100
+    assert jobs[:5] == newer